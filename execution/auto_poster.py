@@ -5,14 +5,30 @@ import re
 import datetime
 import time
 import json
-import feedparser
-import yfinance as yf
 import requests
-import urllib.parse
 import math
 import random
+import argparse
+import asyncio
+import hashlib
 from dotenv import load_dotenv
 import typing_extensions as typing
+from market_session import MarketDataSession
+from volatility_scorer import score_panel
+import universe_scan
+import news_store
+import news_index
+import svg_chart
+import json_stream
+import llm_cache
+import model_router
+import post_catalog
+import post_template
+from model_router import ModelRouter
+from rate_limit import TokenBucket
+from concurrent.futures import ThreadPoolExecutor
+from run_state import RunState
+import cassette
 
 # 1. Load environment variables
 load_dotenv()
@@ -22,9 +38,7 @@ api_key = os.getenv("GEMINI_API_KEY")
 
 if api_key:
     genai.configure(api_key=api_key.strip())
-else:
-    print("[CRITICAL] Error: GEMINI_API_KEY not found in environment variables.")
-    sys.exit(1)
+# 키가 없을 때의 종료 처리는 main()에서 — 인자를 파싱한 뒤에야 --replay 여부를 알 수 있음
 
 # ===================================================================
 # [변경] 2026년 현재 무료 AI Studio 최고 안정화 모델 지정
@@ -44,10 +58,16 @@ TICKERS = [
     "BTC-USD", "ETH-USD", "SCHD", "JEPI", "VIST", "GEV"
 ]
 
+# Yahoo 헤드라인 피드는 심볼 수가 많으면 결과가 희석되므로 10개씩 나눠 전체 풀을 커버
+YAHOO_FEED_CHUNK = 10
 RSS_URLS = [
-    "https://feeds.finance.yahoo.com/rss/2.0/headline?s=" + ",".join(TICKERS[:10]) + "&region=US&lang=en-US",
+    "https://feeds.finance.yahoo.com/rss/2.0/headline?s=" + ",".join(TICKERS[i:i + YAHOO_FEED_CHUNK]) + "&region=US&lang=en-US"
+    for i in range(0, len(TICKERS), YAHOO_FEED_CHUNK)
+] + [
     "https://www.investing.com/rss/news_25.rss"
 ]
+# 프롬프트에 넣는 종목 관련 헤드라인 수 (부족하면 일반 시장 뉴스로 채움)
+TICKER_HEADLINES = 6
 
 COOLDOWN_DAYS = 7
 
@@ -69,34 +89,20 @@ def get_abs_path(relative_path):
     return os.path.normpath(os.path.join(BASE_DIR, relative_path))
 
 
+def _catalog_recent_tickers(since):
+    with post_catalog.connect() as db:
+        return post_catalog.recent_tickers(db, since)
+
+
 def get_recently_posted_tickers(cooldown_days=COOLDOWN_DAYS):
-    cutoff = datetime.datetime.now() - datetime.timedelta(days=cooldown_days)
-    recent = set()
-    
-    paths = [get_abs_path("posts.json"), get_abs_path("ko/posts.json"), get_abs_path("pt/posts.json")]
-    for posts_path in paths:
-        if not os.path.exists(posts_path):
-            continue
-        try:
-            with open(posts_path, "r", encoding="utf-8") as f:
-                posts = json.load(f)
-            for p in posts:
-                try:
-                    post_date = datetime.datetime.strptime(p.get("date", ""), "%Y-%m-%d")
-                except ValueError:
-                    continue
-                if post_date >= cutoff:
-                    fname = os.path.basename(p.get("link", ""))
-                    if re.match(r'\d{4}-\d{2}-\d{2}-', fname):
-                        ticker = os.path.splitext(fname)[0].split("-", 3)[-1]
-                        recent.add(ticker)
-        except Exception:
-            continue
-    return recent
+    since = (cassette.now() - datetime.timedelta(days=cooldown_days)).strftime("%Y-%m-%d")
+    # 카탈로그는 이전 실행(녹화 실행 포함)이 쓴 글을 담으므로 외부 입력으로 취급해 녹화/재생
+    return cassette.call("catalog", f"recent_tickers:{since}", lambda: _catalog_recent_tickers(since))
 
 
-def get_top_volatile_tickers(tickers, count=3):
+def get_top_volatile_tickers(tickers, count=3, session=None):
     print("[*] Volatility Hunter activated...")
+    session = session or MarketDataSession()
     recently_posted = get_recently_posted_tickers(COOLDOWN_DAYS)
     if recently_posted:
         print(f"  [skip] On cooldown ({COOLDOWN_DAYS}d): {', '.join(sorted(recently_posted))}")
@@ -115,39 +121,20 @@ def get_top_volatile_tickers(tickers, count=3):
     volatility_data = []
     
     try:
-        # 단일 종목 다운로드와 다중 종목 다운로드 시 인덱싱 에러 완벽 대처
-        all_data = yf.download(eligible, period="5d", interval="1d", progress=False)
+        # 후보 전체의 3개월 패널을 한 번만 준비 — 이후 가격/차트 조회는 모두 패널에서
+        session.prefetch(eligible)
         
-        for ticker in eligible:
-            try:
-                # 데이터 프레임 차원 수에 따른 멀티인덱스 여부 방어 코드
-                import pandas as pd
-                if isinstance(all_data['Close'], pd.DataFrame) and ticker in all_data['Close'].columns:
-                    close_prices = all_data['Close'][ticker].dropna()
-                else:
-                    close_prices = all_data['Close'].dropna()
-                
-                if len(close_prices) < 2:
-                    continue
-                    
-                last_close = float(close_prices.iloc[-1])
-                prev_close = float(close_prices.iloc[-2])
-                
-                if math.isnan(last_close) or math.isnan(prev_close) or prev_close == 0:
-                    continue
-                    
-                change = (last_close - prev_close) / prev_close
-                abs_change = abs(change) * 100
-    
-                volatility_data.append({
-                    "ticker":     ticker,
-                    "change":     change * 100,
-                    "abs_change": abs_change,
-                    "price":      last_close,
-                })
-            except Exception as e:
-                print(f"  [warn] Error scoring {ticker}: {e}")
-                continue
+        # 패널 전체를 한 번에 벡터 연산으로 채점 (1일 변동, 5일 실현변동성, ATR, 갭, 거래량 z)
+        ranked = score_panel(session.panel)
+        for ticker, row in ranked.head(5).iterrows():
+            print(f"  [score] {ticker:<8} {row['score']:.2f} | 1d {row['change']:+.2f}% | "
+                  f"RV5 {row['rv_5d']:.0f}% | ATR {row['atr_pct']:.1f}% | "
+                  f"gap {row['gap']:+.2f}% | volZ {row['volume_z']:+.1f}")
+        volatility_data = [
+            {"ticker": ticker, "change": float(row["change"]), "abs_change": float(row["abs_change"]),
+             "price": float(row["price"]), "score": float(row["score"])}
+            for ticker, row in ranked.iterrows()
+        ]
     except Exception as e:
         print(f"  [error] Batch download failed: {e}")
 
@@ -155,89 +142,141 @@ def get_top_volatile_tickers(tickers, count=3):
     if not volatility_data:
         print("[!] Warning: Applying fallback from dividend_insights.json...")
         try:
-            # 부모 디렉토리 이동 경로 정정
-            insights_path = os.path.normpath(os.path.join(BASE_DIR, "dividend_insights.json"))
-            if os.path.exists(insights_path):
-                with open(insights_path, "r", encoding="utf-8") as f:
-                    insights = json.load(f)
-                stocks_list = insights.get("stocks", [])
-                candidates = [s for s in stocks_list if s["ticker"] in eligible]
-                if len(candidates) < count:
-                    candidates = [s for s in stocks_list if s["ticker"] in TICKERS]
-                    
-                random.seed(datetime.datetime.now().year + datetime.datetime.now().month + datetime.datetime.now().day)
+            # dividend_insights.json은 세션에서 한 번만 읽고 티커 해시 인덱스로 조회
+            candidates = [s for s in map(session.insight, eligible) if s]
+            if len(candidates) < count:
+                candidates = [s for s in map(session.insight, TICKERS) if s]
+            if candidates:
+                random.seed(cassette.now().year + cassette.now().month + cassette.now().day)
                 random.shuffle(candidates)
                 
                 for s in candidates[:count]:
                     volatility_data.append({
-                        "ticker": s["ticker"], "change": 0.0, "abs_change": 0.0, "price": float(s["current_price"])
+                        "ticker": s["ticker"], "change": 0.0, "abs_change": 0.0, "price": float(s["current_price"]), "score": 0.0
                     })
         except Exception as ex:
             print(f"  [error] Fallback failed: {ex}")
             
         if not volatility_data:
-            random.seed(datetime.datetime.now().year + datetime.datetime.now().month + datetime.datetime.now().day)
+            random.seed(cassette.now().year + cassette.now().month + cassette.now().day)
             fallback_eligible = list(eligible)
             random.shuffle(fallback_eligible)
             for t in fallback_eligible[:count]:
-                volatility_data.append({"ticker": t, "change": 0.0, "abs_change": 0.0, "price": 100.0})
+                volatility_data.append({"ticker": t, "change": 0.0, "abs_change": 0.0, "price": 100.0, "score": 0.0})
 
-    top_volatile = sorted(volatility_data, key=lambda x: x['abs_change'], reverse=True)[:count]
+    top_volatile = sorted(volatility_data, key=lambda x: x['score'], reverse=True)[:count]
     print(f"  [picked] {', '.join(s['ticker'] for s in top_volatile)}")
     return top_volatile
 
 
-def get_quickchart_url(ticker):
-    try:
-        hist = yf.Ticker(ticker).history(period="3mo")
-        prices = hist['Close'].tolist()
-        dates = [d.strftime('%m-%d') for d in hist.index]
-        
-        # 글자 수 제한 방어용 상한선 강화 (최대 12개 좌표로 요약)
-        step = max(1, len(prices) // 12)
-        prices = prices[::step]
-        dates = dates[::step]
-
-        chart_config = {
-            "type": "line",
-            "data": {
-                "labels": dates,
-                "datasets": [{
-                    "label": f"{ticker} Price (3Mo)",
-                    "data": [round(p, 2) for p in prices], # 데이터 규격 다이어트
-                    "fill": False, "borderColor": "rgb(99, 102, 241)", "tension": 0.4
-                }]
-            },
-            "options": {
-                "plugins": {
-                    "legend": {"display": False},
-                    "title": {"display": True, "text": f"{ticker} 3-Month Trend", "font": {"size": 20}}
-                }
-            }
-        }
-        encoded_config = urllib.parse.quote(json.dumps(chart_config))
-        return f"https://quickchart.io/chart?c={encoded_config}&width=600&height=300"
-    except:
-        return ""
+def get_top_volatile_from_universe(universe_path, count=3, session=None, chunk_size=universe_scan.CHUNK_SIZE):
+    """Universe mode: stream-scan a symbol file in chunks, keeping only a top-K heap."""
+    print(f"[*] Volatility Hunter (universe mode: {universe_path})...")
+    session = session or MarketDataSession()
+    symbols = universe_scan.load_universe(universe_path)
+    recently_posted = get_recently_posted_tickers(COOLDOWN_DAYS)
+    eligible = [t for t in symbols if t not in recently_posted]
+    print(f"  [universe] {len(eligible)} eligible of {len(symbols)} symbols, chunks of {chunk_size}")
+
+    finalists = universe_scan.scan_universe(eligible, top_k=max(count, universe_scan.TOP_K), chunk_size=chunk_size)
+    if not finalists:
+        print("  [warn] Universe scan produced nothing — falling back to TICKERS")
+        return get_top_volatile_tickers(TICKERS, count, session)
+
+    # 최종 후보만 세션 패널에 올려 차트/가격 조회에 재사용
+    session.prefetch([f["ticker"] for f in finalists])
+    top_volatile = [
+        {"ticker": f["ticker"], "change": float(f["change"]), "abs_change": float(f["abs_change"]),
+         "price": float(f["price"]), "score": float(f["score"])}
+        for f in finalists[:count]
+    ]
+    print(f"  [picked] {', '.join(s['ticker'] for s in top_volatile)}")
+    return top_volatile
 
 
-def get_latest_news():
-    news_items = []
-    for url in RSS_URLS:
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries[:3]:
-                news_items.append(f"- {entry.title}")
-        except: pass
-    return "\n".join(news_items)
+def get_chart_series(ticker, session):
+    """(dates, prices) for the 3-month post chart, or None if unavailable."""
+    try:
+        dates, prices = session.chart_series(ticker)
+        return (dates, prices) if len(prices) >= 2 else None
+    except Exception as e:
+        print(f"  [warn] Chart data unavailable for {ticker}: {e}")
+        return None
 
 
-def generate_multi_lang_content(stock_info, news_text):
+def get_latest_news():
+    """Refresh the news store and return it (feeds fetched concurrently)."""
+    # 모든 피드를 동시에 조건부 요청 — 변경 없는 피드는 304로 즉시 끝남
+    matcher = news_index.Matcher(news_index.load_aliases(get_abs_path("dividend_insights.json"), TICKERS))
+    try:
+        return news_store.refresh(RSS_URLS, matcher=matcher)
+    except Exception as e:
+        print(f"  [warn] News refresh failed, using stored items: {e}")
+        store = news_store.load()
+        news_index.update(store, matcher)
+        return store
+
+
+def get_news_for_ticker(store, ticker, limit=TICKER_HEADLINES):
+    """Recency-ranked headlines mentioning ticker, topped up with general market news."""
+    items = news_index.headlines_for(store, ticker, limit=limit)
+    print(f"  [news] {len(items)} headline(s) indexed for {ticker}")
+    if len(items) < limit:
+        titles = {i["title"] for i in items}
+        general = [i for i in news_store.latest(RSS_URLS, per_feed=1, store=store) if i["title"] not in titles]
+        items += general[:limit - len(items)]
+    return "\n".join(f"- {item['title']}" for item in items)
+
+
+LANGUAGES = ("en", "ko", "pt")
+MAX_RETRY_WAIT = 60    # 이보다 긴 429 대기 요청은 다음 모델로 넘어감
+GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "max_output_tokens": 8192
+}
+LANGUAGE_SPECS = {
+    "en": {
+        "name": "English (en) - Primary, professional, insightful",
+        "schema": '"en": {{ "title": "...", "content": "HTML body", "summary": "...", "keywords": "US stocks, {ticker}, dividend investing, stock analysis" }}',
+        "title": ('English title format: "[Compelling Topic about {ticker}] | US Stock Analysis · WiseAIWiseU"\n'
+                  '      Example: "Apple (AAPL) Earnings Preview: What US Stock Investors Must Know | US Stock Analysis · WiseAIWiseU"'),
+        "summary": 'English summary: Must contain "US stock" or "US stocks". 1-2 sentences, click-worthy.',
+    },
+    "ko": {
+        "name": "Korean (ko) - Full Korean translation",
+        "schema": '"ko": {{ "title": "...", "content": "HTML body", "summary": "...", "keywords": "미국 주식, {ticker}, 배당 투자, 주식 분석" }}',
+        "title": ('Korean title format: "[한국어 주제 ({ticker})] | 미국 주식 분석 · WiseAIWiseU"\n'
+                  '      Example: "애플(AAPL) 실적 프리뷰: 미국 주식 투자자가 알아야 할 것 | 미국 주식 분석 · WiseAIWiseU"'),
+        "summary": 'Korean summary: Must contain "미국 주식". 1-2 sentences in Korean.',
+    },
+    "pt": {
+        "name": "Portuguese (pt) - Full Portuguese translation",
+        "schema": '"pt": {{ "title": "...", "content": "HTML body", "summary": "...", "keywords": "ações dos EUA, {ticker}, dividendos, análise de ações" }}',
+        "title": ('Portuguese title format: "[Tópico em Português ({ticker})] | Análise de Ações dos EUA · WiseAIWiseU"\n'
+                  '      Example: "Prévia de Resultados da Apple (AAPL): O Que Investidores em Ações dos EUA Devem Saber | Análise de Ações dos EUA · WiseAIWiseU"'),
+        "summary": 'Portuguese summary: Must contain "ações dos EUA". 1-2 sentences in Portuguese.',
+    },
+}
+# 언어별 병렬 모드: Gemini 무료 티어 분당 한도를 넘지 않도록 공유 토큰 버킷
+GEMINI_RATE_PER_MINUTE = 10
+gemini_limiter = TokenBucket(GEMINI_RATE_PER_MINUTE / 60.0, 2)
+
+
+def _spec_lines(langs, key, ticker):
+    return "\n    ".join(f"- {LANGUAGE_SPECS[l][key].format(ticker=ticker)}" for l in langs)
+
+
+def _schema(langs, ticker):
+    return ",\n        ".join(LANGUAGE_SPECS[l]["schema"].format(ticker=ticker) for l in langs)
+
+
+def build_prompt(stock_info, news_text, langs=LANGUAGES):
     ticker = stock_info['ticker']
     price = stock_info['price']
     change = stock_info['change']
+    lang_list = "\n    ".join(f"{i}. {LANGUAGE_SPECS[l]['name']}" for i, l in enumerate(langs, 1))
 
-    prompt = f"""
+    return f"""
     You are a professional US stock market analyst writing for a global audience.
     Write a highly engaging, SEO-optimized blog post about {ticker}.
 
@@ -245,28 +284,17 @@ def generate_multi_lang_content(stock_info, news_text):
     Related Market News: {news_text}
 
     IMPORTANT SEO TITLE RULES:
-    - English title format: "[Compelling Topic about {ticker}] | US Stock Analysis · WiseAIWiseU"
-      Example: "Apple (AAPL) Earnings Preview: What US Stock Investors Must Know | US Stock Analysis · WiseAIWiseU"
-    - Korean title format: "[한국어 주제 ({ticker})] | 미국 주식 분석 · WiseAIWiseU"
-      Example: "애플(AAPL) 실적 프리뷰: 미국 주식 투자자가 알아야 할 것 | 미국 주식 분석 · WiseAIWiseU"
-    - Portuguese title format: "[Tópico em Português ({ticker})] | Análise de Ações dos EUA · WiseAIWiseU"
-      Example: "Prévia de Resultados da Apple (AAPL): O Que Investidores em Ações dos EUA Devem Saber | Análise de Ações dos EUA · WiseAIWiseU"
+    {_spec_lines(langs, "title", ticker)}
 
     IMPORTANT DESCRIPTION RULES:
-    - English summary: Must contain "US stock" or "US stocks". 1-2 sentences, click-worthy.
-    - Korean summary: Must contain "미국 주식". 1-2 sentences in Korean.
-    - Portuguese summary: Must contain "ações dos EUA". 1-2 sentences in Portuguese.
+    {_spec_lines(langs, "summary", ticker)}
 
-    Generate content in 3 languages:
-    1. English (en) - Primary, professional, insightful
-    2. Korean (ko) - Full Korean translation
-    3. Portuguese (pt) - Full Portuguese translation
+    Generate content in {len(langs)} language(s):
+    {lang_list}
 
     Output MUST be valid JSON matching this exact schema:
     {{
-        "en": {{ "title": "...", "content": "HTML body", "summary": "...", "keywords": "US stocks, {ticker}, dividend investing, stock analysis" }},
-        "ko": {{ "title": "...", "content": "HTML body", "summary": "...", "keywords": "미국 주식, {ticker}, 배당 투자, 주식 분석" }},
-        "pt": {{ "title": "...", "content": "HTML body", "summary": "...", "keywords": "ações dos EUA, {ticker}, dividendos, análise de ações" }}
+        {_schema(langs, ticker)}
     }}
 
     Requirements:
@@ -287,6 +315,108 @@ def generate_multi_lang_content(stock_info, news_text):
     - Add internal links: mention US Dividend Stock Search at /list and US Stock Compound Interest at /calculator
     """
 
+
+def build_localization_prompt(stock_info, english, lang):
+    """Prompt that localizes the finished English article into one language."""
+    ticker = stock_info['ticker']
+    return f"""
+    You are a professional financial translator and editor.
+    Localize the following English US stock analysis of {ticker} for native readers.
+    Output language: {LANGUAGE_SPECS[lang]['name']}
+
+    IMPORTANT SEO TITLE RULES:
+    {_spec_lines([lang], "title", ticker)}
+
+    IMPORTANT DESCRIPTION RULES:
+    {_spec_lines([lang], "summary", ticker)}
+
+    Output MUST be valid JSON matching this exact schema:
+    {{
+        {_schema([lang], ticker)}
+    }}
+
+    Requirements:
+    - Keep every section, number, internal link and the HTML structure of the original
+    - Keep the [CHART-HERE] placeholder exactly where it is
+    - Translate naturally, not word-for-word
+
+    English article (JSON):
+    {json.dumps(english, ensure_ascii=False)}
+    """
+
+
+def stream_languages(model, prompt, langs):
+    """Stream one generation, keeping each language object as soon as it closes.
+
+    Returns {"languages": {lang: obj}, "error": str | None}. The stream is
+    abandoned at the first structural JSON error or off-schema member.
+    """
+    scanner = json_stream.ObjectStreamScanner()
+    done = {}
+    try:
+        response = model.generate_content(
+            prompt,
+            generation_config=GENERATION_CONFIG,
+            request_options={"timeout": 60},
+            stream=True
+        )
+        for chunk in response:
+            for lang, obj in scanner.feed(chunk.text):
+                if lang not in langs:
+                    raise json_stream.StreamError(f"Unexpected member {lang!r}")
+                if isinstance(obj, dict) and obj.get("content"):
+                    done[lang] = obj
+                    print(f"  [stream] {lang} complete ({scanner.pos:,} chars received)")
+                else:
+                    print(f"  [stream] {lang} arrived without content — will retry")
+        if not scanner.done:
+            return {"languages": done, "error": f"Stream ended inside the JSON object (depth {scanner.depth})"}
+        return {"languages": done, "error": None}
+    except json_stream.StreamError as e:
+        # 구조가 깨진 순간 스트림 소비를 중단 — 끝까지 기다리지 않음
+        print(f"  [stream] Aborting early: {e}")
+        return {"languages": done, "error": f"StreamError: {e}"}
+    except Exception as e:
+        return {"languages": done, "error": str(e)}
+
+
+def generate_multi_lang_content(stock_info, news_text, router=None):
+    """All three languages from one streamed JSON response (default mode)."""
+    return generate_languages(LANGUAGES, lambda pending: build_prompt(stock_info, news_text, pending), router)
+
+
+def generate_per_language(stock_info, news_text, router=None):
+    """English first, then KO and PT localized concurrently behind gemini_limiter."""
+    router = router or ModelRouter()
+    latencies = {}
+    started = time.perf_counter()
+
+    def run(langs, make_prompt):
+        t0 = time.perf_counter()
+        result = generate_languages(langs, make_prompt, router)
+        latencies["+".join(langs)] = time.perf_counter() - t0
+        return result or {}
+
+    contents = run(["en"], lambda pending: build_prompt(stock_info, news_text, pending))
+    if "en" not in contents:
+        return None
+    # 영어 원문이 확정된 뒤 KO/PT 현지화를 동시에 요청 — 서로의 토큰 예산을 잠식하지 않음
+    others = [l for l in LANGUAGES if l != "en"]
+    with ThreadPoolExecutor(max_workers=len(others)) as pool:
+        futures = [pool.submit(run, [l], lambda pending, l=l: build_localization_prompt(stock_info, contents["en"], l))
+                   for l in others]
+        for future in futures:
+            contents.update(future.result())
+    print("  [latency] " + " | ".join(f"{k} {v:.1f}s" for k, v in latencies.items())
+          + f" | wall {time.perf_counter() - started:.1f}s")
+    return contents
+
+
+def generate_languages(langs, make_prompt, router=None):
+    """Generate `langs` via make_prompt(pending), retrying only what is missing."""
+    contents = {}
+    router = router or ModelRouter()
+
     models_to_try = [
         MODEL_NAME, 
         'gemini-3.5-flash', 
@@ -295,7 +425,8 @@ def generate_multi_lang_content(stock_info, news_text):
         'gemini-3.1-flash-lite', 
         'gemini-flash-lite-latest'
     ]
-    for model_name in models_to_try:
+    # 저장된 성공률/지연시간/쿼터 상태 기준으로 가장 건강한 모델부터 시도
+    for model_name in router.order(models_to_try):
         print(f"[*] Attempting content generation with {model_name}...")
         try:
             current_model = genai.GenerativeModel(model_name)
@@ -304,30 +435,45 @@ def generate_multi_lang_content(stock_info, news_text):
             continue
 
         for attempt in range(3):
-            try:
-                response = current_model.generate_content(
-                    prompt,
-                    generation_config={
-                        "response_mime_type": "application/json",
-                        "max_output_tokens": 8192
-                    },
-                    request_options={"timeout": 60}
-                )
-                return json.loads(response.text)
-            except Exception as e:
-                err_str = str(e)
-                print(f"[!] Gemini generation failed with {model_name} (Attempt {attempt+1}/3): {err_str}")
-                if "429" in err_str:
-                    if "PerDay" in err_str or "limit: 0" in err_str:
-                        print("  [Daily Quota Exceeded] Daily quota exhausted or model disabled. Switching to fallback model immediately...")
-                        break
-                    # 무료 티어 분당 호출량 한도 리셋을 위해 35초 대기
-                    print("  [429 Quota] Rate limit hit. Sleeping 35 seconds to reset...")
-                    time.sleep(35)
-                else:
-                    time.sleep(2)
+            # 완성된 언어는 보존하고 누락된 언어만 다시 요청
+            pending = [l for l in langs if l not in contents]
+            prompt = make_prompt(pending)
+            prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+            latency = []
+
+            def generate():
+                if not cassette.is_replay():
+                    gemini_limiter.acquire()
+                started = time.perf_counter()
+                result = cassette.call("gemini", f"{model_name}:{prompt_hash}",
+                                       lambda: stream_languages(current_model, prompt, pending))
+                latency.append(time.perf_counter() - started)
+                return result
+
+            # 같은 프롬프트/모델/설정으로 재실행하면 로컬 캐시에서 바로 응답 (쿼터 절약)
+            result = llm_cache.cached(model_name, prompt, GENERATION_CONFIG, generate,
+                                      valid=lambda r: bool(r["languages"]) and not r["error"])
+            wait = router.record(model_name, result["error"], latency[0]) if latency else None
+            contents.update(result["languages"])
+            if all(l in contents for l in langs):
+                return contents
+            err_str = result["error"] or f"missing {', '.join(l for l in langs if l not in contents)}"
+            print(f"[!] Gemini generation failed with {model_name} (Attempt {attempt+1}/3): {err_str}")
+            if model_router.is_daily_quota(err_str):
+                print("  [Daily Quota Exceeded] Skipping this model until its quota resets (midnight PT)...")
+                break
+            if model_router.is_rate_limited(err_str):
+                wait = wait or model_router.retry_delay(err_str) or model_router.DEFAULT_RETRY_DELAY
+                if wait > MAX_RETRY_WAIT:
+                    print(f"  [429 Quota] Server asks for {wait:.0f}s — switching model instead of waiting...")
+                    break
+                # 서버가 알려준 retry delay만큼만 대기
+                print(f"  [429 Quota] Rate limit hit. Sleeping {wait:.0f} seconds as requested...")
+                cassette.sleep(wait)
+            else:
+                cassette.sleep(2)
         print(f"[!] All attempts with {model_name} failed. Trying fallback model...")
-    return None
+    return contents or None
 
 def build_post_html(lang, title, summary, keywords, today, ticker, article_body, css_path, home_path):
     """Build premium HTML for a daily blog post."""
@@ -406,205 +552,31 @@ def build_post_html(lang, title, summary, keywords, today, ticker, article_body,
     alt_ko = f"https://wiseaiwiseu.com/ko/blog/{post_slug}"
     alt_pt = f"https://wiseaiwiseu.com/pt/blog/{post_slug}"
 
-    return f'''<!DOCTYPE html>
-<html lang="{lang}">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{optimized_title}</title>
-  <meta name="description" content="{optimized_desc}">
-  <meta name="keywords" content="{keywords}">
-  <meta property="og:title" content="{optimized_title}">
-  <meta property="og:description" content="{optimized_desc}">
-  <meta property="og:type" content="article">
-  <link rel="canonical" href="{canonical_url}" />
-  <link rel="alternate" hreflang="en" href="{alt_en}" />
-  <link rel="alternate" hreflang="ko" href="{alt_ko}" />
-  <link rel="alternate" hreflang="pt" href="{alt_pt}" />
-  <link rel="alternate" hreflang="x-default" href="{alt_en}" />
-  <link rel="stylesheet" href="{css_path}">
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-  <style>
-    /* ── Reading Progress Bar ── */
-    #progress-bar {{
-      position: fixed; top: 0; left: 0; height: 3px; width: 0%;
-      background: linear-gradient(90deg, #6366f1, #2dd4bf);
-      z-index: 9999; transition: width 0.1s linear;
-    }}
-    /* ── Post Styles ── */
-    body {{ font-family: 'Inter', sans-serif; background: var(--bg-color); color: var(--text-primary); margin: 0; }}
-    
-    .post-hero {{
-      padding: 6rem 1.5rem 5rem; text-align: center; border-bottom: 1px solid rgba(255,255,255,0.05);
-      background: radial-gradient(circle at top, rgba(99,102,241,0.05) 0%, transparent 70%);
-    }}
-    .post-hero .ticker-badge {{
-      display: inline-block; background: rgba(255,255,255,0.05); border: 1px solid rgba(255,255,255,0.1);
-      color: #60a5fa; font-size: 0.8rem; font-weight: 700; letter-spacing: 1.5px;
-      text-transform: uppercase; padding: 0.5rem 1.4rem; border-radius: 999px;
-      margin-bottom: 2rem; backdrop-filter: blur(10px);
-    }}
-    .post-hero h1 {{
-      font-size: clamp(2.2rem, 6vw, 3.5rem); font-weight: 800; letter-spacing: -1.5px;
-      line-height: 1.1; max-width: 900px; margin: 0 auto 2rem; color: var(--text-primary);
-    }}
-    .post-hero .meta {{
-      font-size: 0.95rem; color: var(--text-secondary); display: flex;
-      gap: 2rem; justify-content: center; flex-wrap: wrap; margin-top: 1rem;
-      opacity: 0.8;
-    }}
-    
-    /* ── Article Layout ── */
-    .post-content {{
-      max-width: 760px; margin: 0 auto; padding: 4rem 1.5rem;
-    }}
-    .post-content h2 {{
-      font-size: 1.85rem; font-weight: 700; color: var(--text-primary);
-      margin: 4rem 0 1.5rem; letter-spacing: -0.5px;
-      display: flex; align-items: center; gap: 0.75rem;
-    }}
-    .post-content h2::before {{
-      content: ''; display: inline-block; width: 4px; height: 1.5rem;
-      background: var(--primary-gradient); border-radius: 2px;
-    }}
-    .post-content h3 {{ 
-      font-size: 1.4rem; font-weight: 600; color: var(--text-primary); 
-      margin: 3rem 0 1.25rem; letter-spacing: -0.3px;
-    }}
-    .post-content p {{ 
-      line-height: 1.9; color: var(--text-secondary); 
-      margin-bottom: 1.75rem; font-size: 1.125rem; font-weight: 400; 
-    }}
-    .post-content ul, .post-content ol {{
-      padding-left: 1.5rem; margin-bottom: 1.75rem;
-    }}
-    .post-content li {{ 
-      line-height: 1.9; color: var(--text-secondary); 
-      margin-bottom: 0.75rem; font-size: 1.125rem; 
-    }}
-    .post-content strong {{ color: var(--text-primary); font-weight: 600; }}
-    .post-content img {{
-      width: 100%; border-radius: 16px; margin: 2.5rem 0;
-      border: 1px solid rgba(255,255,255,0.05);
-      box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-    }}
-    
-    /* ── Key Point ── */
-    .key-point {{ 
-      background: rgba(255,255,255,0.03); border: 1px solid rgba(255,255,255,0.08);
-      border-left: 4px solid #6366f1; 
-      border-radius: 12px; padding: 2rem; margin: 3rem 0; 
-      color: var(--text-primary); font-size: 1.1rem; 
-      backdrop-filter: blur(5px);
-    }}
-    .key-point strong {{ color: #60a5fa; }}
-    
-    /* ── Key Metrics Card ── */
-    .metrics-bar {{
-      display: flex; gap: 1.5rem; flex-wrap: wrap;
-      background: rgba(255,255,255,0.02); border: 1px solid rgba(255,255,255,0.08);
-      border-radius: 16px; padding: 2rem; margin: 3rem 0;
-      backdrop-filter: blur(10px);
-    }}
-    .metric-item {{ flex: 1; min-width: 140px; text-align: center; }}
-    .metric-item .label {{ font-size: 0.85rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 0.75rem; display: block; opacity: 0.8; }}
-    .metric-item .value {{ font-size: 1.75rem; font-weight: 800; color: var(--text-primary); }}
-    
-    /* ── Disclaimer ── */
-    .disclaimer {{
-      margin-top: 5rem; padding: 2rem;
-      background: rgba(255,255,255,0.01); border: 1px solid rgba(255,255,255,0.05);
-      border-radius: 16px; font-size: 0.9rem; color: var(--text-secondary); line-height: 1.8;
-    }}
-    .disclaimer .disc-title {{ font-weight: 700; color: var(--text-primary); margin-bottom: 0.75rem; display: block; }}
-    
-    /* ── Back Button ── */
-    .back-btn {{
-      display: inline-flex; align-items: center; gap: 0.75rem;
-      color: var(--text-secondary); font-weight: 600; text-decoration: none;
-      font-size: 1rem; margin-bottom: 3rem; transition: all 0.3s;
-      padding: 0.5rem 1rem; border-radius: 8px; background: rgba(255,255,255,0.03);
-    .back-btn:hover {{ color: var(--text-primary); background: rgba(255,255,255,0.08); transform: translateX(-5px); }}
-  </style>
-  <!-- Google AdSense -->
-  <script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-7682868472389642" crossorigin="anonymous"></script>
-</head>
-<body>
-  <div id="progress-bar"></div>
-  <div class="container">
-    <header>
-      <a href="{home_path}" class="logo">WiseAIWiseU</a>
-      <nav class="lang-selector">
-        <a href="/ko/blog" class="lang-link {nav_ko_active}">KO</a>
-        <a href="/blog"    class="lang-link {nav_en_active}">EN</a>
-        <a href="/pt/blog" class="lang-link {nav_pt_active}">PT</a>
-      </nav>
-    </header>
-
-    {ad_header}
-
-    <section class="post-hero">
-      <span class="ticker-badge">📈 {ticker} · US Stock Analysis</span>
-      <h1>{"미국 주식 인사이트" if lang == "ko" else ("Insights de Ações dos EUA" if lang == "pt" else "US Stock Insights")}: {title.split(" | ")[0] if " | " in title else title}</h1>
-      <div class="meta">
-        <span>📅 {today}</span>
-        <span>🌐 WiseAIWiseU</span>
-      </div>
-    </section>
-
-    <main class="post-content">
-      <a href="{blog_path}" class="back-btn">{back_label}</a>
-
-      <div style="display:flex;align-items:center;gap:1rem;background:#f8f9fb;border:1px solid #e5e7eb;border-radius:12px;padding:1rem 1.2rem;margin-bottom:2rem;">
-        <div style="width:48px;height:48px;background:linear-gradient(135deg,#6366f1,#8b5cf6);border-radius:50%;display:flex;align-items:center;justify-content:center;flex-shrink:0;">
-          <span style="color:#fff;font-weight:700;font-size:1.1rem;">W</span>
-        </div>
-        <div>
-          <strong style="display:block;color:#1e1b4b;font-size:0.95rem;">WiseAIWiseU Research Team</strong>
-          <span style="font-size:0.8rem;color:#6b7280;">Data-driven dividend &amp; market analysis | Published: {today} | Educational purposes only</span>
-        </div>
-      </div>
-
-      {article_body}
-
-      <div class="disclaimer">
-        <div class="disc-title">⚠️ Legal Disclaimer / 법적 고지</div>
-        <p>{disclaimer_text}</p>
-      </div>
-    </main>
-
-    {ad_footer}
-
-    <footer>
-      <div class="footer-content">
-        <p>&copy; 2026 WiseAIWiseU - Smart Dividend Investing</p>
-        <p style="font-size:0.85rem;"><a href="{home_path}" style="color:#666;">{back_label}</a></p>
-      </div>
-    </footer>
-  </div>
-
-  <script>
-    // Reading progress bar
-    window.addEventListener('scroll', () => {{
-      const el = document.getElementById('progress-bar');
-      const total = document.body.scrollHeight - window.innerHeight;
-      el.style.width = (window.scrollY / total * 100) + '%';
-    }});
-  </script>
-</body>
-</html>'''
-
-def save_and_index_multi(contents, ticker, chart_url):
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-
-    langs = {
-        "en": {"dir": get_abs_path("blog"), "posts": get_abs_path("posts.json"), "prefix": "",    "css": "css/style.css",    "home": "/"},
-        "ko": {"dir": get_abs_path("ko/blog"), "posts": get_abs_path("ko/posts.json"), "prefix": "ko/", "css": "../css/style.css", "home": "/ko/"},
-        "pt": {"dir": get_abs_path("pt/blog"), "posts": get_abs_path("pt/posts.json"), "prefix": "pt/", "css": "../css/style.css", "home": "/pt/"},
-    }
-
-    for lang, settings in langs.items():
+    return post_template.render(
+        "post.html", lang=lang, keywords=keywords, today=today, ticker=ticker, article_body=article_body,
+        css_path=css_path, home_path=home_path, post_css=post_template.stylesheet_href(),
+        optimized_title=optimized_title, optimized_desc=optimized_desc,
+        canonical_url=canonical_url, alt_en=alt_en, alt_ko=alt_ko, alt_pt=alt_pt,
+        nav_ko_active=nav_ko_active, nav_en_active=nav_en_active, nav_pt_active=nav_pt_active,
+        ad_header=ad_header, ad_footer=ad_footer, blog_path=blog_path, back_label=back_label,
+        disclaimer_text=disclaimer_text,
+        hero_label={"ko": "미국 주식 인사이트", "pt": "Insights de Ações dos EUA"}.get(lang, "US Stock Insights"),
+        hero_title=title.split(" | ")[0] if " | " in title else title,
+    )
+
+POST_TARGETS = {
+    "en": {"dir": "blog",    "prefix": "",    "css": "css/style.css",    "home": "/"},
+    "ko": {"dir": "ko/blog", "prefix": "ko/", "css": "../css/style.css", "home": "/ko/"},
+    "pt": {"dir": "pt/blog", "prefix": "pt/", "css": "../css/style.css", "home": "/pt/"},
+}
+
+
+def render_posts(contents, ticker, chart_series):
+    """Write each language's post HTML; returns {lang: posts.json entry} for index_posts()."""
+    today = cassette.now().strftime("%Y-%m-%d")
+    entries = {}
+
+    for lang, settings in POST_TARGETS.items():
         if lang not in contents: continue
 
         data     = contents[lang]
@@ -627,7 +599,8 @@ def save_and_index_multi(contents, ticker, chart_url):
         content = re.compile(r'<h1([^>]*)>', re.IGNORECASE).sub(r'<h2\1>', content)
         content = re.compile(r'</h1>', re.IGNORECASE).sub(r'</h2>', content)
 
-        chart_tag = f'<img src="{chart_url}" alt="{ticker} Chart" style="width:100%; border-radius:12px; margin: 20px 0; box-shadow: 0 4px 12px rgba(0,0,0,0.1);">'
+        # 빌드 시점에 로컬 가격 데이터로 SVG를 그려 인라인 — 외부 이미지 요청 없음
+        chart_tag = svg_chart.render_price_chart(ticker, *chart_series, lang=lang) if chart_series else ""
         if "[CHART-HERE]" in content:
             article_body = content.replace("[CHART-HERE]", chart_tag)
         elif "</h2>" in content:
@@ -650,56 +623,148 @@ def save_and_index_multi(contents, ticker, chart_url):
             css_path=settings["css"], home_path=settings["home"]
         )
 
-        if not os.path.exists(settings['dir']): 
-            os.makedirs(settings['dir'], exist_ok=True)
+        blog_dir = get_abs_path(settings['dir'])
+        if not os.path.exists(blog_dir): 
+            os.makedirs(blog_dir, exist_ok=True)
             
         filename = f"{today}-{ticker}.html"
-        filepath = os.path.join(settings['dir'], filename)
+        filepath = os.path.join(blog_dir, filename)
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(html_full)
 
-        posts_path = settings['posts']
-        posts = []
-        if os.path.exists(posts_path):
-            with open(posts_path, "r", encoding="utf-8") as f:
-                try: posts = json.load(f)
-                except: posts = []
+        entries[lang] = {"title": title, "date": today, "link": f"blog/{filename}", "summary": summary}
 
-        link     = f"blog/{filename}"
-        new_post = {"title": title, "date": today, "link": link, "summary": summary}
-        posts    = [new_post] + [p for p in posts if p['link'] != new_post['link']]
-        with open(posts_path, "w", encoding="utf-8") as f:
-            json.dump(posts[:60], f, ensure_ascii=False, indent=4)
+    return entries
+
+
+def index_posts(entries, ticker):
+    """Record the rendered posts in the catalog and regenerate each posts.json (re-running is harmless)."""
+    with post_catalog.connect() as db:
+        for lang, new_post in entries.items():
+            post_catalog.add(db, lang, new_post['link'], new_post['title'], new_post['date'], new_post['summary'])
+        for lang in entries:
+            post_catalog.export(db, lang)
 
     print(f"[OK] {ticker} - posts saved (EN + KO + PT)")
+    return True
+
+
+def save_and_index_multi(contents, ticker, chart_series):
+    return index_posts(render_posts(contents, ticker, chart_series), ticker)
+
+
+# 서비스별 동시 실행 한도 (market: 공유 패널 조회, llm: Gemini 호출, io: 포스트/인덱스 쓰기)
+SERVICE_LIMITS = {"market": 1, "llm": 2, "io": 1}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Volatility Hunter daily poster")
+    parser.add_argument("--count", type=int, default=1,
+                        help="number of tickers to post this run (default: %(default)s)")
+    parser.add_argument("--universe", metavar="FILE",
+                        help="scan symbols from FILE (one per line) instead of the built-in TICKERS")
+    parser.add_argument("--chunk-size", type=int, default=universe_scan.CHUNK_SIZE,
+                        help="symbols per download chunk in universe mode (default: %(default)s)")
+    parser.add_argument("--per-language", action="store_true",
+                        help="generate EN first, then localize KO and PT concurrently")
+    parser.add_argument("--fresh", action="store_true",
+                        help="ignore today's checkpoints under .tmp/runs/ and redo every stage")
+    cassette.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def _encode_chart(series):
+    dates, prices = series
+    return {"dates": [d.strftime("%Y-%m-%d") for d in dates], "prices": prices}
+
+
+def _decode_chart(value):
+    return [datetime.date.fromisoformat(d) for d in value["dates"]], value["prices"]
 
 
-def main():
+async def run_pipeline(top_stocks, session, feed_store, router, per_language=False, state=None):
+    """Process every ticker concurrently; returns the number of posts written.
+
+    Chart, news, generation and writes of different tickers overlap, each
+    stage bounded by SERVICE_LIMITS. Posts are indexed in ticker order so
+    posts.json comes out the same however the generations interleave.
+    With a RunState every stage is checkpointed per ticker, so a rerun
+    skips finished tickers and resumes the rest at their first missing stage.
+    """
+    state = state or RunState(fresh=True)
+    limits = {name: asyncio.Semaphore(n) for name, n in SERVICE_LIMITS.items()}
+    indexed = [asyncio.Event() for _ in top_stocks]
+    generate = generate_per_language if per_language else generate_multi_lang_content
+
+    async def process(i, stock):
+        ticker = stock['ticker']
+        try:
+            if math.isnan(stock['price']) or math.isnan(stock['change']):
+                print(f"  [skip] Invalid data for {ticker}")
+                return False
+            if state.done("index", ticker):
+                print(f"  [resume] {ticker} already posted in this run")
+                return True
+            print(f"[*] Processing {ticker}...")
+            async with limits["market"]:
+                chart_series = await asyncio.to_thread(
+                    state.checkpoint, "chart", lambda: get_chart_series(ticker, session), ticker,
+                    _encode_chart, _decode_chart)
+            news = state.checkpoint("news", lambda: get_news_for_ticker(feed_store, ticker), ticker)
+            async with limits["llm"]:
+                contents = await asyncio.to_thread(
+                    state.checkpoint, "generate", lambda: generate(stock, news, router), ticker)
+            if i:
+                await indexed[i - 1].wait()
+            if not contents:
+                return False
+            async with limits["io"]:
+                entries = await asyncio.to_thread(
+                    state.checkpoint, "render", lambda: render_posts(contents, ticker, chart_series), ticker)
+                await asyncio.to_thread(
+                    state.checkpoint, "index", lambda: index_posts(entries, ticker), ticker)
+            return True
+        except Exception as e:
+            print(f"[!] {ticker} failed: {e}")
+            return False
+        finally:
+            indexed[i].set()
+
+    results = await asyncio.gather(*(process(i, s) for i, s in enumerate(top_stocks)))
+    return sum(results)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # 리플레이는 녹화된 응답만 사용하므로 API 키 없이도 실행 가능 (--replay X / --replay=X 모두)
+    if not api_key and not args.replay:
+        print("[CRITICAL] Error: GEMINI_API_KEY not found in environment variables.")
+        sys.exit(1)
+    cassette.configure(record=args.record, replay=args.replay)
     print("=== Volatility Hunter v3.2 ===")
-    top_stocks = get_top_volatile_tickers(TICKERS, 1)
-    news = get_latest_news()
+    # 같은 날 재실행 시 .tmp/runs/{날짜}/ 체크포인트에서 완료된 단계는 건너뜀
+    state = RunState(fresh=args.fresh)
+    session = MarketDataSession()
+    if args.universe:
+        top_stocks = state.checkpoint("select", lambda: get_top_volatile_from_universe(
+            args.universe, args.count, session, chunk_size=args.chunk_size) or None)
+    else:
+        top_stocks = state.checkpoint("select", lambda: get_top_volatile_tickers(TICKERS, args.count, session) or None)
+    feed_store = get_latest_news()
     
     if not top_stocks:
         print("[CRITICAL] Error: No top volatile stocks selected.")
         sys.exit(1)
-        
-    generated_count = 0
-    for stock in top_stocks:
-        print(f"[*] Processing {stock['ticker']}...")
-        if math.isnan(stock['price']) or math.isnan(stock['change']):
-            print(f"  [skip] Invalid data for {stock['ticker']}")
-            continue
-            
-        chart_url = get_quickchart_url(stock['ticker'])
-        contents = generate_multi_lang_content(stock, news)
-        if contents:
-            save_and_index_multi(contents, stock['ticker'], chart_url)
-            generated_count += 1
-        time.sleep(2)
-        
+
+    router = ModelRouter()
+    started = time.perf_counter()
+    generated_count = asyncio.run(run_pipeline(top_stocks, session, feed_store, router, args.per_language, state))
+    print(f"[*] {generated_count}/{len(top_stocks)} posts in {time.perf_counter() - started:.1f}s")
+
+    router.report()
     if generated_count == 0:
         print("[CRITICAL] Error: Failed to generate any blog post contents.")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,256 @@
+"""
+Incremental site build over a dependency graph of registered targets.
+
+    python execution/build.py                  # rebuild whatever is out of date
+    python execution/build.py sitemap          # just these targets (and their deps)
+    python execution/build.py --force          # rebuild everything
+    python execution/build.py --graph          # print targets, inputs and outputs
+
+Each Target declares what it reads: `inputs` are glob patterns hashed by
+content, and `listings` are globs whose file *names* matter but not their
+bytes (the sitemap needs to know which posts exist, not what they say). It
+also declares `deps`, targets that must run first. build() returns
+{relative path: text or bytes}. The engine writes an output only when its
+bytes differ from what is on disk, so untouched pages keep their mtime and
+produce no git diff.
+
+.tmp/build_manifest.json stores, per target, the hash of every input, the
+hash of every listing and the hash of every output it wrote. A target is
+rebuilt only when one of those changed: an input edited, a file added or
+removed, or an output modified or deleted behind the build's back. Inputs
+are hashed after the build, so a target that rewrites one of its own inputs
+in place (blog.html) is not rebuilt on the next run. A target whose step
+manages its own files (precompress) returns None and is tracked through its
+inputs and listings instead.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import hashlib
+import argparse
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+MANIFEST_PATH = os.path.join(BASE_DIR, ".tmp", "build_manifest.json")
+LANGS = {"en": "", "ko": "ko/", "pt": "pt/"}
+
+TARGETS = {}
+
+
+class Target:
+    def __init__(self, name, build, inputs=(), listings=(), deps=()):
+        self.name = name
+        self.build = build
+        self.inputs = list(inputs)
+        self.listings = list(listings)
+        self.deps = list(deps)
+
+
+def target(name, inputs=(), listings=(), deps=()):
+    """Decorator registering build() as a target."""
+    def register(build):
+        TARGETS[name] = Target(name, build, inputs, listings, deps)
+        return build
+    return register
+
+
+def _expand(patterns):
+    found = set()
+    for pattern in patterns:
+        found.update(os.path.relpath(p, BASE_DIR) for p in glob.glob(os.path.join(BASE_DIR, pattern), recursive=True)
+                     if os.path.isfile(p))
+    return sorted(found)
+
+
+def _file_hash(rel_path, cache):
+    if rel_path not in cache:
+        with open(os.path.join(BASE_DIR, rel_path), "rb") as f:
+            cache[rel_path] = hashlib.sha256(f.read()).hexdigest()
+    return cache[rel_path]
+
+
+def _snapshot(t, cache):
+    return {
+        "inputs": {p: _file_hash(p, cache) for p in _expand(t.inputs)},
+        "listings": {pattern: hashlib.sha256("\n".join(_expand([pattern])).encode("utf-8")).hexdigest()
+                     for pattern in t.listings},
+    }
+
+
+def _outputs_intact(record, cache):
+    for rel_path, digest in record.get("outputs", {}).items():
+        if not os.path.exists(os.path.join(BASE_DIR, rel_path)) or _file_hash(rel_path, cache) != digest:
+            return False
+    return True
+
+
+def write_if_changed(rel_path, data):
+    """Write data (str or bytes) to rel_path unless it already holds exactly those bytes."""
+    data = data.encode("utf-8") if isinstance(data, str) else data
+    path = os.path.join(BASE_DIR, rel_path)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def _order(names):
+    """Targets in dependency order, including every dependency of `names`."""
+    ordered, seen = [], set()
+
+    def visit(name, stack=()):
+        if name in stack:
+            raise ValueError(f"Dependency cycle: {' -> '.join(stack + (name,))}")
+        if name in seen:
+            return
+        if name not in TARGETS:
+            raise KeyError(f"Unknown target {name!r} (known: {', '.join(TARGETS)})")
+        for dep in TARGETS[name].deps:
+            visit(dep, stack + (name,))
+        seen.add(name)
+        ordered.append(name)
+
+    for name in names:
+        visit(name)
+    return ordered
+
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def build(names=None, force=False):
+    """Run out-of-date targets; returns {target: files written} for those that ran."""
+    manifest = _load_manifest()
+    ran = {}
+    for name in _order(names or list(TARGETS)):
+        t = TARGETS[name]
+        cache = {}
+        record = manifest.get(name)
+        if not force and record and _snapshot(t, cache) == {k: record.get(k) for k in ("inputs", "listings")} \
+                and _outputs_intact(record, cache):
+            print(f"  [build] {name}: up to date")
+            continue
+
+        started = time.perf_counter()
+        outputs = t.build()
+        written = sum(write_if_changed(p, data) for p, data in (outputs or {}).items())
+        cache = {}                      # 자기 입력을 다시 쓰는 타깃이 있으므로 빌드 후 다시 해시
+        manifest[name] = dict(_snapshot(t, cache),
+                              outputs={p: _file_hash(p, cache) for p in (outputs or {})})
+        _save_manifest(manifest)
+        ran[name] = written
+        print(f"  [build] {name}: {written}/{len(outputs or {})} output(s) written "
+              f"in {time.perf_counter() - started:.2f}s")
+    return ran
+
+
+# ===================================================================
+# Targets — 기존 빌드 스크립트의 "내용 생성" 함수를 그대로 사용
+# ===================================================================
+
+@target("posts-index", inputs=[".tmp/posts.sqlite"])
+def build_posts_index():
+    """posts.json and posts/page-N.json for every language, from the catalog."""
+    import post_catalog
+    outputs = {}
+    with post_catalog.connect() as db:
+        for lang in post_catalog.LANGS:
+            outputs[post_catalog.LANGS[lang]["json"]] = post_catalog.render_json(db, lang)
+            outputs.update(post_catalog.render_pages(db, lang))
+    return outputs
+
+
+@target("blog-static", inputs=[f"{p}{f}" for p in LANGS.values() for f in ("posts.json", "blog.html")],
+        deps=["posts-index"])
+def build_blog_static():
+    """Static post grid in each blog.html (update_blog_static.py)."""
+    from update_blog_static import render_blog_html
+    outputs = {}
+    for prefix in LANGS.values():
+        with open(os.path.join(BASE_DIR, f"{prefix}posts.json"), "r", encoding="utf-8") as f:
+            posts = json.load(f)
+        with open(os.path.join(BASE_DIR, f"{prefix}blog.html"), "r", encoding="utf-8") as f:
+            html = f.read()
+        outputs[f"{prefix}blog.html"], _ = render_blog_html(posts, html, f"{prefix}blog.html", prefix)
+    return outputs
+
+
+@target("insights-columnar", inputs=["dividend_insights.json"])
+def build_insights_columnar():
+    """dividend_insights.min.json (dividend_data_generator.to_columnar)."""
+    from dividend_data_generator import COLUMNAR_PATH, columnar_text
+    with open(os.path.join(BASE_DIR, "dividend_insights.json"), "r", encoding="utf-8") as f:
+        output = json.load(f)
+    return {COLUMNAR_PATH: columnar_text(output)}
+
+
+@target("sitemap", inputs=[f"{p}posts.json" for p in LANGS.values()]
+        + [f"{p}{page}" for p in LANGS.values() for page in ("index.html", "list.html", "calculator.html",
+                                                              "calendar.html", "fortune.html", "blog.html",
+                                                              "about.html", "contact.html", "privacy.html")],
+        listings=[f"{p}blog/*.html" for p in LANGS.values()], deps=["posts-index", "blog-static"])
+def build_sitemap():
+    """sitemap.xml (generate_sitemap.py)."""
+    sys.path.insert(0, BASE_DIR)
+    from generate_sitemap import build_sitemap as render
+    return {"sitemap.xml": render()}
+
+
+@target("post-css", inputs=["css/post.css"])
+def build_post_css():
+    """css/post.<hash>.css, the fingerprinted stylesheet post pages link (post_template.py)."""
+    import post_template
+    rel_path, data = post_template.fingerprinted_stylesheet()
+    return {rel_path: data}
+
+
+@target("precompress", inputs=["**/*.html", "**/*.json", "**/*.xml", "css/*.css", "js/*.js"],
+        listings=["**/*.gz", "**/*.br"], deps=["posts-index", "blog-static", "insights-columnar", "sitemap", "post-css"])
+def build_precompress():
+    """.br / .gz siblings (precompress.py keeps its own per-file manifest)."""
+    import precompress
+    precompress.report(precompress.precompress())
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incremental site build")
+    parser.add_argument("targets", nargs="*", help=f"targets to build (default: all of {', '.join(TARGETS)})")
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    parser.add_argument("--graph", action="store_true", help="print the dependency graph and exit")
+    args = parser.parse_args(argv)
+
+    # 기존 스크립트들은 저장소 루트 기준 상대 경로를 사용
+    os.chdir(BASE_DIR)
+    if args.graph:
+        for name in _order(args.targets or list(TARGETS)):
+            t = TARGETS[name]
+            print(f"{name}  <- deps: {', '.join(t.deps) or '-'}")
+            print(f"    inputs:   {len(_expand(t.inputs))} file(s) from {', '.join(t.inputs)}")
+            if t.listings:
+                print(f"    listings: {', '.join(t.listings)}")
+        return
+    ran = build(args.targets, args.force)
+    print(f"[*] {len(ran)} target(s) rebuilt, {sum(ran.values())} file(s) written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Record/replay cassette for all external I/O in the posting pipeline.
+
+    python execution/auto_poster.py --record .tmp/cassettes/2026-10-18.cas
+    python execution/auto_poster.py --replay .tmp/cassettes/2026-10-18.cas
+
+Every external call (yfinance, RSS feeds, Gemini, the post catalog's cooldown
+lookup, and the wall clock) goes through cassette.call(kind, key, fn). While recording, each result is captured
+into a gzip-compressed pickle; while replaying, results come straight from the
+cassette with no network, no API key, no rate limiting and no sleeps, so a
+full run finishes in well under a second and produces the recorded output.
+
+Both modes are hermetic: on-disk caches (yf_cache, the history store) are
+bypassed in favour of a scratch directory, so the recording always captures
+the complete set of responses the run needed. The catalog lookup is recorded
+rather than read live because the recorded run itself adds posts to the
+catalog: replaying right after recording would otherwise see the recorded
+tickers on cooldown and pick different ones.
+"""
+import os
+import gzip
+import time
+import pickle
+import atexit
+import datetime
+import tempfile
+import threading
+from collections import defaultdict, deque
+
+MODE = None          # None | "record" | "replay"
+PATH = None
+FORMAT_VERSION = 2
+
+_entries = defaultdict(deque)
+_lock = threading.Lock()
+_scratch = None
+_clock = None
+
+
+class CassetteMiss(KeyError):
+    """Replay asked for a call that was never recorded."""
+
+
+class RecordedError(RuntimeError):
+    """An exception raised during recording, re-raised on replay."""
+
+
+def configure(record=None, replay=None):
+    """Switch the process into record or replay mode (no-op when both are None)."""
+    global MODE, PATH
+    if record and replay:
+        raise ValueError("--record and --replay are mutually exclusive")
+    if record:
+        MODE, PATH = "record", record
+        atexit.register(save)
+        print(f"[cassette] Recording external I/O → {record}")
+    elif replay:
+        MODE, PATH = "replay", replay
+        with gzip.open(replay, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        for key, results in data["entries"].items():
+            _entries[key] = deque(results)
+        print(f"[cassette] Replaying {sum(len(v) for v in _entries.values())} recorded calls ← {replay}")
+
+
+def reset():
+    """Leave record/replay mode and drop every recorded call (the scratch directory is kept)."""
+    global MODE, PATH, _clock
+    with _lock:
+        MODE, PATH, _clock = None, None, None
+        _entries.clear()
+
+
+def active():
+    return MODE is not None
+
+
+def is_replay():
+    return MODE == "replay"
+
+
+def call(kind, key, fn):
+    """Run fn() (recording its result) or return the recorded result."""
+    if MODE is None:
+        return fn()
+    entry_key = (kind, str(key))
+    if MODE == "replay":
+        with _lock:
+            queue = _entries.get(entry_key)
+            if not queue:
+                raise CassetteMiss(f"No recorded response for {kind}: {key}")
+            status, value = queue.popleft()
+        if status == "error":
+            raise RecordedError(value)
+        return value
+
+    try:
+        value = fn()
+    except Exception as e:
+        with _lock:
+            _entries[entry_key].append(("error", f"{type(e).__name__}: {e}"))
+        raise
+    with _lock:
+        _entries[entry_key].append(("ok", value))
+    return value
+
+
+def now():
+    """datetime.now(); under a cassette the clock is frozen at the run start.
+
+    Freezing it while recording as well keeps timestamps independent of thread
+    scheduling, so the replayed output matches the recorded output byte for byte.
+    """
+    global _clock
+    if MODE is None:
+        return datetime.datetime.now()
+    with _lock:
+        frozen = _clock
+    if frozen is None:
+        frozen = call("clock", "now", datetime.datetime.now)
+        with _lock:
+            _clock = frozen
+    return frozen
+
+
+def today():
+    return now().date()
+
+
+def sleep(seconds):
+    """time.sleep() that is skipped on replay."""
+    if MODE != "replay":
+        time.sleep(seconds)
+
+
+def scratch_dir(name):
+    """Per-process scratch directory used instead of persistent caches."""
+    global _scratch
+    with _lock:
+        if _scratch is None:
+            _scratch = tempfile.mkdtemp(prefix="cassette-")
+    path = os.path.join(_scratch, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def save():
+    """Write the recorded calls to PATH (called automatically at exit)."""
+    if MODE != "record":
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(PATH)), exist_ok=True)
+    with _lock:
+        data = {"version": FORMAT_VERSION, "entries": {k: list(v) for k, v in _entries.items()}}
+    with gzip.open(PATH, "wb", compresslevel=9) as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    size = os.path.getsize(PATH)
+    print(f"[cassette] Saved {sum(len(v) for v in data['entries'].values())} calls ({size:,} bytes) → {PATH}")
+
+
+def add_arguments(parser):
+    """Add the shared --record/--replay options to an argparse parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", metavar="CASSETTE", help="record all external I/O into CASSETTE")
+    group.add_argument("--replay", metavar="CASSETTE", help="replay external I/O from CASSETTE (no network)")
@@ -10,10 +10,14 @@ from datetime import datetime
 
 # auto_poster.py가 있는 execution 폴더를 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from auto_poster import model  # 기존 Gemini API 설정 재사용
+from auto_poster import model, MODEL_NAME  # 기존 Gemini API 설정 재사용
+import llm_cache  # auto_poster와 같은 로컬 LLM 응답 캐시 공유
+import post_catalog
 
 ROOT = r"d:\AI_PROJECT"
 KO_BLOG_DIR = os.path.join(ROOT, "ko", "blog")
+# 교육 시리즈 실행 후 ko/posts.json에 남기는 글 수 (기존 150개 유지 — 일일 포스터는 60개)
+KO_POSTS_JSON_LIMIT = 150
 os.makedirs(KO_BLOG_DIR, exist_ok=True)
 
 SERIES = [
@@ -346,33 +350,19 @@ def generate_content(title, series, description):
 - HTML body 내용만 반환 (DOCTYPE, head 태그 제외)"""
 
     try:
-        resp = model.generate_content(prompt)
-        return resp.text.strip()
+        # 같은 프롬프트는 캐시에서 재사용 — 중간 실패 후 재실행해도 쿼터 소모 없음
+        return llm_cache.cached(MODEL_NAME, prompt, None, lambda: model.generate_content(prompt).text.strip())
     except Exception as e:
         print(f"  [ERR] {e}")
         return None
 
 
 def update_ko_posts_json(slug, title, description):
-    posts_path = os.path.join(ROOT, "ko", "posts.json")
     today_str = datetime.now().strftime("%Y-%m-%d")
-    posts = []
-    if os.path.exists(posts_path):
-        with open(posts_path, "r", encoding="utf-8") as f:
-            try:
-                posts = json.load(f)
-            except:
-                posts = []
-
-    link = f"blog/{slug}.html"
-    new_post = {"title": title, "date": today_str, "link": link, "summary": description[:120]}
-
-    # 중복 제거 후 맨 앞에 추가
-    posts = [new_post] + [p for p in posts if p.get("link") != link]
-    posts = posts[:150]
-
-    with open(posts_path, "w", encoding="utf-8") as f:
-        json.dump(posts, f, ensure_ascii=False, indent=2)
+    # 카탈로그(.tmp/posts.sqlite)에 기록 후 ko/posts.json, ko/posts/ 페이지 재생성 — 커밋되는 기록은 ko/posts/
+    with post_catalog.connect() as db:
+        post_catalog.add(db, "ko", f"blog/{slug}.html", title, today_str, description[:120])
+        post_catalog.export(db, "ko", KO_POSTS_JSON_LIMIT)
 
 
 def main():
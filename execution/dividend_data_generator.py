@@ -1,8 +1,13 @@
 import yfinance as yf
 import json
+import argparse
 import datetime
-import time
 from typing import Dict
+from yf_cache import cached
+from fetch_engine import fetch_all
+import history_store
+import sparkline
+import cassette
 
 DIVIDEND_STOCKS = {
     "dividend_etfs": [
@@ -25,20 +30,11 @@ DIVIDEND_STOCKS = {
 }
 
 def get_dividend_growth_years(ticker: str) -> int:
-    """Count consecutive years of dividend increases from history."""
+    """Count consecutive years of dividend increases from the local history store."""
     try:
-        stock = yf.Ticker(ticker)
-        divs = stock.dividends
+        divs = history_store.load_dividends(ticker)
         if divs.empty or len(divs) < 4:
             return 0
-        # Normalize timezone-aware index
-        try:
-            divs.index = divs.index.tz_convert(None)
-        except Exception:
-            try:
-                divs.index = divs.index.tz_localize(None)
-            except Exception:
-                pass
         # Annual sum
         annual = divs.groupby(divs.index.year).sum()
         if len(annual) < 2:
@@ -49,7 +45,7 @@ def get_dividend_growth_years(ticker: str) -> int:
         
         # If the most recent year is the current incomplete year and its sum is smaller than last year,
         # we start counting from the previous year.
-        current_year = datetime.datetime.now().year
+        current_year = cassette.now().year
         start_idx = 0
         if years[0] == current_year and annual[years[0]] <= annual[years[1]] * 1.02:
             start_idx = 1
@@ -63,12 +59,12 @@ def get_dividend_growth_years(ticker: str) -> int:
     except Exception:
         return 0
 
-def get_dividend_data(ticker: str) -> Dict:
+def get_dividend_data(ticker: str, stock=None) -> Dict:
     """Fetch comprehensive dividend data for a single ticker."""
+    stock = stock or yf.Ticker(ticker)
+    # Network errors propagate so the fetch engine can retry with backoff
+    info = cached("fundamentals", ticker, lambda: stock.info)
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-
         # --- Price (works for stocks and ETFs) ---
         current_price = float(
             info.get('currentPrice') or
@@ -141,7 +137,7 @@ def get_dividend_data(ticker: str) -> Dict:
             "fcf_coverage": fcf_coverage,
             "dividend_growth_years": growth_years,
             "grade": grade,
-            "last_updated": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "last_updated": cassette.now().strftime("%Y-%m-%d %H:%M:%S")
         }
     except Exception as e:
         print(f"[!] Error fetching {ticker}: {e}")
@@ -202,34 +198,45 @@ def calculate_dividend_grade(yield_pct, payout_ratio, five_year_avg,
 def generate_dividend_insights():
     print("=== Dividend Data Generator v2.0 (Fixed) ===")
 
-    all_tickers = list({t for tickers in DIVIDEND_STOCKS.values() for t in tickers})
+    all_tickers = list(dict.fromkeys(t for tickers in DIVIDEND_STOCKS.values() for t in tickers))
     print(f"[*] Processing {len(all_tickers)} tickers...")
 
-    dividend_data = []
-    for i, ticker in enumerate(all_tickers, 1):
-        print(f"  [{i:02d}/{len(all_tickers)}] {ticker}...", end=" ")
-        data = get_dividend_data(ticker)
+    # Full dividend history lives in the local store; only new events are downloaded
+    history_store.update(all_tickers, depth="max")
+
+    def report(ticker, data, done, total):
         if data:
-            dividend_data.append(data)
-            print(f"{data['dividend_yield']:.2f}% | {data['grade']} | "
+            print(f"  [{done:02d}/{total}] {ticker}... {data['dividend_yield']:.2f}% | {data['grade']} | "
                   f"FCF {data['fcf_coverage']:.1f}x | "
                   f"Streak {data['dividend_growth_years']}yr")
         else:
-            print("skipped (no dividend)")
-        time.sleep(0.6)
+            print(f"  [{done:02d}/{total}] {ticker}... skipped (no dividend)")
+
+    results = fetch_all(all_tickers, get_dividend_data, on_result=report)
+    dividend_data = [d for d in results.values() if d]
+
+    # 52-week sparklines for every row in one batch pass over the stored closes
+    year_ago = cassette.today() - datetime.timedelta(days=365)
+    codes = sparkline.encode_panel(history_store.load_panel([d["ticker"] for d in dividend_data], "Close", start=year_ago))
+    for d in dividend_data:
+        d["sparkline"] = codes.get(d["ticker"], "")
+    print(f"[*] Sparklines: {len(codes)}/{len(dividend_data)} tickers, "
+          f"{max(map(len, codes.values()), default=0)} bytes per row")
 
     dividend_data.sort(key=lambda x: x['dividend_yield'], reverse=True)
 
     output = {
-        "generated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "generated_at": cassette.now().strftime("%Y-%m-%d %H:%M:%S"),
         "total_stocks": len(dividend_data),
         "stocks": dividend_data
     }
 
     with open("dividend_insights.json", "w", encoding="utf-8") as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
+    compact = write_columnar(output)
 
-    print(f"\n[OK] Saved {len(dividend_data)} stocks → dividend_insights.json")
+    print(f"\n[OK] Saved {len(dividend_data)} stocks → dividend_insights.json "
+          f"(+ {COLUMNAR_PATH}, {compact:,} bytes)")
 
     print("\n=== Top 15 by Dividend Yield ===")
     print(f"{'Ticker':<8} {'Yield':>6} {'Payout':>8} {'FCF':>6} {'Streak':>7} {'Grade':<8} Name")
@@ -242,6 +249,60 @@ def generate_dividend_insights():
     update_html_files(dividend_data)
 
 
+COLUMNAR_PATH = "dividend_insights.min.json"
+# 반복 값이 많은 문자열 필드는 사전 인코딩 (값 → 사전 인덱스)
+DICT_FIELDS = ("sector", "grade")
+# 행마다 같은 실행 시각이 반복되므로 generated_at 하나로 대체
+DROPPED_FIELDS = ("last_updated",)
+
+
+def _column_type(name, values):
+    if name in DICT_FIELDS:
+        return "u8"
+    if all(isinstance(v, bool) or not isinstance(v, (int, float)) for v in values):
+        return "str"
+    return "i32" if all(isinstance(v, int) for v in values) else "f64"
+
+
+def to_columnar(output):
+    """Columnar form of the insights output: one array per field, no repeated keys.
+
+    {"generated_at", "n", "fields": [{"name", "type"}], "dict": {field: [values]},
+     "cols": [[...] per field]} — types are str / f64 / i32 / u8 (dictionary code).
+    js/insights.js decodes it into typed arrays.
+    """
+    stocks = output["stocks"]
+    names = [k for k in (stocks[0] if stocks else {}) if k not in DROPPED_FIELDS]
+    fields, dictionaries, cols = [], {}, []
+    for name in names:
+        values = [s.get(name) for s in stocks]
+        kind = _column_type(name, values)
+        if kind == "u8":
+            # 섹터가 없는 종목(None)은 ""로 — None과 문자열이 섞이면 정렬 불가
+            values = ["" if v is None else v for v in values]
+            dictionaries[name] = sorted(set(values))
+            codes = {v: i for i, v in enumerate(dictionaries[name])}
+            values = [codes[v] for v in values]
+        elif kind in ("f64", "i32"):
+            values = [0 if v is None else v for v in values]
+        fields.append({"name": name, "type": kind})
+        cols.append(values)
+    return {"generated_at": output["generated_at"], "n": len(stocks),
+            "fields": fields, "dict": dictionaries, "cols": cols}
+
+
+def columnar_text(output):
+    return json.dumps(to_columnar(output), ensure_ascii=False, separators=(",", ":"))
+
+
+def write_columnar(output, path=COLUMNAR_PATH):
+    """Write the minified columnar variant next to dividend_insights.json; returns its size."""
+    text = columnar_text(output)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return len(text.encode("utf-8"))
+
+
 def update_html_files(data):
     """Inject static rows into HTML for SSG/SEO."""
     import re
@@ -299,4 +360,8 @@ def update_html_files(data):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dividend insights generator")
+    cassette.add_arguments(parser)
+    args = parser.parse_args()
+    cassette.configure(record=args.record, replay=args.replay)
     generate_dividend_insights()
@@ -0,0 +1,58 @@
+"""
+Shape-preserving downsampling for charts (NumPy, batch-first).
+
+    idx = lttb_indices(prices, 40)               # one series -> 40 indices
+    idx = lttb_batch(panel_values, 40)           # (series x T) -> (series x 40)
+
+Largest-Triangle-Three-Buckets keeps the point in each bucket that spans the
+largest triangle with the previously kept point and the next bucket's mean,
+so spikes and troughs survive where a plain stride (prices[::step]) drops
+them. The loop runs over buckets only; every bucket is evaluated for all
+series at once, so downsampling a whole universe is one call. Points are
+assumed evenly spaced (one per session), first and last are always kept,
+and NaNs are never selected while a bucket has a finite value.
+"""
+import numpy as np
+
+
+def _bucket_edges(length, n_out):
+    """Edges of the n_out - 2 inner buckets over points 1 .. length-2."""
+    return np.linspace(1, length - 1, n_out - 1).astype(np.int64)
+
+
+def lttb_batch(values, n_out):
+    """Indices (series x n_out) selected by LTTB for each row of values."""
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    rows, length = values.shape
+    if n_out >= length or n_out < 3:
+        return np.tile(np.arange(length), (rows, 1))
+
+    edges = _bucket_edges(length, n_out)
+    picked = np.empty((rows, n_out), dtype=np.int64)
+    picked[:, 0] = 0
+    picked[:, -1] = length - 1
+    row_ix = np.arange(rows)
+    prev = np.zeros(rows, dtype=np.int64)
+    with np.errstate(invalid="ignore"):
+        for b in range(n_out - 2):
+            lo, hi = edges[b], edges[b + 1]
+            # Next bucket's centroid (the final point for the last bucket)
+            nlo, nhi = (hi, edges[b + 2]) if b + 2 < len(edges) else (length - 1, length)
+            next_x = (nlo + nhi - 1) / 2.0
+            next_y = np.nanmean(values[:, nlo:nhi], axis=1) if nhi - nlo > 1 else values[:, nlo]
+
+            prev_y = values[row_ix, prev]
+            xs = np.arange(lo, hi)
+            # Twice the triangle area; the constant factor does not change argmax
+            area = np.abs((prev[:, None] - next_x) * (values[:, lo:hi] - prev_y[:, None])
+                          - (prev[:, None] - xs[None, :]) * (next_y[:, None] - prev_y[:, None]))
+            area = np.where(np.isnan(area), -1.0, area)
+            prev = lo + np.argmax(area, axis=1)
+            picked[:, b + 1] = prev
+    return picked
+
+
+def lttb_indices(values, n_out):
+    """LTTB indices for a single series."""
+    return lttb_batch(values, n_out)[0]
+
@@ -0,0 +1,63 @@
+"""
+Concurrent, rate-limited batch fetcher for per-ticker yfinance work.
+
+    results = fetch_all(tickers, lambda symbol, stock: stock.info)
+
+- Exactly one yf.Ticker object is built per symbol and handed to the task.
+- Tasks run on a bounded thread pool; pacing comes from yf_cache.limiter, a
+  rate_limit.TokenBucket taken on every cache miss, so there are no fixed
+  sleeps.
+- A task that raises is retried with exponential backoff plus full jitter.
+"""
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import yfinance as yf
+import cassette
+
+MAX_WORKERS = 8
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0   # seconds; doubles every attempt
+BACKOFF_CAP = 30.0
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _run_with_retry(symbol, task, retries):
+    stock = yf.Ticker(symbol)
+    for attempt in range(retries + 1):
+        try:
+            return task(symbol, stock)
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"  [retry] {symbol}: {e} — retrying in {delay:.1f}s ({attempt + 1}/{retries})")
+            cassette.sleep(delay)
+
+
+def fetch_all(symbols, task, max_workers=MAX_WORKERS, retries=MAX_RETRIES, on_result=None):
+    """Run task(symbol, yf.Ticker) for every symbol and return {symbol: result}.
+
+    Symbols whose task still fails after all retries map to None.
+    on_result(symbol, result, done, total) is called as each symbol finishes.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    results = {}
+    total = len(symbols)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as pool:
+        futures = {pool.submit(_run_with_retry, s, task, retries): s for s in symbols}
+        for done, future in enumerate(as_completed(futures), 1):
+            symbol = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  [!] {symbol}: giving up after {retries + 1} attempts: {e}")
+                result = None
+            results[symbol] = result
+            if on_result:
+                on_result(symbol, result, done, total)
+    return {s: results.get(s) for s in symbols}
@@ -0,0 +1,221 @@
+"""
+Incremental local price & dividend history store.
+
+One compressed .npz file per ticker under .tmp/history/ holding columnar arrays:
+    dates (datetime64[D]) + Open/High/Low/Close/Volume (float32)
+    div_dates / div_amounts, split_dates / split_ratios
+plus a high-water mark (last stored bar). update() downloads only the bars and
+dividends added since that mark, so a daily run fetches a few KB per ticker
+instead of re-downloading months or decades of history.
+
+Prices are Yahoo's split-adjusted, dividend-unadjusted closes (auto_adjust=False):
+they never change retroactively on an ex-dividend date. When a new split shows
+up in a delta the ticker is backfilled again so older bars pick up the new basis.
+"""
+import os
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import yf_cache
+import cassette
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+STORE_DIR = os.path.join(BASE_DIR, ".tmp", "history")
+
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+# Backfill depths from shallowest to deepest; a ticker stored at a shallower
+# depth than requested is backfilled again.
+DEPTHS = ("1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max")
+DOWNLOAD_CHUNK = 100
+
+
+def _store_dir():
+    # Cassette runs are hermetic: they start from an empty scratch store
+    return cassette.scratch_dir("history") if cassette.active() else STORE_DIR
+
+
+def _path(ticker):
+    return os.path.join(_store_dir(), f"{ticker}.npz")
+
+
+def load(ticker):
+    """Return the raw columnar record for ticker, or None if it is not stored."""
+    path = _path(ticker)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            return {key: npz[key] for key in npz.files}
+    except Exception as e:
+        print(f"  [warn] Corrupt history for {ticker} ({e}) — will backfill")
+        return None
+
+
+def _save(ticker, rec):
+    os.makedirs(_store_dir(), exist_ok=True)
+    tmp_path = _path(ticker) + ".tmp.npz"
+    np.savez_compressed(tmp_path, **rec)
+    os.replace(tmp_path, _path(ticker))
+
+
+def _empty_record():
+    rec = {"dates": np.array([], dtype="datetime64[D]")}
+    for field in FIELDS:
+        rec[field] = np.array([], dtype=np.float32)
+    rec["div_dates"] = np.array([], dtype="datetime64[D]")
+    rec["div_amounts"] = np.array([], dtype=np.float64)
+    rec["split_dates"] = np.array([], dtype="datetime64[D]")
+    rec["split_ratios"] = np.array([], dtype=np.float64)
+    rec["depth"] = np.array("1mo")
+    return rec
+
+
+def high_water_mark(rec):
+    """Last stored bar date (datetime64[D]) or None for an empty record."""
+    return rec["dates"][-1] if rec is not None and len(rec["dates"]) else None
+
+
+def _needs_backfill(rec, depth):
+    if rec is None or high_water_mark(rec) is None:
+        return True
+    stored = str(rec["depth"])
+    return DEPTHS.index(stored) < DEPTHS.index(depth) if stored in DEPTHS else True
+
+
+def _download(tickers, **kwargs):
+    """Single seam for every price/dividend download the store performs."""
+    kwargs.update(interval="1d", actions=True, auto_adjust=False, progress=False)
+    # Backfills land in the store itself; caching them as well would only
+    # duplicate years of bars in the response cache.
+    return yf_cache.download(tickers, store="start" in kwargs, **kwargs)
+
+
+def _ticker_frame(frame, ticker):
+    """Slice one ticker's columns out of a yf.download result."""
+    if frame is None or frame.empty:
+        return None
+    if isinstance(frame.columns, pd.MultiIndex):
+        if ticker not in frame.columns.get_level_values(1):
+            return None
+        sub = frame.xs(ticker, axis=1, level=1)
+    else:
+        sub = frame
+    sub = sub.dropna(subset=["Close"])
+    if sub.empty:
+        return None
+    index = pd.DatetimeIndex(sub.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    sub.index = index
+    return sub
+
+
+def _merge(rec, sub, depth=None):
+    """Replace rec's rows from sub's first date onwards with sub's rows."""
+    new_dates = sub.index.values.astype("datetime64[D]")
+    start = new_dates[0]
+    keep = rec["dates"] < start
+    out = {"dates": np.concatenate([rec["dates"][keep], new_dates])}
+    for field in FIELDS:
+        values = sub[field].to_numpy(dtype=np.float32) if field in sub else np.full(len(sub), np.nan, np.float32)
+        out[field] = np.concatenate([rec[field][keep], values])
+
+    for col, date_key, value_key in (("Dividends", "div_dates", "div_amounts"),
+                                     ("Stock Splits", "split_dates", "split_ratios")):
+        events = sub[col][sub[col] > 0] if col in sub else sub.iloc[0:0, 0]
+        old_keep = rec[date_key] < start
+        out[date_key] = np.concatenate([rec[date_key][old_keep], events.index.values.astype("datetime64[D]")])
+        out[value_key] = np.concatenate([rec[value_key][old_keep], events.to_numpy(dtype=np.float64)])
+
+    out["depth"] = np.array(depth) if depth else rec["depth"]
+    return out
+
+
+def update(tickers, depth="1y"):
+    """Bring the store up to date for tickers, downloading only what is new.
+
+    Tickers not yet stored (or stored shallower than depth) are backfilled with
+    period=depth; the rest are grouped by high-water mark and fetched from it.
+    Returns the number of tickers whose record changed.
+    """
+    today = np.datetime64(cassette.today(), "D")
+    groups = defaultdict(list)
+    records = {}
+    for ticker in dict.fromkeys(tickers):
+        rec = load(ticker)
+        records[ticker] = rec
+        if _needs_backfill(rec, depth):
+            groups[("period", depth)].append(ticker)
+        elif high_water_mark(rec) < today:
+            # Refetch the last stored bar too: it may have been a partial session
+            groups[("start", str(high_water_mark(rec)))].append(ticker)
+
+    changed = 0
+    resplit = []
+    for (kind, value), group in groups.items():
+        for i in range(0, len(group), DOWNLOAD_CHUNK):
+            chunk = group[i:i + DOWNLOAD_CHUNK]
+            try:
+                frame = _download(chunk, **{kind: value})
+            except Exception as e:
+                print(f"  [warn] History download failed for {len(chunk)} tickers: {e}")
+                continue
+            for ticker in chunk:
+                sub = _ticker_frame(frame, ticker)
+                if sub is None:
+                    continue
+                if kind == "start" and "Stock Splits" in sub and (sub["Stock Splits"] > 0).any():
+                    resplit.append(ticker)
+                    continue
+                base = records[ticker] if kind == "start" else _empty_record()
+                _save(ticker, _merge(base, sub, depth=value if kind == "period" else None))
+                changed += 1
+
+    if resplit:
+        print(f"  [history] New split for {', '.join(resplit)} — backfilling")
+        for ticker in resplit:
+            os.remove(_path(ticker))
+        changed += update(resplit, depth=max((str(records[t]["depth"]) for t in resplit), key=DEPTHS.index))
+
+    if groups:
+        print(f"  [history] {changed}/{len(records)} tickers updated "
+              f"({sum(len(g) for k, g in groups.items() if k[0] == 'start')} incremental)")
+    return changed
+
+
+def load_frame(ticker, start=None):
+    """OHLCV DataFrame (DatetimeIndex) for ticker, optionally from start onwards."""
+    rec = load(ticker)
+    if rec is None:
+        return pd.DataFrame(columns=list(FIELDS))
+    frame = pd.DataFrame({f: rec[f].astype(np.float64) for f in FIELDS},
+                         index=pd.DatetimeIndex(rec["dates"].astype("datetime64[ns]")))
+    if start is not None:
+        frame = frame[frame.index >= pd.Timestamp(start)]
+    return frame
+
+
+def load_panels(tickers, fields=FIELDS, start=None):
+    """{field: dates x tickers DataFrame}, reading each ticker's file once."""
+    columns = {field: {} for field in fields}
+    for ticker in tickers:
+        frame = load_frame(ticker, start=start)
+        if frame.empty:
+            continue
+        for field in fields:
+            columns[field][ticker] = frame[field]
+    return {field: pd.DataFrame(cols) for field, cols in columns.items()}
+
+
+def load_panel(tickers, field="Close", start=None):
+    """dates x tickers DataFrame of one field (outer-joined on dates)."""
+    return load_panels(tickers, (field,), start=start)[field]
+
+
+def load_dividends(ticker):
+    """Dividend events for ticker as a Series indexed by ex-date."""
+    rec = load(ticker)
+    if rec is None:
+        return pd.Series(dtype=np.float64)
+    return pd.Series(rec["div_amounts"], index=pd.DatetimeIndex(rec["div_dates"].astype("datetime64[ns]")))
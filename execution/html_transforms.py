@@ -0,0 +1,575 @@
+"""
+Single-pass HTML maintenance: every fix is a named transform over page text.
+
+    python execution/html_transforms.py                     # default (safe) transforms
+    python execution/html_transforms.py og-title seo-tags   # opt-in repairs, by name
+    python execution/html_transforms.py --dry-run           # report what would change
+    python execution/html_transforms.py --list
+
+A transform is a function (html, page) -> html registered with
+@transform(name, pages=[...]); `pages` are fnmatch patterns on the page's
+path relative to the repo root ("ko/blog/*.html"), and `page` carries the
+path, its language and a warn() for anything worth reporting. Transforms
+must not touch the filesystem.
+
+The runner finds every published page that at least one selected transform
+applies to, then hands the pages to a process pool. Each worker reads a page
+once, applies the selected transforms in the order given (registry order by
+default), and writes it once, only if the text changed. The report gives, per
+transform, how many pages it ran on, how many it changed and the time it
+took.
+
+Only transforms that leave the checked-in pages untouched are defaults (nav,
+academy-card, h1-headings), so the bare command is a safe check that catches
+drift; tests/test_html_transforms.py keeps it that way. The rest are opt-in
+repairs registered with default=False: they rewrite pages on the current tree
+(og-title, og-description, meta-lengths, seo-tags) or still hold placeholders
+(adsense). Run them by name with --dry-run first and review the diff.
+
+The old one-off scripts are thin wrappers around main(): each passes its
+transform names followed by its own command-line arguments, so --dry-run,
+--workers and --pages work the same through them.
+
+    force_nav.py                  nav, academy-card
+    add_academy_card.py           academy-card
+    fix_h1_headings.py            h1-headings
+    inject_adsense.py             adsense
+    inject_seo_tags.py            seo-tags
+    update_all_og_title.py        og-title
+    update_all_og_description.py  og-description
+    optimize_meta_lengths.py      meta-lengths
+"""
+import os
+import re
+import sys
+import time
+import fnmatch
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# 배포되지 않는 작업 폴더 (precompress.py와 동일)
+SKIP_DIRS = {".git", ".github", ".tmp", "brain", "directives", "execution", "__pycache__", "node_modules"}
+WORKERS = os.cpu_count() or 4
+LANG_PREFIX = {"en": "", "ko": "ko/", "pt": "pt/"}
+
+TRANSFORMS = {}
+
+
+class Transform:
+    def __init__(self, name, fn, pages=("*.html",), default=True):
+        self.name = name
+        self.fn = fn
+        self.pages = list(pages)
+        self.default = default
+
+    def applies_to(self, rel_path):
+        return any(fnmatch.fnmatchcase(rel_path, pattern) for pattern in self.pages)
+
+
+class Page:
+    def __init__(self, path):
+        self.path = path                                    # "ko/blog/sector-energy.html"
+        self.name = os.path.basename(path)
+        self.lang = next((lang for lang, prefix in LANG_PREFIX.items() if prefix and path.startswith(prefix)), "en")
+        self.warnings = []
+
+    def warn(self, message):
+        self.warnings.append(message)
+
+
+def transform(name, pages=("*.html",), default=True):
+    """Decorator registering fn(html, page) -> html as a named transform."""
+    def register(fn):
+        TRANSFORMS[name] = Transform(name, fn, pages, default)
+        return fn
+    return register
+
+
+# ===================================================================
+# Transforms — 기존 일회성 스크립트의 치환 로직을 그대로 옮김
+# ===================================================================
+
+# --- force_nav.py ---------------------------------------------------
+NAV_PAGES = ("index", "list", "calculator", "calendar", "fortune", "blog", "about", "learn")
+# 현재 사이트에 게시된 메뉴와 동일해야 함 — 메뉴를 바꿀 때는 여기부터 수정
+NAV_ITEMS = {
+    "en": [
+        ('href="/blog"', 'US Stock Insights'),
+        ('href="/learn"', 'US Dividend Stock Lessons'),
+        ('href="/list"', 'US Dividend Stock Search'),
+        ('href="/calculator"', 'US Stock Compound Interest'),
+        ('href="/calendar"', 'US Dividend Stock Schedule'),
+        ('href="/fortune"', 'US Stock Comparison'),
+        ('href="/about"', 'US Stock Service Intro'),
+    ],
+    "ko": [
+        ('href="/ko/blog"', '미국 주식 인사이트'),
+        ('href="/ko/learn"', '미국 배당주 강의'),
+        ('href="/ko/list"', '미국 배당주 검색'),
+        ('href="/ko/calculator"', '미국 주식 복리계산'),
+        ('href="/ko/calendar"', '미국 배당주 일정'),
+        ('href="/ko/fortune"', '미국 주식 비교'),
+        ('href="/ko/about"', '미국 주식 서비스 소개'),
+    ],
+    "pt": [
+        ('href="/pt/blog"', 'Insights de Ações dos EUA'),
+        ('href="/pt/learn"', 'Aulas de Ações de Dividendos dos EUA'),
+        ('href="/pt/list"', 'Busca de Ações de Dividendos dos EUA'),
+        ('href="/pt/calculator"', 'Juros Compostos de Ações dos EUA'),
+        ('href="/pt/calendar"', 'Agenda de Ações de Dividendos dos EUA'),
+        ('href="/pt/fortune"', 'Comparação de Ações dos EUA'),
+        ('href="/pt/about"', 'Sobre o Serviço de Ações dos EUA'),
+    ],
+}
+# Find existing nav (glass-nav, main-nav, or just nav immediately after header)
+NAV_PATTERN = re.compile(r'<nav class="(?:glass-nav|main-nav)"[^>]*>.*?</nav>', re.DOTALL)
+HEADER_PATTERN = re.compile(r'(</header>\s*)')
+
+
+def _build_nav(active_href, items):
+    nav_links = []
+    for href, label in items:
+        clean_href = href.replace('href="', '').replace('"', '').replace('.html', '')
+        clean_active = active_href.replace('.html', '')
+        # If it matches exactly OR if it's a sub-path of this section
+        if clean_href == clean_active or (clean_href not in ["/", "/ko/", "/pt/"] and clean_active.startswith(clean_href)):
+            nav_links.append(f'<a {href.replace(".html", "")} class="active">{label}</a>')
+        else:
+            nav_links.append(f'<a {href.replace(".html", "")}>{label}</a>')
+    return '\n        <nav class="glass-nav">\n          ' + '\n          '.join(nav_links) + '\n        </nav>\n'
+
+
+@transform("nav", pages=[f"{prefix}{name}.html" for prefix in LANG_PREFIX.values() for name in NAV_PAGES])
+def force_nav(html, page):
+    """Replace (or insert after </header>) the main nav with the current menu."""
+    stem = os.path.splitext(page.name)[0]
+    active = "/" + LANG_PREFIX[page.lang] + ("" if stem == "index" else stem)
+    new_nav = _build_nav(active, NAV_ITEMS[page.lang])
+    if NAV_PATTERN.search(html):
+        return NAV_PATTERN.sub(new_nav.strip(), html, count=1)
+    if HEADER_PATTERN.search(html):
+        return HEADER_PATTERN.sub(r'\1' + new_nav, html, count=1)
+    page.warn("could not find <header>")
+    return html
+
+
+ACADEMY_CARDS = {
+    "ko": ("배당 아카데미", "초보자부터 실전까지, 배당 투자의 모든 것을 마스터하세요."),
+    "en": ("Dividend Academy", "Master dividend investing from basics to advanced strategies."),
+    "pt": ("Dividend Academy", "Aprenda a investir em dividendos do básico ao avançado."),
+}
+# 카드 링크는 "learn", "/learn", "/ko/learn" 등 여러 형태로 존재
+ACADEMY_LINK = re.compile(r'<a href="(?:/(?:ko/|pt/)?)?learn(?:\.html)?" class="nav-card"')
+
+
+@transform("academy-card", pages=[f"{prefix}index.html" for prefix in LANG_PREFIX.values()])
+def academy_card(html, page):
+    """Add the Dividend Academy card to the homepage nav grid."""
+    if ACADEMY_LINK.search(html) or '<div class="nav-grid">' not in html:
+        return html
+    title, text = ACADEMY_CARDS[page.lang]
+    card = f"""                    <a href="learn" class="nav-card">
+                        <i class="fas fa-graduation-cap"></i>
+                        <h3>{title}</h3>
+                        <p>{text}</p>
+                    </a>
+"""
+    return html.replace('<div class="nav-grid">\n', f'<div class="nav-grid">\n{card}')
+
+
+# --- inject_adsense.py ----------------------------------------------
+PUB_ID = "ca-pub-XXXXXXXXXXXXXXXX"
+SLOT_ID = "XXXXXXXXXX"
+
+HEADER_AD = f'''
+        <!-- Google AdSense - Header Banner -->
+        <div class="ad-slot">
+            <ins class="adsbygoogle" style="display:block" data-ad-client="{PUB_ID}"
+                data-ad-slot="{SLOT_ID}" data-ad-format="horizontal" data-full-width-responsive="true"></ins>
+            <script>
+                (adsbygoogle = window.adsbygoogle || []).push({{}});
+            </script>
+        </div>'''
+
+FOOTER_AD = f'''
+        <!-- Google AdSense - Footer Banner -->
+        <div class="ad-slot" style="margin-top: 2rem;">
+            <ins class="adsbygoogle" style="display:block" data-ad-client="{PUB_ID}"
+                data-ad-slot="{SLOT_ID}" data-ad-format="auto" data-full-width-responsive="true"></ins>
+            <script>
+                (adsbygoogle = window.adsbygoogle || []).push({{}});
+            </script>
+        </div>'''
+
+
+@transform("adsense", default=False)              # PUB_ID / SLOT_ID가 아직 자리표시자 — 명시할 때만 실행
+def inject_adsense(html, page):
+    """Fill empty ad slots and add header/footer banners where missing."""
+    empty_slot = '<div class="ad-slot"></div>'
+    if empty_slot in html:
+        html = html.replace(empty_slot, HEADER_AD, 1)     # First one is header
+        if empty_slot in html:
+            html = html.replace(empty_slot, FOOTER_AD)
+    if "<!-- Google AdSense - Header Banner -->" not in html and "</header>" in html:
+        html = html.replace("</header>", f"</header>\n{HEADER_AD}")
+    # Footer banner goes right before <footer>
+    if "<!-- Google AdSense - Footer Banner -->" not in html and "data-ad-slot" not in html[html.find("<footer"):]:
+        if "<footer>" in html:
+            html = html.replace("<footer>", f"{FOOTER_AD}\n<footer>")
+    return html
+
+
+# --- update_all_og_title.py / update_all_og_description.py ----------
+OG_TITLE = re.compile(r'<meta property="og:title"\s+content=".*?"\s*\/?>', re.DOTALL | re.IGNORECASE)
+OG_DESCRIPTION = re.compile(r'<meta property="og:description"\s+content=".*?"\s*\/?>', re.DOTALL | re.IGNORECASE)
+DEFAULT_DESC = ("Discover top-rated US dividend stocks, simulate compound interest growth with the Snowball "
+                "Calculator, and track dividend payment dates.")
+
+
+@transform("og-title", default=False)
+def og_title(html, page):
+    """og:title mirrors <title>."""
+    title_match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
+    if not title_match:
+        return html
+    title = re.sub(r'\s+', ' ', title_match.group(1).replace('\n', ' ').strip())
+    og_title_tag = f'<meta property="og:title" content="{title}">'
+    if OG_TITLE.search(html):
+        return OG_TITLE.sub(lambda m: og_title_tag, html)
+    # Insert after <title>
+    return html.replace(title_match.group(0), title_match.group(0) + f'\n    {og_title_tag}')
+
+
+@transform("og-description", default=False)
+def og_description(html, page):
+    """og:description mirrors the meta description (adding one if the page has none)."""
+    desc_match = re.search(r'<meta name="description"\s+content="(.*?)"', html, re.DOTALL | re.IGNORECASE) \
+        or re.search(r'<meta content="(.*?)"\s+name="description"', html, re.DOTALL | re.IGNORECASE)
+    if desc_match:
+        description = re.sub(r'\s+', ' ', desc_match.group(1).replace('\n', ' ').strip())
+    else:
+        # Try to use title, otherwise default
+        title_match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE)
+        description = f"{title_match.group(1).strip()} - {DEFAULT_DESC}" if title_match else DEFAULT_DESC
+
+    og_desc_tag = f'<meta property="og:description" content="{description}">'
+    if OG_DESCRIPTION.search(html):
+        return OG_DESCRIPTION.sub(lambda m: og_desc_tag, html)
+    meta_desc_full = re.search(r'<meta[^>]*name="description"[^>]*>', html, re.IGNORECASE)
+    if meta_desc_full:
+        return html.replace(meta_desc_full.group(0), meta_desc_full.group(0) + f'\n    {og_desc_tag}')
+    title_full = re.search(r'<title>.*?</title>', html, re.IGNORECASE)
+    if title_full:
+        return html.replace(title_full.group(0), title_full.group(0)
+                            + f'\n    <meta name="description" content="{description}">\n    {og_desc_tag}')
+    if '</head>' in html:
+        return html.replace('</head>', f'    <meta name="description" content="{description}">\n    {og_desc_tag}\n</head>')
+    return html
+
+
+# --- fix_h1_headings.py ---------------------------------------------
+H1_CATEGORIES = {
+    "blog": {"en": "US Stock Insights", "ko": "미국 주식 인사이트", "pt": "Insights de Ações dos EUA"},
+    "edu": {"en": "US Dividend Stock Lessons", "ko": "미국 배당주 강의", "pt": "Aulas de Ações de Dividendos dos EUA"},
+}
+# Prefixes to clean up from titles to ensure idempotency
+H1_PREFIXES = [f"{label}:" for labels in H1_CATEGORIES.values() for label in labels.values()]
+HERO_PATTERN = re.compile(r'(<section class="post-hero">[\s\S]*?)(<h1[^>]*>)([\s\S]*?)(</h1>)([\s\S]*?</section>)',
+                          re.IGNORECASE)
+FIRST_H1_PATTERN = re.compile(r'(<h1[^>]*>)([\s\S]*?)(</h1>)', re.IGNORECASE)
+
+
+def _clean_h1(text):
+    text = text.strip()
+    for prefix in H1_PREFIXES:
+        if text.startswith(prefix):
+            text = text[len(prefix):].strip()
+    return text
+
+
+def _demote_h1(text):
+    text = re.sub(r'<h1([^>]*)>', r'<h2\1>', text, flags=re.IGNORECASE)
+    return re.sub(r'</h1>', r'</h2>', text, flags=re.IGNORECASE)
+
+
+@transform("h1-headings", pages=[f"{prefix}blog/*.html" for prefix in LANG_PREFIX.values()])
+def fix_h1_headings(html, page):
+    """One category-prefixed <h1> in the post hero; any other <h1> becomes <h2>."""
+    # 파일명이 날짜로 시작하면 일일 시황, 아니면 교육 글
+    category = H1_CATEGORIES["blog" if re.match(r'^\d{4}-\d{2}-\d{2}', page.name) else "edu"][page.lang]
+
+    hero_match = HERO_PATTERN.search(html)
+    if hero_match:
+        before_h1, h1_start, h1_inner, h1_end, after_h1 = hero_match.groups()
+        new_hero = f"{before_h1}{h1_start}{category}: {_clean_h1(h1_inner)}{h1_end}{after_h1}"
+        html = html[:hero_match.start()] + new_hero + html[hero_match.end():]
+    else:
+        first_h1 = FIRST_H1_PATTERN.search(html)
+        if first_h1:
+            h1_start, h1_inner, h1_end = first_h1.groups()
+            html = html[:first_h1.start()] + f"{h1_start}{category}: {_clean_h1(h1_inner)}{h1_end}" + html[first_h1.end():]
+        else:
+            page.warn("no h1 tag found")
+
+    # Any other h1 after the hero section becomes h2
+    hero_end = re.search(r'</section>\s*<main', html, re.IGNORECASE)
+    if hero_end:
+        return html[:hero_end.start()] + _demote_h1(html[hero_end.start():])
+    h1_matches = list(re.finditer(r'<h1[^>]*>[\s\S]*?</h1>', html, re.IGNORECASE))
+    if len(h1_matches) > 1:
+        split_at = h1_matches[0].end()
+        return html[:split_at] + _demote_h1(html[split_at:])
+    return html
+
+
+# --- optimize_meta_lengths.py ---------------------------------------
+META_OPTIMIZATIONS = {
+    # English Root Pages
+    "index.html": {
+        "title": "US Dividend Stocks Home | WiseAIWiseU",
+        "desc": "The starting point for US stock and US dividend stock investment analysis. Check real-time dividend info, rankings, and snowball calculator."
+    },
+    "list.html": {
+        "title": "Top U.S. Dividend Stocks Rank & Screener | WiseAIWiseU",
+        "desc": "Find the best premium US dividend stocks using our advanced screener. Custom filter options for payout ratio, yield, growth, and cash flow."
+    },
+    "calculator.html": {
+        "title": "U.S. Dividend Compound & DRIP Calculator | WiseAIWiseU",
+        "desc": "Predict asset changes when reinvesting U.S. stock dividends. Simulate the snowball effect with DRIP and annual dividend growth rates."
+    },
+    "calendar.html": {
+        "title": "U.S. Stock Ex-Dividend & Payout Calendar | WiseAIWiseU",
+        "desc": "Check U.S. stock ex-dividend dates and payout schedules. Access a comprehensive, real-time calendar of this month's dividend events."
+    },
+    "fortune.html": {
+        "title": "U.S. Stock Portfolio Health & Diversity Tool | WiseAIWiseU",
+        "desc": "Analyze correlation and check your U.S. stock portfolio health. Discover if your favorite dividend stocks match your investment style."
+    },
+    "blog.html": {
+        "title": "U.S. Market News & Dividend Stock Analysis | WiseAIWiseU",
+        "desc": "Explore latest market trends and in-depth analysis focused on U.S. dividend stocks. Gain insights to optimize your passive income portfolio."
+    },
+    "learn.html": {
+        "title": "U.S. Dividend Growth Course for Beginners | WiseAIWiseU",
+        "desc": "Access systematic educational guides from U.S. dividend stock basics to advanced financial analysis. Learn to build a passive income portfolio."
+    },
+    # Portuguese Pages
+    "pt/index.html": {
+        "title": "Home de Ações de Dividendos dos EUA | WiseAIWiseU",
+        "desc": "O ponto de partida para análise de investimentos em ações dos EUA. Confira informações de dividendos em tempo real, classificações e calculadoras."
+    },
+    "pt/list.html": {
+        "title": "Buscador e Ranking de Ações de Dividendos EUA | WiseAIWiseU",
+        "desc": "Encontre as melhores ações de dividendos dos EUA. Filtre ações por rendimento, payout ratio, crescimento de dividendos e fluxo de caixa livre."
+    },
+    "pt/calculator.html": {
+        "title": "Calculadora de Juros Compostos e DRIP dos EUA | WiseAIWiseU",
+        "desc": "Simule o crescimento do seu portfólio de dividendos dos EUA. Calcule o efeito bola de neve com reinvestimento automático (DRIP) e juros compostos."
+    },
+    "pt/calendar.html": {
+        "title": "Datas Ex-Dividendos e Calendário de Ações EUA | WiseAIWiseU",
+        "desc": "Entenda a Data Ex-Dividendo, a Data de Registro e a Data de Pagamento. Saiba como montar um portfólio de dividendos mensais combinando ações trimestrais."
+    },
+    "pt/fortune.html": {
+        "title": "Diagnóstico e Diversificação de Portfólio EUA | WiseAIWiseU",
+        "desc": "Descubra seu MBTI de investidor! Confira a compatibilidade com uma ação e aprenda o método 'Sleep-Well-At-Night Investing' para resistir aos mercados em queda."
+    },
+    "pt/blog.html": {
+        "title": "Análise e Notícias do Mercado de Ações dos EUA | WiseAIWiseU",
+        "desc": "Acompanhe as tendências e análises aprofundadas sobre ações de dividendos dos EUA. Descubra as melhores estratégias para sua carteira de investimentos."
+    },
+    "pt/learn.html": {
+        "title": "Curso de Dividendos dos EUA para Iniciantes | WiseAIWiseU",
+        "desc": "Aprenda a investir em dividendos dos EUA. Conteúdo educativo completo do básico sobre juros compostos à análise financeira de empresas."
+    }
+}
+
+
+@transform("meta-lengths", pages=list(META_OPTIMIZATIONS), default=False)
+def optimize_meta_lengths(html, page):
+    """Hand-tuned title / description (and their og: copies) for the main pages."""
+    new_title = META_OPTIMIZATIONS[page.path]["title"]
+    new_desc = META_OPTIMIZATIONS[page.path]["desc"]
+    replacements = [
+        (r'<title[^>]*>([\s\S]*?)</title>', f'<title>{new_title}</title>'),
+        (r'<meta\s+property="og:title"\s+content="[^"]*"[^>]*>', f'<meta property="og:title" content="{new_title}">'),
+        (r'<meta\s+content="[^"]*"\s+property="og:title"[^>]*>', f'<meta content="{new_title}" property="og:title">'),
+        (r'<meta\s+name="description"\s+content="[^"]*"[^>]*>', f'<meta name="description" content="{new_desc}">'),
+        (r'<meta\s+content="[^"]*"\s+name="description"[^>]*>', f'<meta content="{new_desc}" name="description">'),
+        (r'<meta\s+property="og:description"\s+content="[^"]*"[^>]*>', f'<meta property="og:description" content="{new_desc}">'),
+        (r'<meta\s+content="[^"]*"\s+property="og:description"[^>]*>', f'<meta content="{new_desc}" property="og:description">'),
+    ]
+    for pattern, tag in replacements:
+        html = re.sub(pattern, lambda m: tag, html, flags=re.IGNORECASE)
+    return html
+
+
+# --- inject_seo_tags.py ---------------------------------------------
+BASE_URL = "https://wiseaiwiseu.com"
+SEO_PAGES = ["index.html", "list.html", "blog.html", "calculator.html", "calendar.html", "fortune.html",
+             "privacy.html", "about.html", "contact.html"]
+
+
+# 기존 canonical / hreflang 줄 (다른 rel="alternate" 링크는 건드리지 않음)
+SEO_LINK_LINE = re.compile(r'[ \t]*<link rel="(?:canonical"|alternate" hreflang=)[^>]*>[ \t]*\n?')
+
+
+def _page_url(lang, name):
+    """Published URL of a page: per-language folder, no .html, "/" for index."""
+    stem = os.path.splitext(name)[0]
+    return f"{BASE_URL}/{LANG_PREFIX[lang]}{'' if stem == 'index' else stem}"
+
+
+@transform("seo-tags", pages=[f"{prefix}{name}" for prefix in LANG_PREFIX.values() for name in SEO_PAGES],
+           default=False)                         # ko/pt privacy.html의 빠진 x-default를 추가함 — 명시할 때만 실행
+def inject_seo_tags(html, page):
+    """Canonical and hreflang links, rewritten in place (before </head> if the page has none)."""
+    urls = {lang: _page_url(lang, page.name) for lang in LANG_PREFIX}
+    tags = [f'<link rel="canonical" href="{urls[page.lang]}" />'] \
+        + [f'<link rel="alternate" hreflang="{lang}" href="{urls[lang]}" />' for lang in LANG_PREFIX] \
+        + [f'<link rel="alternate" hreflang="x-default" href="{urls["en"]}" />']
+    existing = list(SEO_LINK_LINE.finditer(html))
+    if not existing:
+        if "</head>" not in html:
+            return html
+        return html.replace("</head>", "".join(f"    {tag}\n" for tag in tags) + "</head>", 1)
+    # 첫 태그 자리에 같은 들여쓰기로 다시 씀 — 이미 맞는 페이지는 바이트 단위로 그대로
+    first = existing[0]
+    indent = first.group(0)[:len(first.group(0)) - len(first.group(0).lstrip(" \t"))]
+    block = "".join(f"{indent}{tag}\n" for tag in tags)
+    parts, pos = [], 0
+    for k, m in enumerate(existing):
+        parts.append(html[pos:m.start()])
+        if k == 0:
+            parts.append(block)
+        pos = m.end()
+    parts.append(html[pos:])
+    return "".join(parts)
+
+
+# ===================================================================
+# Runner
+# ===================================================================
+
+def find_pages(transforms):
+    """Repo-relative paths of published pages that any of the transforms applies to."""
+    found = []
+    for root, dirs, files in os.walk(BASE_DIR):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if name.endswith(".html"):
+                rel_path = os.path.relpath(os.path.join(root, name), BASE_DIR).replace(os.sep, "/")
+                if any(t.applies_to(rel_path) for t in transforms):
+                    found.append(rel_path)
+    return sorted(found)
+
+
+def process_page(rel_path, names, dry_run=False):
+    """Read one page, apply the named transforms in order, write it once.
+
+    Returns (rel_path, written, {name: (seconds, changed, error)}, warnings).
+    """
+    page = Page(rel_path)
+    path = os.path.join(BASE_DIR, rel_path)
+    with open(path, "r", encoding="utf-8") as f:
+        original = html = f.read()
+
+    stats = {}
+    for name in names:
+        t = TRANSFORMS[name]
+        if not t.applies_to(rel_path):
+            continue
+        started = time.perf_counter()
+        error = None
+        try:
+            new_html = t.fn(html, page)
+        except Exception as e:
+            new_html, error = html, f"{type(e).__name__}: {e}"
+        stats[name] = (time.perf_counter() - started, new_html != html, error)
+        html = new_html
+
+    written = html != original
+    if written and not dry_run:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+    return rel_path, written, stats, page.warnings
+
+
+def _process(args):
+    return process_page(*args)
+
+
+def run(names=None, paths=None, dry_run=False, workers=WORKERS):
+    """Apply transforms to every matching page; returns {name: {"pages", "changed", "errors", "seconds"}}."""
+    names = list(names or [n for n, t in TRANSFORMS.items() if t.default])
+    unknown = [n for n in names if n not in TRANSFORMS]
+    if unknown:
+        raise KeyError(f"Unknown transform(s) {', '.join(unknown)} (known: {', '.join(TRANSFORMS)})")
+    transforms = [TRANSFORMS[n] for n in names]
+    if paths:
+        pages = sorted(os.path.relpath(os.path.abspath(p), BASE_DIR).replace(os.sep, "/") for p in paths)
+    else:
+        pages = find_pages(transforms)
+
+    started = time.perf_counter()
+    jobs = [(rel_path, names, dry_run) for rel_path in pages]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_process, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    else:
+        results = [_process(job) for job in jobs]
+
+    totals = {n: {"pages": 0, "changed": 0, "errors": 0, "seconds": 0.0} for n in names}
+    written = 0
+    for rel_path, page_written, stats, warnings in results:
+        written += page_written
+        for name, (seconds, changed, error) in stats.items():
+            t = totals[name]
+            t["pages"] += 1
+            t["changed"] += changed
+            t["seconds"] += seconds
+            if error:
+                t["errors"] += 1
+                print(f"  [error] {rel_path}: {name}: {error}")
+        for message in warnings:
+            print(f"  [warn] {rel_path}: {message}")
+    print(f"[*] {len(pages)} page(s) read once, {written} {'would be ' if dry_run else ''}written "
+          f"in {time.perf_counter() - started:.2f}s ({workers} worker(s))")
+    return totals
+
+
+def report(totals):
+    for name, t in totals.items():
+        per_page = t["seconds"] / t["pages"] * 1000 if t["pages"] else 0
+        errors = f" | {t['errors']} error(s)" if t["errors"] else ""
+        print(f"  [transform] {name:<15} {t['pages']:>5} pages {t['changed']:>5} changed "
+              f"{t['seconds']:>7.3f}s ({per_page:.2f} ms/page){errors}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply HTML maintenance transforms in a single pass")
+    parser.add_argument("transforms", nargs="*",
+                        help=f"transforms to apply, in order (default: {', '.join(n for n, t in TRANSFORMS.items() if t.default)})")
+    parser.add_argument("--pages", nargs="+", metavar="PATH", help="only these pages (default: every matching page)")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    parser.add_argument("--workers", type=int, default=WORKERS, help=f"process pool size (default: {WORKERS})")
+    parser.add_argument("--list", action="store_true", help="list registered transforms and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, t in TRANSFORMS.items():
+            doc = (t.fn.__doc__ or "").strip().split("\n")[0]
+            print(f"{name:<15} {'' if t.default else '(opt-in) '}{doc}")
+            print(f"{'':<15} pages: {', '.join(t.pages)}")
+        return
+    try:
+        report(run(args.transforms, args.pages, args.dry_run, args.workers))
+    except KeyError as e:
+        sys.exit(f"[!] {e.args[0]}")
+
+
+if __name__ == "__main__":
+    main()
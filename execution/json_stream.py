@@ -0,0 +1,150 @@
+"""
+Incremental scanner for a streamed top-level JSON object.
+
+    scanner = ObjectStreamScanner()
+    for chunk in response:                       # streamed model output
+        for key, value in scanner.feed(chunk.text):
+            print(key, "complete")               # each member, as soon as it closes
+
+The scanner walks every character exactly once, tracking strings, escapes
+and bracket nesting. As soon as a top-level member's value closes it is
+parsed with json.loads and yielded, so completed members survive even if
+the stream is later truncated. Anything that can never become valid JSON
+(text before the opening brace, mismatched brackets, a missing colon or
+comma between members, trailing garbage) raises StreamError at the offending
+character, so the caller can stop consuming the stream immediately.
+"""
+import json
+
+WHITESPACE = " \t\r\n"
+_CLOSERS = {"}": "{", "]": "["}
+
+
+class StreamError(ValueError):
+    """The stream can no longer form a valid JSON object."""
+
+
+class ObjectStreamScanner:
+    def __init__(self):
+        self.text = ""
+        self.pos = 0
+        self.values = {}          # completed top-level members, in arrival order
+        self.done = False         # closing brace of the top-level object seen
+        self._started = False
+        self._expect = "key"      # at depth 1: key | colon | value | comma
+        self._stack = []          # open containers below the top-level object
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+        self._scalar = False
+
+    @property
+    def depth(self):
+        return (1 if self._started and not self.done else 0) + len(self._stack)
+
+    def _fail(self, message):
+        context = self.text[max(0, self.pos - 20):self.pos + 1]
+        raise StreamError(f"{message} at offset {self.pos} (…{context!r})")
+
+    def _complete(self, end):
+        raw = self.text[self._value_start:end]
+        try:
+            value = json.loads(raw)
+        except ValueError as e:
+            self._fail(f"Invalid value for {self._key!r}: {e}")
+        self.values[self._key] = value
+        self._value_start = None
+        self._expect = "comma"
+        return self._key, value
+
+    def feed(self, chunk):
+        """Consume chunk; return the list of (key, value) members completed by it."""
+        self.text += chunk
+        completed = []
+        text = self.text
+        while self.pos < len(text):
+            ch = text[self.pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if not self._stack:
+                        if self._expect == "key":
+                            self._key = json.loads(text[self._key_start:self.pos + 1])
+                            self._expect = "colon"
+                        else:
+                            completed.append(self._complete(self.pos + 1))
+                self.pos += 1
+                continue
+
+            if self._scalar:
+                if ch in ",}" + WHITESPACE:
+                    self._scalar = False
+                    completed.append(self._complete(self.pos))
+                    continue            # re-examine the delimiter at depth 1
+                self.pos += 1
+                continue
+
+            if self.done or not self._started:
+                if ch in WHITESPACE:
+                    pass
+                elif not self._started and ch == "{":
+                    self._started = True
+                else:
+                    self._fail("Unexpected character outside the top-level object")
+                self.pos += 1
+                continue
+
+            if self._stack:
+                if ch == '"':
+                    self._in_string = True
+                elif ch in "{[":
+                    self._stack.append(ch)
+                elif ch in _CLOSERS:
+                    if self._stack.pop() != _CLOSERS[ch]:
+                        self._fail("Mismatched bracket")
+                    if not self._stack:
+                        completed.append(self._complete(self.pos + 1))
+                self.pos += 1
+                continue
+
+            # Depth 1: between the members of the top-level object
+            if ch in WHITESPACE:
+                pass
+            elif self._expect == "key":
+                if ch == '"':
+                    self._in_string = True
+                    self._key_start = self.pos
+                elif ch == "}" and not self.values:
+                    self.done = True
+                else:
+                    self._fail("Expected a member name")
+            elif self._expect == "colon":
+                if ch != ":":
+                    self._fail("Expected ':'")
+                self._expect = "value"
+            elif self._expect == "value":
+                self._value_start = self.pos
+                if ch == '"':
+                    self._in_string = True
+                elif ch in "{[":
+                    self._stack.append(ch)
+                elif ch in "-0123456789tfn":
+                    self._scalar = True
+                else:
+                    self._fail("Expected a value")
+            elif self._expect == "comma":
+                if ch == ",":
+                    self._expect = "key"
+                elif ch == "}":
+                    self.done = True
+                else:
+                    self._fail("Expected ',' or '}'")
+            self.pos += 1
+        return completed
@@ -0,0 +1,110 @@
+"""
+Content-addressed cache for LLM responses, shared by every Gemini script.
+
+    import llm_cache
+    text = llm_cache.cached(model_name, prompt, config,
+                            lambda: model.generate_content(prompt).text)
+
+The key is sha256 over the normalized prompt (line-trimmed, blank lines
+dropped), the model name and the generation config (sorted JSON), so a
+rerun with the same ticker, price and news costs no quota. Entries live in
+.tmp/llm_cache/<2-char shard>/<key>.json and expire after the TTL: the
+`ttl` argument, else LLM_CACHE_TTL_HOURS from the environment, else
+DEFAULT_TTL. Only values accepted by `valid` (non-empty by default) are
+stored. The cache is bypassed under a cassette so recordings stay complete.
+"""
+import os
+import json
+import hashlib
+import datetime
+
+import cassette
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CACHE_DIR = os.path.join(BASE_DIR, ".tmp", "llm_cache")
+DEFAULT_TTL = datetime.timedelta(days=3)
+
+_purged = False
+
+
+def default_ttl():
+    hours = os.getenv("LLM_CACHE_TTL_HOURS")
+    try:
+        return datetime.timedelta(hours=float(hours)) if hours else DEFAULT_TTL
+    except ValueError:
+        print(f"  [warn] Ignoring invalid LLM_CACHE_TTL_HOURS={hours!r}")
+        return DEFAULT_TTL
+
+
+def normalize_prompt(prompt):
+    """Strip indentation and blank lines so formatting-only edits still hit."""
+    return "\n".join(line.strip() for line in prompt.strip().splitlines() if line.strip())
+
+
+def cache_key(model_name, prompt, config=None):
+    payload = json.dumps({"model": model_name, "config": config or {},
+                          "prompt": normalize_prompt(prompt)}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+
+def get(key, ttl=None):
+    """Cached value for key, or None if missing or older than ttl."""
+    path = _path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    created = datetime.datetime.fromisoformat(entry["created"])
+    if datetime.datetime.now() - created > (ttl or default_ttl()):
+        return None
+    return entry["value"]
+
+
+def put(key, value, model_name=""):
+    path = _path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"model": model_name, "created": datetime.datetime.now().isoformat(timespec="seconds"),
+                   "value": value}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def purge(ttl=None):
+    """Delete expired entries; returns the number removed."""
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+    cutoff = datetime.datetime.now().timestamp() - (ttl or default_ttl()).total_seconds()
+    removed = 0
+    for shard in os.scandir(CACHE_DIR):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+    return removed
+
+
+def cached(model_name, prompt, config, generate, ttl=None, valid=bool):
+    """Return the cached response for (model, prompt, config) or generate() it."""
+    global _purged
+    if cassette.active():
+        return generate()
+    key = cache_key(model_name, prompt, config)
+    value = get(key, ttl)
+    if value is not None:
+        print(f"  [llm-cache] hit {model_name} {key[:12]}")
+        return value
+    value = generate()
+    if valid(value):
+        if not _purged:
+            _purged = True
+            purge(ttl)
+        put(key, value, model_name)
+    return value
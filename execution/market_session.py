@@ -0,0 +1,95 @@
+"""
+In-run market data session for auto_poster.
+
+One MarketDataSession per run prefetches a single 3-month OHLCV panel for every
+eligible ticker (via the local history store) and serves all later price,
+change and chart lookups from that panel, so no ticker is fetched twice.
+dividend_insights.json is read at most once and indexed by ticker.
+"""
+import os
+import json
+import math
+import datetime
+
+import pandas as pd
+
+import history_store
+import cassette
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+INSIGHTS_PATH = os.path.join(BASE_DIR, "dividend_insights.json")
+
+WINDOW_DAYS = 92        # ~3 months of calendar days
+HISTORY_DEPTH = "1y"    # backfill depth for tickers new to the store
+
+
+class MarketDataSession:
+    def __init__(self, window_days=WINDOW_DAYS, depth=HISTORY_DEPTH):
+        self.window_days = window_days
+        self.depth = depth
+        self.panel = {}           # field -> dates x tickers DataFrame
+        self._loaded = set()      # tickers already requested from the store
+        self._insights = None     # ticker -> dividend_insights row
+
+    @property
+    def start(self):
+        return cassette.today() - datetime.timedelta(days=self.window_days)
+
+    def prefetch(self, tickers):
+        """Update the store once for all tickers and load the shared panel."""
+        tickers = list(dict.fromkeys(tickers))
+        history_store.update(tickers, depth=self.depth)
+        self.panel = history_store.load_panels(tickers, start=self.start)
+        self._loaded.update(tickers)
+        print(f"  [session] Panel ready: {self.panel['Close'].shape[1]} tickers x "
+              f"{self.panel['Close'].shape[0]} bars")
+        return self.panel
+
+    def _ensure(self, ticker):
+        """Load a ticker outside the prefetched set (e.g. full-pool fallback)."""
+        if ticker in self._loaded:
+            return
+        self._loaded.add(ticker)
+        if history_store.load(ticker) is None:
+            history_store.update([ticker], depth=self.depth)
+        extra = history_store.load_panels([ticker], start=self.start)
+        for field, frame in extra.items():
+            base = self.panel.get(field)
+            self.panel[field] = frame if base is None or base.empty else base.join(frame, how="outer")
+
+    def frame(self, field="Close"):
+        return self.panel.get(field)
+
+    def closes(self, ticker):
+        """3-month close series for ticker (NaNs dropped)."""
+        self._ensure(ticker)
+        close = self.panel.get("Close")
+        if close is None or ticker not in close.columns:
+            return pd.Series(dtype=float)
+        return close[ticker].dropna()
+
+    def price(self, ticker):
+        closes = self.closes(ticker)
+        return float(closes.iloc[-1]) if len(closes) else math.nan
+
+    def change(self, ticker):
+        """Last one-day change in percent."""
+        closes = self.closes(ticker)
+        if len(closes) < 2 or closes.iloc[-2] == 0:
+            return math.nan
+        return float((closes.iloc[-1] - closes.iloc[-2]) / closes.iloc[-2] * 100)
+
+    def chart_series(self, ticker):
+        """(dates, prices) lists for the 3-month chart."""
+        closes = self.closes(ticker)
+        return list(closes.index), [float(p) for p in closes.tolist()]
+
+    def insight(self, ticker):
+        """dividend_insights.json row for ticker, or None (hash lookup)."""
+        if self._insights is None:
+            self._insights = {}
+            if os.path.exists(INSIGHTS_PATH):
+                with open(INSIGHTS_PATH, "r", encoding="utf-8") as f:
+                    stocks = json.load(f).get("stocks", [])
+                self._insights = {s["ticker"]: s for s in stocks}
+        return self._insights.get(ticker)
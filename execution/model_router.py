@@ -0,0 +1,165 @@
+"""
+Adaptive Gemini model routing backed by persisted health statistics.
+
+    router = ModelRouter()
+    for model_name in router.order(candidates):
+        ...
+        router.record(model_name, error, latency)
+
+.tmp/model_stats.json keeps, per model: call / success counts, the most
+recent latencies (for p50 / p95), and when its quota was exhausted plus the
+time it resets. Gemini's free-tier daily quotas reset at midnight Pacific
+time, so a model that reported a per-day 429 is skipped until then instead
+of being rediscovered every run. Per-minute 429s put the model on a short
+cooldown taken from the server's retry hint (retry_delay / Retry-After /
+"retry in Ns"). order() puts available models first, best smoothed
+success rate first, then lowest p50 latency.
+"""
+import os
+import re
+import json
+import threading
+import datetime
+from zoneinfo import ZoneInfo
+
+import cassette
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+STATS_PATH = os.path.join(BASE_DIR, ".tmp", "model_stats.json")
+
+QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+LATENCY_WINDOW = 50             # latencies kept per model
+DEFAULT_LATENCY = 30.0          # seconds assumed for a model never measured
+DEFAULT_RETRY_DELAY = 35.0      # 429 without a hint: free-tier per-minute window
+
+_RETRY_PATTERNS = (
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+(?:\.\d+)?)"),
+    re.compile(r"retry[- ]after:?\s*(\d+(?:\.\d+)?)", re.IGNORECASE),
+    re.compile(r"retry in\s*(\d+(?:\.\d+)?)\s*s", re.IGNORECASE),
+)
+
+
+def is_rate_limited(error):
+    return bool(error) and ("429" in error or "ResourceExhausted" in error or "quota" in error.lower())
+
+
+def is_daily_quota(error):
+    return bool(error) and ("PerDay" in error or "limit: 0" in error)
+
+
+def retry_delay(error):
+    """Seconds the server asked us to wait, or None if the error has no hint."""
+    for pattern in _RETRY_PATTERNS:
+        m = pattern.search(error or "")
+        if m:
+            return float(m.group(1))
+    return None
+
+
+def next_quota_reset(now):
+    """Next midnight Pacific time after `now` (aware datetime), in UTC."""
+    local = now.astimezone(QUOTA_TZ)
+    midnight = datetime.datetime.combine(local.date() + datetime.timedelta(days=1),
+                                         datetime.time(0), tzinfo=QUOTA_TZ)
+    return midnight.astimezone(datetime.timezone.utc)
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class ModelRouter:
+    def __init__(self, path=None):
+        # Cassette runs are hermetic: start from empty stats in the scratch dir
+        self.path = path or (os.path.join(cassette.scratch_dir("router"), "model_stats.json")
+                             if cassette.active() else STATS_PATH)
+        self._lock = threading.Lock()
+        self.stats = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.stats = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"  [warn] Model stats unreadable, starting fresh: {e}")
+
+    @staticmethod
+    def _now():
+        return cassette.now().astimezone(datetime.timezone.utc)
+
+    def _entry(self, model_name):
+        return self.stats.setdefault(model_name, {
+            "calls": 0, "successes": 0, "latencies": [],
+            "exhausted_at": None, "exhausted_until": None, "cooldown_until": None,
+        })
+
+    def _blocked_until(self, entry):
+        now = self._now()
+        until = [datetime.datetime.fromisoformat(entry[k]) for k in ("exhausted_until", "cooldown_until")
+                 if entry.get(k)]
+        until = [u for u in until if u > now]
+        return max(until) if until else None
+
+    def available(self, model_name):
+        with self._lock:
+            return self._blocked_until(self._entry(model_name)) is None
+
+    def summary(self, model_name):
+        entry = self.stats.get(model_name, {})
+        lat = entry.get("latencies") or []
+        return {
+            "success_rate": (entry.get("successes", 0) + 1) / (entry.get("calls", 0) + 2),
+            "p50": _percentile(lat, 0.5) if lat else None,
+            "p95": _percentile(lat, 0.95) if lat else None,
+        }
+
+    def order(self, candidates):
+        """Available models best-first; blocked ones are dropped (all blocked → soonest reset)."""
+        with self._lock:
+            blocked = {m: self._blocked_until(self._entry(m)) for m in candidates}
+        ready = [m for m in candidates if blocked[m] is None]
+        for m in candidates:
+            if blocked[m] is not None:
+                print(f"  [router] {m} unavailable until {blocked[m]:%Y-%m-%d %H:%M} UTC")
+        if not ready:
+            return sorted(candidates, key=lambda m: blocked[m])[:1]
+
+        def score(m):
+            s = self.summary(m)
+            return (-round(s["success_rate"], 2), s["p50"] if s["p50"] is not None else DEFAULT_LATENCY)
+        # sorted() is stable, so ties keep the caller's preference order
+        return sorted(ready, key=score)
+
+    def record(self, model_name, error, latency):
+        """Record one call's outcome; returns the wait (s) the server asked for, if any."""
+        now = self._now()
+        wait = None
+        with self._lock:
+            entry = self._entry(model_name)
+            entry["calls"] += 1
+            if error is None:
+                entry["successes"] += 1
+                entry["latencies"] = (entry["latencies"] + [round(latency, 2)])[-LATENCY_WINDOW:]
+                entry["cooldown_until"] = None
+            elif is_daily_quota(error):
+                entry["exhausted_at"] = now.isoformat(timespec="seconds")
+                entry["exhausted_until"] = next_quota_reset(now).isoformat(timespec="seconds")
+            elif is_rate_limited(error):
+                wait = retry_delay(error) or DEFAULT_RETRY_DELAY
+                entry["cooldown_until"] = (now + datetime.timedelta(seconds=wait)).isoformat(timespec="seconds")
+            self._save()
+        return wait
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.stats, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def report(self):
+        for name in sorted(m for m, e in self.stats.items() if e.get("calls")):
+            s = self.summary(name)
+            p50 = f"{s['p50']:.1f}s" if s["p50"] is not None else "-"
+            p95 = f"{s['p95']:.1f}s" if s["p95"] is not None else "-"
+            print(f"  [router] {name:<26} success {s['success_rate']:.0%} | p50 {p50} | p95 {p95}")
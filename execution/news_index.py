@@ -0,0 +1,157 @@
+"""
+Per-ticker inverted index over the news store.
+
+Every stored headline is tagged with the tickers it mentions, either by symbol
+("NVDA", "$T") or by company name ("Procter & Gamble", "Nvidia"). The result
+is kept inside the news store as {ticker: [item ids, newest first]}, so
+headlines_for(store, ticker) is a dict lookup plus a short deduplicating walk.
+
+Aliases come from dividend_insights.json company names plus EXTRA_ALIASES for
+pool tickers the insights file does not cover. When the alias set changes the
+index is rebuilt from scratch; otherwise only newly ingested items are tagged.
+"""
+import re
+import json
+import hashlib
+
+MAX_NGRAM = 4
+# Plain-word symbols that collide with ordinary capitalized words in headlines
+AMBIGUOUS_SYMBOLS = {"LOW", "WELL", "CAT", "COST", "DIS", "ALL", "NOW", "ON"}
+MIN_BARE_SYMBOL_LEN = 3         # shorter symbols (T, V, KO) only match as "$T"
+
+EXTRA_ALIASES = {
+    "GOOGL": ["Alphabet", "Google"],
+    "AMZN": ["Amazon"],
+    "META": ["Meta", "Meta Platforms", "Facebook"],
+    "TSLA": ["Tesla"],
+    "NVDA": ["Nvidia"],
+    "BRK-B": ["Berkshire Hathaway", "Berkshire"],
+    "JPM": ["JPMorgan"],
+    "UNH": ["UnitedHealth"],
+    "XOM": ["Exxon"],
+    "DIS": ["Disney"],
+    "PYPL": ["PayPal"],
+    "ADBE": ["Adobe"],
+    "CMCSA": ["Comcast"],
+    "NFLX": ["Netflix"],
+    "COST": ["Costco"],
+    "PFE": ["Pfizer"],
+    "MRK": ["Merck"],
+    "NKE": ["Nike"],
+    "LLY": ["Eli Lilly", "Lilly"],
+    "DHR": ["Danaher"],
+    "TMO": ["Thermo Fisher"],
+    "ABNB": ["Airbnb"],
+    "CRM": ["Salesforce"],
+    "AMD": ["Advanced Micro Devices"],
+    "INTC": ["Intel"],
+    "HON": ["Honeywell"],
+    "UPS": ["United Parcel Service"],
+    "BTC-USD": ["Bitcoin", "BTC"],
+    "ETH-USD": ["Ethereum", "Ether", "ETH"],
+    "JEPI": ["JPMorgan Equity Premium Income"],
+    "VIST": ["Vista Energy"],
+    "GEV": ["GE Vernova"],
+}
+
+_SUFFIXES = re.compile(
+    r"\((the)\)|\b(inc|incorporated|corporation|corp|company|co|plc|p\.l\.c|holdings|"
+    r"common stock|ltd|limited)\b\.?", re.IGNORECASE)
+_WORD = re.compile(r"[a-z0-9&']+")
+_WORD_CASED = re.compile(r"[A-Za-z0-9&']+")
+_SYMBOL = re.compile(r"(\$?)\b([A-Z][A-Z0-9]*(?:-[A-Z]+)?)\b")
+
+
+def _words(text):
+    return tuple(_WORD.findall(text.lower().replace("’", "'")))
+
+
+def _clean_name(name):
+    name = _SUFFIXES.sub(" ", name)
+    return name.replace(",", " ").strip(" &")
+
+
+def load_aliases(insights_path, tickers=()):
+    """{ticker: [alias, ...]} from dividend_insights.json names plus EXTRA_ALIASES."""
+    aliases = {t: [] for t in tickers}
+    try:
+        with open(insights_path, "r", encoding="utf-8") as f:
+            for s in json.load(f).get("stocks", []):
+                aliases.setdefault(s["ticker"], []).append(_clean_name(s.get("name", "")))
+    except (OSError, ValueError):
+        pass
+    for ticker, names in EXTRA_ALIASES.items():
+        if ticker in aliases:
+            aliases[ticker].extend(names)
+    return aliases
+
+
+class Matcher:
+    """Tags a headline with tickers via symbol and name n-gram hash lookups."""
+
+    def __init__(self, aliases):
+        self.symbols = set(aliases)
+        self.names = {}
+        for ticker, names in aliases.items():
+            for name in names:
+                words = _words(name)
+                if words and len(words) <= MAX_NGRAM:
+                    self.names[words] = ticker
+        self.fingerprint = hashlib.sha1(
+            json.dumps(sorted((t, sorted(n)) for t, n in aliases.items())).encode("utf-8")).hexdigest()[:12]
+
+    def tickers_in(self, title):
+        found = set()
+        for dollar, symbol in _SYMBOL.findall(title):
+            if symbol in self.symbols and (dollar or (len(symbol) >= MIN_BARE_SYMBOL_LEN
+                                                      and symbol not in AMBIGUOUS_SYMBOLS)):
+                found.add(symbol)
+        raw = _WORD_CASED.findall(title.replace("’", "'"))
+        words = tuple(w.lower() for w in raw)
+        for n in range(1, MAX_NGRAM + 1):
+            for i in range(len(words) - n + 1):
+                ticker = self.names.get(words[i:i + n])
+                # One-word names ("Target", "Visa") only count when capitalized
+                if ticker and (n > 1 or not raw[i][0].islower()):
+                    found.add(ticker)
+        return sorted(found)
+
+
+def update(store, matcher):
+    """Tag untagged items and refresh store["index"] in place; returns items tagged."""
+    items = store["items"]
+    index = store.get("index", {})
+    rebuild = index.get("aliases") != matcher.fingerprint
+    tagged = 0
+    for item in items.values():
+        if rebuild or "tickers" not in item:
+            item["tickers"] = matcher.tickers_in(item["title"])
+            tagged += 1
+
+    postings = {}
+    for item_id, item in items.items():
+        for ticker in item["tickers"]:
+            postings.setdefault(ticker, []).append(item_id)
+    for ids in postings.values():
+        ids.sort(key=lambda i: items[i]["published"], reverse=True)
+    store["index"] = {"aliases": matcher.fingerprint, "tickers": postings}
+    return tagged
+
+
+def headlines_for(store, ticker, limit=6):
+    """Newest distinct headlines mentioning ticker (dict lookup, then dedupe)."""
+    items = store.get("items", {})
+    seen = set()
+    picked = []
+    for item_id in store.get("index", {}).get("tickers", {}).get(ticker, []):
+        item = items.get(item_id)
+        if not item:
+            continue
+        key = " ".join(_words(item["title"]))
+        if key in seen:
+            continue
+        seen.add(key)
+        picked.append(item)
+        if len(picked) == limit:
+            break
+    return picked
@@ -0,0 +1,176 @@
+"""
+Concurrent RSS ingester with conditional GET and a persistent news store.
+
+    import news_store
+    news_store.refresh(RSS_URLS)           # fetch every feed concurrently
+    items = news_store.latest(RSS_URLS)    # newest items per feed
+
+Pass a news_index.Matcher to refresh() to keep the per-ticker inverted index
+(see news_index.py) up to date in the same store.
+
+All feeds are requested at once (asyncio + a small thread pool around
+requests), each with the ETag / Last-Modified it returned last time. A feed
+that has not changed answers 304 with an empty body, so an idle news stage
+costs one round trip per feed in parallel. Only entries not already in the
+store are converted and added; the store lives in .tmp/news/store.json with
+the time each item was first seen, and items older than RETENTION_DAYS are
+dropped on every refresh.
+"""
+import os
+import json
+import time
+import asyncio
+import datetime
+
+import requests
+import feedparser
+
+import cassette
+import news_index
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+STORE_DIR = os.path.join(BASE_DIR, ".tmp", "news")
+
+MAX_CONCURRENCY = 16
+TIMEOUT = 10            # seconds per feed request
+RETENTION_DAYS = 14
+USER_AGENT = "Mozilla/5.0 (compatible; WiseAIWiseU-news/1.0)"
+
+
+def _store_path():
+    # Cassette runs are hermetic: they start from an empty scratch store
+    base = cassette.scratch_dir("news") if cassette.active() else STORE_DIR
+    return os.path.join(base, "store.json")
+
+
+def load():
+    """{"feeds": {url: validators}, "items": {id: item}} (empty if missing)."""
+    path = _store_path()
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  [warn] News store unreadable, starting fresh: {e}")
+    return {"feeds": {}, "items": {}}
+
+
+def save(store):
+    path = _store_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _get(url, validators):
+    """Conditional GET → (status, etag, last_modified, body)."""
+    headers = {"User-Agent": USER_AGENT}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    resp = requests.get(url, headers=headers, timeout=TIMEOUT)
+    if resp.status_code == 304:
+        return 304, validators.get("etag"), validators.get("last_modified"), b""
+    resp.raise_for_status()
+    return resp.status_code, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), resp.content
+
+
+async def _fetch_all(urls, feeds):
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def fetch(url):
+        validators = feeds.get(url, {})
+        async with semaphore:
+            try:
+                return url, await loop.run_in_executor(
+                    None, lambda: cassette.call("rss", url, lambda: _get(url, validators)))
+            except Exception as e:
+                print(f"  [warn] Feed failed: {url[:60]}... ({e})")
+                return url, None
+
+    return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+def _entry_id(entry):
+    return entry.get("id") or entry.get("link") or entry.get("title", "")
+
+
+def _published(entry, fallback):
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return fallback
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", parsed)    # feedparser normalizes to UTC
+
+
+def _ingest(store, url, body, seen_at):
+    """Add entries from a 200 response that the store has not seen yet."""
+    items = store["items"]
+    added = 0
+    for entry in feedparser.parse(body).entries:
+        item_id = _entry_id(entry)
+        if not item_id or item_id in items:
+            continue
+        items[item_id] = {
+            "title": entry.get("title", "").strip(),
+            "link": entry.get("link", ""),
+            "feed": url,
+            "published": _published(entry, seen_at),
+            "seen": seen_at,
+        }
+        added += 1
+    return added
+
+
+def _prune(store, now):
+    cutoff = (now - datetime.timedelta(days=RETENTION_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    stale = [k for k, v in store["items"].items() if max(v["published"], v["seen"]) < cutoff]
+    for k in stale:
+        del store["items"][k]
+    return len(stale)
+
+
+def refresh(urls, matcher=None):
+    """Fetch all feeds concurrently and merge new entries into the store."""
+    started = time.perf_counter()
+    store = load()
+    # 저장 시각은 "Z"(UTC)로 기록 — 로컬 시각인 cassette.now()를 UTC로 변환 (model_router와 동일)
+    now = cassette.now().astimezone(datetime.timezone.utc)
+    seen_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    results = asyncio.run(_fetch_all(list(dict.fromkeys(urls)), store["feeds"]))
+
+    added = unchanged = 0
+    for url, result in results:
+        if result is None:
+            continue
+        status, etag, last_modified, body = result
+        store["feeds"][url] = {"etag": etag, "last_modified": last_modified, "checked": seen_at}
+        if status == 304:
+            unchanged += 1
+            continue
+        added += _ingest(store, url, body, seen_at)
+
+    pruned = _prune(store, now)
+    if matcher is not None:
+        news_index.update(store, matcher)
+    save(store)
+    print(f"  [news] {len(results)} feeds in {time.perf_counter() - started:.2f}s: "
+          f"{unchanged} unchanged, {added} new items, {pruned} expired, {len(store['items'])} stored")
+    return store
+
+
+def latest(urls, per_feed=3, store=None):
+    """Newest `per_feed` items from each feed in `urls`, feed order preserved."""
+    store = store or load()
+    by_feed = {url: [] for url in urls}
+    for item in store["items"].values():
+        if item["feed"] in by_feed:
+            by_feed[item["feed"]].append(item)
+    picked = []
+    for url in urls:
+        picked.extend(sorted(by_feed[url], key=lambda i: i["published"], reverse=True)[:per_feed])
+    return picked
@@ -0,0 +1,308 @@
+"""
+SQLite catalog of every published post — the source of truth for post lists.
+
+    import post_catalog
+    with post_catalog.connect() as db:
+        post_catalog.add(db, "ko", "blog/2026-10-16-NVDA.html", title, "2026-10-16", summary)
+        recent = post_catalog.recent_tickers(db, "2026-10-09")
+        post_catalog.export(db, "ko")               # regenerate ko/posts.json + ko/posts/
+
+.tmp/posts.sqlite holds one row per (lang, slug), indexed on (lang, date)
+for listings and (ticker, date) for the auto_poster cooldown check, so
+neither has to parse JSON or filenames. The posts.json files are derived
+artifacts: export_json writes the newest POSTS_JSON_LIMIT rows per language
+(create_edu_series.py passes its own, larger limit for ko), while the catalog
+keeps full history.
+
+export_pages shards the full history into <lang>/posts/page-N.json for the
+front end. Posts are cut into PAGE_SIZE pages from the oldest end: the newest
+PAGE_SIZE..2*PAGE_SIZE-1 posts form page-1.json (the only page the homepage
+loads), and the older ones fill sealed pages numbered oldest-first from
+page-2.json. A new post only changes page 1 until page 1 reaches
+2*PAGE_SIZE posts, when its oldest PAGE_SIZE are sealed as the next page, so
+sealed pages stay byte-identical between builds and CDN caches stay warm.
+manifest.json lists the pages newest-first with a content hash for each.
+
+The database itself is not committed: a binary file rewritten by every CI
+run cannot be merged when two runs race. The committed page files are the
+record instead. They hold every post of every language in catalog order, so
+connect() rebuilds the catalog from them whenever it is missing or was built
+from different pages. It stores a hash of the three manifest.json files and
+compares it with the ones on disk. Every export_pages() updates that hash.
+
+With no page files at all, connect() bootstraps from the blog directories
+instead: title and description come from each post's <head>, and the date
+from the filename or, for education posts, the page itself. The existing
+posts.json files are read too, and their titles, summaries and order win.
+Run this file directly to rebuild the catalog from the pages (or with --scan,
+from the blog directories) and re-export every posts.json and page.
+"""
+import os
+import re
+import json
+import hashlib
+import sqlite3
+import argparse
+import contextlib
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DB_PATH = os.path.join(BASE_DIR, ".tmp", "posts.sqlite")
+POSTS_JSON_LIMIT = 60
+PAGE_SIZE = 10
+
+# 언어별 블로그 폴더와 파생 posts.json / 페이지 폴더 위치 (링크는 언어 폴더 기준 "blog/<slug>.html")
+LANGS = {
+    "en": {"blog": "blog",    "json": "posts.json",    "pages": "posts"},
+    "ko": {"blog": "ko/blog", "json": "ko/posts.json", "pages": "ko/posts"},
+    "pt": {"blog": "pt/blog", "json": "pt/posts.json", "pages": "pt/posts"},
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    seq     INTEGER PRIMARY KEY AUTOINCREMENT,
+    lang    TEXT NOT NULL,
+    slug    TEXT NOT NULL,
+    date    TEXT NOT NULL,
+    ticker  TEXT,
+    title   TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    link    TEXT NOT NULL,
+    UNIQUE (lang, slug)
+);
+CREATE INDEX IF NOT EXISTS posts_lang_date ON posts (lang, date);
+CREATE INDEX IF NOT EXISTS posts_ticker_date ON posts (ticker, date);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_DAILY_SLUG = re.compile(r"^(\d{4}-\d{2}-\d{2})-(.+)$")
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TITLE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_DESCRIPTION = re.compile(r'<meta name="description" content="([^"]*)"', re.IGNORECASE)
+
+
+def parse_slug(link):
+    """(slug, date, ticker) for a post link; date/ticker are None for non-daily posts."""
+    slug = os.path.splitext(os.path.basename(link))[0]
+    m = _DAILY_SLUG.match(slug)
+    return (slug, m.group(1), m.group(2)) if m else (slug, None, None)
+
+
+@contextlib.contextmanager
+def connect(path=None, scan=False):
+    """Open the catalog, rebuilding it if it does not match the committed page files.
+
+    Use it as `with connect() as db:`; the block commits on success, rolls back
+    on error, and closes the connection either way.
+    """
+    path = path or DB_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.executescript(SCHEMA)
+    source = pages_fingerprint()
+    row = db.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+    if scan or row is None or row["value"] != source:
+        with db:
+            count, origin = rebuild(db, scan)
+            _mark_synced(db, source)
+        print(f"  [catalog] Rebuilt {os.path.basename(path)} with {count} posts from {origin}")
+    with contextlib.closing(db), db:
+        yield db
+
+
+def pages_fingerprint():
+    """Hash of every language's posts/manifest.json (which itself hashes each page)."""
+    digest = hashlib.sha256()
+    for lang, paths in LANGS.items():
+        manifest = os.path.join(BASE_DIR, paths["pages"], "manifest.json")
+        digest.update(lang.encode("utf-8") + b"\0")
+        if os.path.exists(manifest):
+            with open(manifest, "rb") as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _mark_synced(db, source=None):
+    db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('source', ?)", (source or pages_fingerprint(),))
+
+
+def add(db, lang, link, title, date, summary=""):
+    """Insert or replace a post; a re-added post moves to the front of its date."""
+    slug, _, ticker = parse_slug(link)
+    # OR REPLACE는 기존 행을 지우고 새 seq로 넣음 — 같은 날짜 안에서 최신 순서 유지
+    db.execute("INSERT OR REPLACE INTO posts (lang, slug, date, ticker, title, summary, link) "
+               "VALUES (?, ?, ?, ?, ?, ?, ?)", (lang, slug, date, ticker, title, summary or "", link))
+
+
+def recent_tickers(db, since):
+    """Tickers with a daily post dated on or after `since` (YYYY-MM-DD) in any language."""
+    rows = db.execute("SELECT DISTINCT ticker FROM posts WHERE ticker IS NOT NULL AND date >= ?", (since,))
+    return {r["ticker"] for r in rows}
+
+
+def latest(db, lang, limit=POSTS_JSON_LIMIT, offset=0):
+    """Newest posts of one language as posts.json entries."""
+    rows = db.execute("SELECT title, date, link, summary FROM posts WHERE lang = ? "
+                      "ORDER BY date DESC, seq DESC LIMIT ? OFFSET ?", (lang, limit, offset))
+    return [dict(r) for r in rows]
+
+
+def render_json(db, lang, limit=POSTS_JSON_LIMIT):
+    """posts.json text for one language."""
+    return json.dumps(latest(db, lang, limit), ensure_ascii=False, indent=4)
+
+
+def export_json(db, lang, limit=POSTS_JSON_LIMIT):
+    """Regenerate the language's posts.json from the catalog."""
+    path = os.path.join(BASE_DIR, LANGS[lang]["json"])
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_json(db, lang, limit))
+    return path
+
+
+def _write_if_changed(path, text):
+    """Write text unless the file already holds exactly that; returns True if written."""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def paginate(total, page_size=PAGE_SIZE):
+    """(head_count, sealed_pages) for `total` posts: head holds page_size..2*page_size-1."""
+    sealed = max(0, total // page_size - 1)
+    return total - sealed * page_size, sealed
+
+
+def render_pages(db, lang, page_size=PAGE_SIZE):
+    """{relative path: text} for every page-N.json plus manifest.json of one language."""
+    out_dir = LANGS[lang]["pages"]
+    rows = db.execute("SELECT title, date, link, summary FROM posts WHERE lang = ? "
+                      "ORDER BY date, seq", (lang,)).fetchall()
+    posts = [dict(r) for r in rows]                       # oldest first
+    head_count, sealed = paginate(len(posts), page_size)
+
+    # page-1 = 최신 글(최신순), page-2.. = 오래된 글부터 page_size개씩 봉인
+    pages = {1: posts[len(posts) - head_count:][::-1]}
+    for k in range(sealed):
+        pages[k + 2] = posts[k * page_size:(k + 1) * page_size][::-1]
+
+    files = {}
+    manifest = {"page_size": page_size, "total": len(posts), "pages": []}
+    for number in [1] + list(range(sealed + 1, 1, -1)):
+        text = json.dumps(pages[number], ensure_ascii=False, separators=(",", ":"))
+        files[f"{out_dir}/page-{number}.json"] = text
+        manifest["pages"].append({"file": f"page-{number}.json", "count": len(pages[number]),
+                                  "hash": hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]})
+    files[f"{out_dir}/manifest.json"] = json.dumps(manifest, ensure_ascii=False, separators=(",", ":"))
+    return files
+
+
+def export_pages(db, lang, page_size=PAGE_SIZE):
+    """Write <lang>/posts/page-N.json and manifest.json; returns the number of files rewritten."""
+    out_dir = os.path.join(BASE_DIR, LANGS[lang]["pages"])
+    os.makedirs(out_dir, exist_ok=True)
+    files = render_pages(db, lang, page_size)
+    written = sum(_write_if_changed(os.path.join(BASE_DIR, rel), text) for rel, text in files.items())
+    # 글이 삭제되어 페이지 수가 줄었으면 남은 파일 정리
+    for fname in os.listdir(out_dir):
+        if re.match(r"^page-\d+\.json$", fname) and f"{LANGS[lang]['pages']}/{fname}" not in files:
+            os.remove(os.path.join(out_dir, fname))
+    # 카탈로그와 디스크의 페이지가 다시 일치 — 다음 connect()에서 재구축하지 않음
+    _mark_synced(db)
+    return written
+
+
+def export(db, lang, limit=POSTS_JSON_LIMIT):
+    """Regenerate every derived index of one language (posts.json and posts/ pages)."""
+    export_json(db, lang, limit)
+    export_pages(db, lang)
+
+
+def _scan_blog(blog_dir):
+    """posts.json-style entries for every post HTML in blog_dir, oldest first."""
+    entries = []
+    for fname in os.listdir(blog_dir) if os.path.isdir(blog_dir) else ():
+        if not fname.endswith(".html"):
+            continue
+        with open(os.path.join(blog_dir, fname), "r", encoding="utf-8", errors="ignore") as f:
+            html = f.read()
+        head = html[:html.find("</head>")]
+        _, date, ticker = parse_slug(fname)
+        if date is None:
+            # 교육 글은 파일명에 날짜가 없음 — 본문의 첫 날짜(게시일 표기) 사용, 없으면 제외
+            m = _DATE.search(html)
+            if not m:
+                continue
+            date = m.group(0)
+        title = _TITLE.search(head)
+        description = _DESCRIPTION.search(head)
+        entries.append({
+            "title": title.group(1).strip() if title else f"{ticker or fname} Analysis",
+            "date": date, "link": f"blog/{fname}",
+            "summary": description.group(1).strip() if description else "",
+        })
+    return sorted(entries, key=lambda e: (e["date"], e["link"]))
+
+
+def _load_pages(lang):
+    """posts.json-style entries from <lang>/posts/, oldest first, or None without a manifest."""
+    out_dir = os.path.join(BASE_DIR, LANGS[lang]["pages"])
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    pages = {}
+    for page in manifest["pages"]:
+        with open(os.path.join(out_dir, page["file"]), "r", encoding="utf-8") as f:
+            pages[int(re.match(r"^page-(\d+)\.json$", page["file"]).group(1))] = json.load(f)
+    # render_pages의 역순: 봉인 페이지(page-2, page-3, ...) 다음 page-1, 각 페이지는 최신순으로 저장됨
+    ordered = [n for n in sorted(pages) if n != 1] + [1]
+    return [post for n in ordered if n in pages for post in reversed(pages[n])]
+
+
+def rebuild(db, scan=False):
+    """Refill the catalog from the committed page files; returns (count, origin)."""
+    db.execute("DELETE FROM posts")
+    loaded = {lang: None if scan else _load_pages(lang) for lang in LANGS}
+    if all(posts is not None for posts in loaded.values()):
+        for lang, posts in loaded.items():
+            for p in posts:
+                add(db, lang, p["link"], p["title"], p["date"], p.get("summary", ""))
+        origin = "posts/ pages"
+    else:
+        bootstrap(db)
+        origin = "blog directories"
+    return db.execute("SELECT COUNT(*) FROM posts").fetchone()[0], origin
+
+
+def bootstrap(db):
+    """Fill the catalog from the blog directories and the existing posts.json files."""
+    for lang, paths in LANGS.items():
+        for e in _scan_blog(os.path.join(BASE_DIR, paths["blog"])):
+            add(db, lang, e["link"], e["title"], e["date"], e["summary"])
+        json_path = os.path.join(BASE_DIR, paths["json"])
+        if os.path.exists(json_path):
+            with open(json_path, "r", encoding="utf-8") as f:
+                try: posts = json.load(f)
+                except ValueError: posts = []
+            # posts.json은 최신순 — 역순으로 넣어야 같은 날짜의 기존 순서가 유지됨
+            for p in reversed(posts):
+                if p.get("link") and p.get("date"):
+                    add(db, lang, p["link"], p.get("title", ""), p["date"], p.get("summary", ""))
+    return db.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the post catalog and re-export every index")
+    parser.add_argument("--scan", action="store_true", help="rebuild from the blog directories instead of posts/ pages")
+    args = parser.parse_args()
+    with connect(scan=args.scan) as db:
+        for lang in LANGS:
+            print(f"[OK] {export_json(db, lang)}: {len(latest(db, lang))} entries, "
+                  f"{export_pages(db, lang)} page file(s) written")
@@ -0,0 +1,131 @@
+"""
+Compiled page templates and the shared, fingerprinted post stylesheet.
+
+    import post_template
+    html = post_template.render("post.html", lang="ko", title=..., ...)
+    href = post_template.stylesheet_href()        # "/css/post.1a2b3c4d.css"
+
+css/post.css is the one copy of the post theme (progress bar, hero, article,
+tables, disclaimer, series nav). Pages link it instead of inlining ~6 KB of
+<style> each, so the browser downloads it once for the whole blog.
+stylesheet_href() returns the absolute URL of css/post.<sha256[:8]>.css for
+the current version. That fingerprinted copy is a build output: build.py's
+post-css target generates it from css/post.css with a "generated" header, so
+css/post.css is the only file to edit. A fingerprinted file never changes, so
+hosts can cache it forever, and old fingerprints are kept because
+already-published pages still point at them.
+
+Templates live in execution/templates/ and use {{ name }} placeholders (no
+expressions, no brace escaping — CSS and JS pass through untouched). The first
+render() of a template splits it into (literal, name) parts; rendering joins
+the literals and the substituted values in one "".join. The parts are cached
+by the template's content hash, so rendering a batch of posts parses the
+template once.
+
+migrate() (run via patch_all_blog_css.py) moves existing pages over: an
+inline <style> block that is exactly one of the known copies of the theme
+(LEGACY_STYLES) is replaced with the stylesheet link, followed by that copy's
+few differing rules if it had any. Any other inline styling is left alone.
+"""
+import os
+import re
+import hashlib
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+STYLESHEET = "css/post.css"
+GENERATED_HEADER = b"/* Generated from css/post.css by execution/build.py (post-css) - edit that file instead. */\n"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+_compiled = {}
+
+# 지금까지 글에 인라인으로 들어간 테마 <style> 블록의 sha256 → 링크 뒤에 남길 페이지 전용 차이
+SECTOR_OVERRIDES = """  <style>
+    .post-hero h1 { margin: 0 auto 1rem; }
+    .key-point { line-height: 1.8; }
+    .key-point strong { display: block; margin-bottom: 0.5rem; }
+  </style>"""
+LEGACY_STYLES = {
+    "6a0ab5a732d8b03c3c2f89e3a8722e8cdaa74b9a97e97b3d05e1a395b485e838": "",    # patch_all_blog_css.py 테마
+    "018d0706498b4db3cbfbeb11441389202195bcafa1159e7c956b07f2c486c5b1": "",    # auto_poster.py (.back-btn 괄호 누락)
+    "e54d8c717ca62ace6f1601cbc14d27633f177934e48df32ad5297a44094daeb9": "",    # auto_poster.py (괄호 수정본)
+    "76e1f9598d2056f8c49a92d404c6ed59925bf99be5d7740d4b1e682d8a70da1a": SECTOR_OVERRIDES,  # 섹터 시리즈 스크립트 6종
+}
+_STYLE_BLOCK = re.compile(r"[ \t]*<style>.*?</style>", re.DOTALL)
+
+
+def compile_template(text):
+    """Compile template text into a function(ctx) -> str."""
+    chunks = _PLACEHOLDER.split(text)            # literal, name, literal, name, ..., literal
+    parts = list(zip(chunks[0:-1:2], chunks[1::2]))
+    tail = chunks[-1]
+
+    def render_fn(ctx):
+        return "".join([literal + str(ctx[key]) for literal, key in parts] + [tail])
+
+    render_fn.names = sorted(set(chunks[1::2]))
+    return render_fn
+
+
+def load(name):
+    """Compiled function for execution/templates/<name>, recompiled only when the file changes."""
+    with open(os.path.join(TEMPLATE_DIR, name), "r", encoding="utf-8") as f:
+        text = f.read()
+    key = (name, hashlib.sha256(text.encode("utf-8")).hexdigest())
+    if key not in _compiled:
+        _compiled[key] = compile_template(text)
+    return _compiled[key]
+
+
+def render(name, **ctx):
+    """Render execution/templates/<name>; every placeholder must be given."""
+    fn = load(name)
+    missing = [n for n in fn.names if n not in ctx]
+    if missing:
+        raise KeyError(f"{name}: missing template value(s) {', '.join(missing)}")
+    return fn(ctx)
+
+
+def _read_stylesheet():
+    with open(os.path.join(BASE_DIR, STYLESHEET), "rb") as f:
+        data = f.read()
+    stem, ext = os.path.splitext(STYLESHEET)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:8]}{ext}", data
+
+
+def stylesheet_href():
+    """Absolute URL of the fingerprinted post stylesheet (written by build.py's post-css target)."""
+    return "/" + _read_stylesheet()[0]
+
+
+def fingerprinted_stylesheet():
+    """(relative path, bytes) of the fingerprinted copy that build.py writes."""
+    rel_path, data = _read_stylesheet()
+    return rel_path, GENERATED_HEADER + data
+
+
+def stylesheet_link():
+    return f'  <link rel="stylesheet" href="{stylesheet_href()}">'
+
+
+def migrate(paths):
+    """Replace known inline theme blocks with the stylesheet link; returns pages rewritten."""
+    link = stylesheet_link()
+    count = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        def swap(m):
+            digest = hashlib.sha256(m.group(0).strip().encode("utf-8")).hexdigest()
+            if digest not in LEGACY_STYLES:
+                return m.group(0)
+            return "\n".join(filter(None, (link, LEGACY_STYLES[digest])))
+
+        new_html = _STYLE_BLOCK.sub(swap, html)
+        if new_html != html:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(new_html)
+            count += 1
+    return count
+
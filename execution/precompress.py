@@ -0,0 +1,200 @@
+"""
+Precompressed .br / .gz siblings for every published text artifact.
+
+    python execution/precompress.py                   # whole site
+    python execution/precompress.py sitemap.xml list.html
+    python execution/precompress.py --force           # ignore the manifest
+
+Static hosts that support precompressed files (gzip_static / brotli_static
+style) serve index.html.br or index.html.gz directly instead of compressing
+on every request, or not at all. Each HTML, JSON, XML, CSS, JS and SVG file
+gets gzip level 9 and Brotli quality 11 siblings. gzip output carries no
+timestamp, so unchanged inputs produce byte-identical siblings and no git
+churn.
+
+.tmp/precompress.json records each source's sha256. Only sources whose hash
+changed (or whose siblings are missing) are recompressed. A sibling that
+would not be smaller than its source is removed rather than written, as is
+any sibling whose source no longer exists. Brotli is optional: without the
+`brotli` package only .gz files are written, and an unchanged source counts
+as up to date whether or not it has a .br sibling (a changed source loses
+its now-stale .br). The report shows the total bytes saved per artifact
+class.
+
+The siblings are gitignored; the workflows stage the ones they publish with
+`git add -f`, so a run only commits siblings of the files it changed.
+"""
+import os
+import gzip
+import json
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+MANIFEST_PATH = os.path.join(BASE_DIR, ".tmp", "precompress.json")
+
+EXTENSIONS = (".html", ".json", ".xml", ".css", ".js", ".svg")
+# 배포되지 않는 작업 폴더 (스크립트, 에이전트 메모, 캐시)
+SKIP_DIRS = {".git", ".github", ".tmp", "brain", "directives", "execution", "__pycache__", "node_modules"}
+MIN_SIZE = 512          # bytes; smaller files gain nothing from a sibling
+WORKERS = 4
+
+
+def _encoders():
+    encoders = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders[".br"] = lambda data: brotli.compress(data, quality=11)
+    return encoders
+
+
+def find_sources(paths=None):
+    """Relative paths of every text artifact under BASE_DIR (or the given paths)."""
+    if paths:
+        return sorted(os.path.relpath(os.path.abspath(p), BASE_DIR) for p in paths
+                      if os.path.isfile(p) and p.endswith(EXTENSIONS))
+    found = []
+    for root, dirs, files in os.walk(BASE_DIR):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if name.endswith(EXTENSIONS):
+                found.append(os.path.relpath(os.path.join(root, name), BASE_DIR))
+    return sorted(found)
+
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def _remove(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def compress_file(rel_path, entry, encoders, force=False):
+    """(rel_path, manifest entry, sizes, recompressed) for one source; sizes maps ext → bytes."""
+    path = os.path.join(BASE_DIR, rel_path)
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    sizes = {"": len(data)}
+    if len(data) < MIN_SIZE:
+        for ext in (".gz", ".br"):
+            _remove(path + ext)
+        return rel_path, {"sha256": digest, "skipped": sorted(encoders)}, sizes, False
+
+    same = entry and entry.get("sha256") == digest and not force
+    # 해시가 같으면 이전 결과 재사용 — 작아지지 않아 건너뛴 인코딩은 원본 크기로 집계
+    skipped = set(entry.get("skipped", [])) if same else set()
+    recompressed = False
+    for ext, encode in encoders.items():
+        sibling = path + ext
+        if same and ext in skipped:
+            sizes[ext] = len(data)
+            continue
+        if same and os.path.exists(sibling):
+            sizes[ext] = os.path.getsize(sibling)
+            continue
+        packed = encode(data)
+        recompressed = True
+        if len(packed) < len(data):
+            with open(sibling, "wb") as f:
+                f.write(packed)
+            sizes[ext] = len(packed)
+            skipped.discard(ext)
+        else:
+            _remove(sibling)
+            sizes[ext] = len(data)
+            skipped.add(ext)
+    if not same:
+        # 쓸 수 없는 인코딩(brotli 미설치)의 사본은 내용이 바뀌면 낡으므로 삭제
+        for ext in (".gz", ".br"):
+            if ext not in encoders:
+                _remove(path + ext)
+    return rel_path, {"sha256": digest, "skipped": sorted(skipped)}, sizes, recompressed
+
+
+def remove_orphans(sources):
+    """Delete .gz / .br siblings whose source file is gone; returns how many."""
+    removed = 0
+    for root, dirs, files in os.walk(BASE_DIR):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            stem, ext = os.path.splitext(name)
+            if ext in (".gz", ".br") and stem.endswith(EXTENSIONS):
+                if not os.path.exists(os.path.join(root, stem)):
+                    os.remove(os.path.join(root, name))
+                    removed += 1
+    return removed
+
+
+def precompress(paths=None, force=False):
+    """Compress changed sources; returns {class: {"files", "bytes", ".gz", ".br"}} totals."""
+    encoders = _encoders()
+    if brotli is None:
+        print("  [warn] brotli not installed — writing .gz siblings only (pip install brotli)")
+    manifest = _load_manifest()
+    sources = find_sources(paths)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(lambda rel: compress_file(rel, manifest.get(rel), encoders, force), sources))
+
+    totals = {}
+    recompressed = 0
+    for rel_path, entry, sizes, changed in results:
+        manifest[rel_path] = entry
+        recompressed += changed
+        t = totals.setdefault(os.path.splitext(rel_path)[1], {"files": 0, "bytes": 0})
+        t["files"] += 1
+        t["bytes"] += sizes[""]
+        for ext in encoders:
+            t[ext] = t.get(ext, 0) + sizes.get(ext, sizes[""])
+    if not paths:
+        manifest = {rel: manifest[rel] for rel in sources}
+        orphans = remove_orphans(sources)
+        if orphans:
+            print(f"  [precompress] Removed {orphans} orphaned sibling(s)")
+    _save_manifest(manifest)
+    print(f"[*] {recompressed}/{len(sources)} file(s) recompressed")
+    return totals
+
+
+def _ratio(saved, total):
+    # 빈 파일만 있는 클래스는 비율을 낼 수 없음
+    return f"{saved / total:.0%}" if total else "-"
+
+
+def report(totals):
+    for cls, t in sorted(totals.items(), key=lambda kv: -kv[1]["bytes"]):
+        cols = " | ".join(f"{ext} saves {t['bytes'] - t[ext]:>10,} B ({_ratio(t['bytes'] - t[ext], t['bytes'])})"
+                          for ext in (".br", ".gz") if ext in t)
+        print(f"  [precompress] {cls:<6} {t['files']:>4} files {t['bytes']:>11,} B | {cols}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write .br/.gz siblings for published text artifacts")
+    parser.add_argument("paths", nargs="*", help="files to compress (default: the whole site)")
+    parser.add_argument("--force", action="store_true", help="recompress even if the content hash is unchanged")
+    args = parser.parse_args(argv)
+    report(precompress(args.paths, args.force))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Thread-safe token bucket shared by the rate-limited clients.
+
+    from rate_limit import TokenBucket
+    limiter = TokenBucket(rate=2.0, capacity=4)   # 2 calls/second, bursts of 4
+    limiter.acquire()                             # blocks until a token is free
+
+yf_cache paces Yahoo cache misses with one; auto_poster paces Gemini calls
+with another. Neither depends on the other's module.
+"""
+import time
+import threading
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, up to `capacity` banked."""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
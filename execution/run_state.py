@@ -0,0 +1,71 @@
+"""
+Per-run stage checkpoints for auto_poster, under .tmp/runs/{date}/.
+
+    state = RunState()                       # today's run directory
+    stocks = state.checkpoint("select", lambda: pick_tickers())
+    body   = state.checkpoint("generate", lambda: call_gemini(), ticker="NVDA")
+
+Each stage's output is written as JSON (select.json, NVDA/generate.json, ...)
+the moment it is produced. Rerunning on the same day loads every finished
+stage instead of recomputing it, so the run resumes at the first incomplete
+stage. In particular a crash after generation never pays for a second Gemini
+call. A stage whose result is None is not recorded and runs again next time.
+Run directories older than KEEP_DAYS are removed when a new run starts.
+"""
+import os
+import json
+import shutil
+import datetime
+
+import cassette
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+RUNS_DIR = os.path.join(BASE_DIR, ".tmp", "runs")
+KEEP_DAYS = 7
+
+
+class RunState:
+    def __init__(self, run_date=None, fresh=False):
+        self.run_date = run_date or cassette.today().isoformat()
+        # Cassette runs are hermetic: checkpoints go to the scratch dir
+        root = cassette.scratch_dir("runs") if cassette.active() else RUNS_DIR
+        self.dir = os.path.join(root, self.run_date)
+        self.fresh = fresh
+        self._prune(root)
+
+    def _prune(self, root):
+        cutoff = (datetime.date.fromisoformat(self.run_date) - datetime.timedelta(days=KEEP_DAYS)).isoformat()
+        for entry in os.scandir(root) if os.path.isdir(root) else ():
+            # 디렉터리 이름이 날짜(YYYY-MM-DD)이므로 문자열 비교로 충분
+            if entry.is_dir() and len(entry.name) == 10 and entry.name < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _path(self, stage, ticker=None):
+        return os.path.join(self.dir, *([ticker] if ticker else []), f"{stage}.json")
+
+    def done(self, stage, ticker=None):
+        return not self.fresh and os.path.exists(self._path(stage, ticker))
+
+    def load(self, stage, ticker=None):
+        with open(self._path(stage, ticker), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, stage, value, ticker=None):
+        path = self._path(stage, ticker)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def checkpoint(self, stage, compute, ticker=None, encode=None, decode=None):
+        """Stage result from disk if already finished, else compute() and record it."""
+        label = f"{stage} ({ticker})" if ticker else stage
+        if self.done(stage, ticker):
+            print(f"  [resume] {label} loaded from {os.path.relpath(self.dir, BASE_DIR)}")
+            value = self.load(stage, ticker)
+            return decode(value) if decode else value
+        value = compute()
+        if value is not None:
+            self.save(stage, encode(value) if encode else value, ticker)
+        return value
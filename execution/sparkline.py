@@ -0,0 +1,55 @@
+"""
+Batch 52-week sparklines for the dividend screener.
+
+    codes = encode_panel(close_panel)      # {ticker: "0a1Z2x..."}
+
+Every ticker's year of closes is reduced to POINTS shape-preserving points
+with one LTTB pass over the whole panel (downsample.lttb_batch), scaled to a
+64 x 64 grid and written as one character per coordinate. The y scale comes
+from every close, not just the kept points, so the grid spans the true
+52-week range even when LTTB skips the day of the high or low:
+
+    x0 y0 x1 y1 ...   with   ALPHABET[v] for v in 0..63
+
+so a row costs 2 * POINTS bytes (80 with the default) inside
+dividend_insights.json. list.html decodes the string into an inline SVG
+polyline; y is top-down (0 = the 52-week high).
+"""
+import numpy as np
+
+from downsample import lttb_batch
+
+POINTS = 40
+LEVELS = 64
+ALPHABET = np.array(list("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"))
+
+
+def encode_panel(close, points=POINTS):
+    """{ticker: code} for every column of a dates x tickers close panel.
+
+    Gaps are forward/back-filled; tickers with fewer than two closes are skipped.
+    """
+    if close is None or close.empty:
+        return {}
+    valid = close.notna().sum() >= 2
+    close = close.loc[:, valid].ffill().bfill()
+    if close.empty:
+        return {}
+
+    values = close.to_numpy(dtype=np.float64).T              # tickers x bars
+    length = values.shape[1]
+    idx = lttb_batch(values, points)
+    ys = np.take_along_axis(values, idx, axis=1)
+
+    # 축척은 다운샘플 전 전체 종가 기준 — 0이 실제 52주 고가가 되도록
+    lo = values.min(axis=1, keepdims=True)
+    span = values.max(axis=1, keepdims=True) - lo
+    span[span == 0] = 1.0
+    y_codes = np.rint((1 - (ys - lo) / span) * (LEVELS - 1)).astype(np.int64)
+    x_codes = np.rint(idx * (LEVELS - 1) / max(length - 1, 1)).astype(np.int64)
+
+    pairs = np.empty((len(values), idx.shape[1] * 2), dtype=np.int64)
+    pairs[:, 0::2] = x_codes
+    pairs[:, 1::2] = y_codes
+    chars = ALPHABET[pairs]
+    return {ticker: "".join(row) for ticker, row in zip(close.columns, chars)}
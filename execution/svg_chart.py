@@ -0,0 +1,146 @@
+"""
+Pure-Python SVG line / area chart renderer for post price charts.
+
+    svg = render_price_chart("NVDA", dates, prices, lang="ko")
+
+Draws the trend at build time from local price data and returns a small,
+self-contained <svg> string that is inlined into the post, so readers make
+no third-party image requests. Labels (title, axis dates, accessible
+description) are localized for EN / KO / PT. Long series are reduced to
+MAX_POINTS with LTTB (downsample.py) so spikes survive; coordinates are
+rounded to keep the markup compact.
+"""
+import math
+from html import escape
+
+from downsample import lttb_indices
+
+WIDTH = 600
+HEIGHT = 300
+PADDING = {"top": 44, "right": 56, "bottom": 32, "left": 12}
+Y_TICKS = 4
+X_LABELS = 5
+MAX_POINTS = 48
+
+LINE_COLOR = "#6366f1"
+UP_COLOR = "#10b981"
+DOWN_COLOR = "#ef4444"
+GRID_COLOR = "rgba(148,163,184,0.25)"
+TEXT_COLOR = "#94a3b8"
+FONT = "system-ui,-apple-system,'Segoe UI',sans-serif"
+
+LABELS = {
+    "en": {"title": "{ticker} 3-Month Trend",
+           "desc": "{ticker} closing price from {start} to {end}: {first} to {last} ({change})."},
+    "ko": {"title": "{ticker} 3개월 추세",
+           "desc": "{ticker} 종가 추이 {start} ~ {end}: {first} → {last} ({change})."},
+    "pt": {"title": "{ticker} Tendência de 3 Meses",
+           "desc": "Preço de fechamento de {ticker} de {start} a {end}: {first} para {last} ({change})."},
+}
+MONTHS = {
+    "en": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+    "pt": ["jan", "fev", "mar", "abr", "mai", "jun", "jul", "ago", "set", "out", "nov", "dez"],
+}
+
+
+def format_date(d, lang):
+    """Short axis date: 'Oct 16' / '10월 16일' / '16 out'."""
+    if lang == "ko":
+        return f"{d.month}월 {d.day}일"
+    if lang == "pt":
+        return f"{d.day} {MONTHS['pt'][d.month - 1]}"
+    return f"{MONTHS['en'][d.month - 1]} {d.day}"
+
+
+def _nice_step(span, ticks):
+    raw = span / max(ticks, 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for m in (1, 2, 2.5, 5, 10):
+        if raw <= m * magnitude:
+            return m * magnitude
+    return 10 * magnitude
+
+
+def _fmt_price(value, step):
+    decimals = 0 if step >= 1 else (1 if step >= 0.1 else 2)
+    return f"{value:,.{decimals}f}"
+
+
+def _num(v):
+    """Compact coordinate: one decimal, no trailing .0."""
+    s = f"{v:.1f}"
+    return s[:-2] if s.endswith(".0") else s
+
+
+def render_price_chart(ticker, dates, prices, lang="en", width=WIDTH, height=HEIGHT, area=True,
+                       max_points=MAX_POINTS):
+    """Return an inline <svg> line (and area) chart of prices over dates."""
+    if len(prices) < 2:
+        return ""
+    labels = LABELS.get(lang, LABELS["en"])
+    left, right = PADDING["left"], width - PADDING["right"]
+    top, bottom = PADDING["top"], height - PADDING["bottom"]
+
+    lo, hi = min(prices), max(prices)
+    if hi == lo:
+        hi, lo = hi + 1, lo - 1
+    step = _nice_step(hi - lo, Y_TICKS)
+    y_min = math.floor(lo / step) * step
+    y_max = math.ceil(hi / step) * step
+
+    n = len(prices)
+    def x(i):
+        return left + (right - left) * i / (n - 1)
+
+    def y(p):
+        return bottom - (bottom - top) * (p - y_min) / (y_max - y_min)
+
+    # Only the drawn line is downsampled; extremes, labels and change use every bar
+    keep = lttb_indices(prices, max_points) if max_points else range(n)
+    points = " ".join(f"{_num(x(i))},{_num(y(prices[i]))}" for i in keep)
+    change = (prices[-1] / prices[0] - 1) * 100 if prices[0] else 0.0
+    trend = UP_COLOR if change >= 0 else DOWN_COLOR
+    fill_id = "fill-" + "".join(c for c in ticker if c.isalnum())
+
+    title = labels["title"].format(ticker=ticker)
+    desc = labels["desc"].format(
+        ticker=ticker, start=format_date(dates[0], lang), end=format_date(dates[-1], lang),
+        first=_fmt_price(prices[0], 0.01), last=_fmt_price(prices[-1], 0.01), change=f"{change:+.2f}%")
+
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" role="img" '
+        f'aria-labelledby="{fill_id}-t {fill_id}-d" style="width:100%;height:auto;margin:20px 0;'
+        f'border-radius:12px;background:rgba(255,255,255,0.02)" font-family="{FONT}">',
+        f'<title id="{fill_id}-t">{escape(title)}</title><desc id="{fill_id}-d">{escape(desc)}</desc>',
+        f'<text x="{left}" y="24" font-size="18" font-weight="700" fill="currentColor">{escape(title)}</text>',
+        f'<text x="{right + PADDING["right"] - 4}" y="24" font-size="14" font-weight="700" '
+        f'text-anchor="end" fill="{trend}">{change:+.2f}%</text>',
+    ]
+
+    # Horizontal grid + price axis on the right
+    tick = y_min
+    while tick <= y_max + step / 2:
+        ty = _num(y(tick))
+        out.append(f'<line x1="{left}" x2="{right}" y1="{ty}" y2="{ty}" stroke="{GRID_COLOR}"/>'
+                   f'<text x="{right + 6}" y="{ty}" dy="4" font-size="11" fill="{TEXT_COLOR}">'
+                   f'{_fmt_price(tick, step)}</text>')
+        tick += step
+
+    # Evenly spaced date labels
+    for k in range(X_LABELS):
+        i = round(k * (n - 1) / (X_LABELS - 1))
+        anchor = "start" if k == 0 else ("end" if k == X_LABELS - 1 else "middle")
+        out.append(f'<text x="{_num(x(i))}" y="{height - 10}" font-size="11" text-anchor="{anchor}" '
+                   f'fill="{TEXT_COLOR}">{escape(format_date(dates[i], lang))}</text>')
+
+    if area:
+        out.append(f'<defs><linearGradient id="{fill_id}" x1="0" y1="0" x2="0" y2="1">'
+                   f'<stop offset="0" stop-color="{LINE_COLOR}" stop-opacity="0.35"/>'
+                   f'<stop offset="1" stop-color="{LINE_COLOR}" stop-opacity="0"/></linearGradient></defs>'
+                   f'<polygon points="{_num(left)},{_num(bottom)} {points} {_num(right)},{_num(bottom)}" '
+                   f'fill="url(#{fill_id})"/>')
+    out.append(f'<polyline points="{points}" fill="none" stroke="{LINE_COLOR}" stroke-width="2.5" '
+               f'stroke-linejoin="round" stroke-linecap="round"/>')
+    out.append(f'<circle cx="{_num(x(n - 1))}" cy="{_num(y(prices[-1]))}" r="4" fill="{trend}"/>')
+    out.append("</svg>")
+    return "".join(out)
@@ -0,0 +1,81 @@
+"""
+Chunked streaming universe scan for S&P 500 / Russell-scale ticker pools.
+
+    python execution/auto_poster.py --universe universe.txt
+
+The symbol file is plain text, one ticker per line ('#' starts a comment;
+'BRK.B' style symbols are converted to Yahoo's 'BRK-B'). Symbols are
+downloaded in fixed-size chunks, each chunk is scored as it arrives with the
+vectorized scorer (fixed reference scales, so chunks are comparable) and only
+a bounded top-K min-heap survives between chunks. Memory therefore stays
+constant whether the universe holds 500 or 3,000+ symbols.
+"""
+import heapq
+
+import pandas as pd
+
+from yf_cache import download
+from volatility_scorer import score_panel, SCALES
+
+CHUNK_SIZE = 200
+TOP_K = 10
+SCAN_PERIOD = "2mo"    # enough bars for the 20-session volume base and 14-day ATR
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+
+def load_universe(path):
+    """Read a symbol list file into an ordered, de-duplicated list."""
+    symbols = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            symbol = line.split("#", 1)[0].strip().upper().replace(".", "-")
+            if symbol:
+                symbols.append(symbol)
+    return list(dict.fromkeys(symbols))
+
+
+def iter_chunks(symbols, size=CHUNK_SIZE):
+    for i in range(0, len(symbols), size):
+        yield symbols[i:i + size]
+
+
+def _chunk_panel(frame, chunk):
+    """{field: dates x tickers} panel from a yf.download result."""
+    panel = {}
+    for field in FIELDS:
+        if field not in frame.columns.get_level_values(0):
+            continue
+        data = frame[field]
+        if isinstance(data, pd.Series):          # single-ticker, flat columns
+            data = data.to_frame(chunk[0])
+        panel[field] = data
+    return panel
+
+
+def scan_universe(symbols, top_k=TOP_K, chunk_size=CHUNK_SIZE):
+    """Return the top_k scored rows (dicts, best first) across all chunks."""
+    heap = []   # (score, ticker, row) — the root is the weakest survivor
+    scanned = 0
+    for n, chunk in enumerate(iter_chunks(symbols, chunk_size), 1):
+        try:
+            frame = download(chunk, period=SCAN_PERIOD, interval="1d",
+                             auto_adjust=False, progress=False)
+        except Exception as e:
+            print(f"  [warn] Chunk {n} download failed: {e}")
+            continue
+        if frame is None or frame.empty:
+            continue
+
+        ranked = score_panel(_chunk_panel(frame, chunk), scales=SCALES)
+        scanned += len(ranked)
+        for ticker, row in ranked.iterrows():
+            item = (float(row["score"]), ticker, row.to_dict())
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item[0] > heap[0][0]:
+                heapq.heapreplace(heap, item)
+        del frame, ranked
+        print(f"  [universe] chunk {n}: {scanned}/{len(symbols)} scored, "
+              f"cut-off score {heap[0][0]:.2f}" if heap else f"  [universe] chunk {n}: nothing scored")
+
+    return [dict(row, ticker=ticker) for score, ticker, row in sorted(heap, reverse=True)]
@@ -1,14 +1,8 @@
 
 import json, os, re
 
-def update_blog_html_static(lang, posts_path, blog_html_path, blog_url_prefix):
-    """posts.json을 읽어 blog.html의 #blogGrid를 정적 HTML로 업데이트하고 헤더를 수정함"""
-    if not os.path.exists(posts_path):
-        print(f"  [skip] {posts_path} not found")
-        return
-    with open(posts_path, "r", encoding="utf-8") as f:
-        posts = json.load(f)
-    
+def render_blog_html(posts, html, blog_html_path, blog_url_prefix):
+    """posts 목록으로 blog.html 내용을 다시 그려 (new_html, daily_count) 반환 — 파일은 쓰지 않음"""
     # Filter only daily analysis posts (those with YYYY-MM-DD in the link)
     # Academy posts like 'blog/dividend-trap-guide.html' will be skipped
     daily_posts = []
@@ -37,13 +31,6 @@ def update_blog_html_static(lang, posts_path, blog_html_path, blog_url_prefix):
     
     static_html = "\n".join(items)
     
-    if not os.path.exists(blog_html_path):
-        print(f"  [skip] {blog_html_path} not found")
-        return
-        
-    with open(blog_html_path, "r", encoding="utf-8") as f:
-        html = f.read()
-    
     # 1. Update Hero/Header Text
     header_map = {
         "ko": {
@@ -93,10 +80,27 @@ def update_blog_html_static(lang, posts_path, blog_html_path, blog_url_prefix):
         '<!-- Static HTML blog list - no JS needed -->',
         new_html, flags=re.DOTALL
     )
-    
+    return new_html, len(daily_posts)
+
+
+def update_blog_html_static(lang, posts_path, blog_html_path, blog_url_prefix):
+    """posts.json을 읽어 blog.html의 #blogGrid를 정적 HTML로 업데이트하고 헤더를 수정함"""
+    if not os.path.exists(posts_path):
+        print(f"  [skip] {posts_path} not found")
+        return
+    with open(posts_path, "r", encoding="utf-8") as f:
+        posts = json.load(f)
+    if not os.path.exists(blog_html_path):
+        print(f"  [skip] {blog_html_path} not found")
+        return
+    with open(blog_html_path, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    new_html, count = render_blog_html(posts, html, blog_html_path, blog_url_prefix)
     with open(blog_html_path, "w", encoding="utf-8") as f:
         f.write(new_html)
-    print(f"  [static] {blog_html_path}: {len(daily_posts)} posts rendered (Academy posts filtered)")
+    print(f"  [static] {blog_html_path}: {count} posts rendered (Academy posts filtered)")
+
 
 if __name__ == "__main__":
     configs = [
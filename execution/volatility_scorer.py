@@ -0,0 +1,124 @@
+"""
+Vectorized multi-horizon volatility scoring for the Volatility Hunter.
+
+score_panel() takes the {field: dates x tickers} OHLCV panel and computes every
+signal for every ticker in one pass of NumPy array math — no per-ticker Python
+loop — so scoring time stays flat from 56 tickers to thousands:
+
+    change     1-day close-to-close change (%)
+    rv_5d      5-day realized volatility of log returns (annualized, %)
+    atr_pct    14-day Average True Range as % of the last close
+    gap        overnight gap: today's open vs yesterday's close (%)
+    volume_z   z-score of today's volume against the prior 20 sessions
+
+Each signal's magnitude is converted to a cross-sectional percentile rank and
+blended with WEIGHTS into `score`; the result is a table ranked by score.
+Pass scales=SCALES instead to normalize against fixed reference magnitudes —
+scores then do not depend on which other tickers share the panel, which is
+what chunked universe scans need to compare chunks.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+WEIGHTS = {
+    "change":   0.35,
+    "rv_5d":    0.20,
+    "atr_pct":  0.15,
+    "gap":      0.15,
+    "volume_z": 0.15,
+}
+# Typical magnitude of each signal for a large-cap on a normal day; a value
+# equal to its scale contributes 1.0 (capped at SCALE_CAP) before weighting.
+SCALES = {
+    "change":   2.0,
+    "rv_5d":    30.0,
+    "atr_pct":  2.5,
+    "gap":      1.0,
+    "volume_z": 1.0,
+}
+SCALE_CAP = 5.0
+LOOKBACK = 21          # bars needed for the longest signal (20-day volume base + today)
+ATR_WINDOW = 14
+RV_WINDOW = 5
+TRADING_DAYS = 252
+
+
+def _align_latest(panel, lookback):
+    """Bottom-align each ticker's valid bars so row -1 is its latest session.
+
+    The outer-joined panel has NaN rows where calendars differ (crypto trades on
+    weekends, stocks do not). A stable argsort on the validity mask moves every
+    column's NaNs to the top without a Python loop.
+    """
+    close = panel["Close"]
+    values = close.to_numpy(dtype=np.float64)
+    order = np.argsort(~np.isnan(values), axis=0, kind="stable")
+    cols = np.arange(values.shape[1])
+    aligned = {}
+    for field in ("Open", "High", "Low", "Close", "Volume"):
+        frame = panel.get(field)
+        if frame is None:
+            arr = np.full_like(values, np.nan)
+        else:
+            arr = frame.reindex(index=close.index, columns=close.columns).to_numpy(dtype=np.float64)
+        aligned[field] = arr[order, cols][-lookback:]
+    return aligned
+
+
+def score_panel(panel, weights=WEIGHTS, lookback=LOOKBACK, scales=None):
+    """Return a DataFrame (index=ticker) of signals and score, best first.
+
+    Signals are ranked cross-sectionally unless `scales` is given, in which
+    case each magnitude is divided by its fixed scale (chunk-independent).
+    """
+    close_frame = panel.get("Close")
+    if close_frame is None or close_frame.empty:
+        return pd.DataFrame(columns=["price", "change", "abs_change", *WEIGHTS, "score"])
+
+    a = _align_latest(panel, lookback)
+    c, o, h, l, v = a["Close"], a["Open"], a["High"], a["Low"], a["Volume"]
+    prev_c = c[:-1]
+
+    # All-NaN columns (halted / new listings) are expected; they drop out below
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        change = (c[-1] / c[-2] - 1) * 100
+
+        log_ret = np.diff(np.log(c), axis=0)
+        rv_5d = np.nanstd(log_ret[-RV_WINDOW:], axis=0, ddof=1) * np.sqrt(TRADING_DAYS) * 100
+
+        true_range = np.nanmax(np.stack([h[1:] - l[1:],
+                                         np.abs(h[1:] - prev_c),
+                                         np.abs(l[1:] - prev_c)]), axis=0)
+        atr_pct = np.nanmean(true_range[-ATR_WINDOW:], axis=0) / c[-1] * 100
+
+        gap = (o[-1] / c[-2] - 1) * 100
+
+        base = v[:-1]
+        volume_z = (v[-1] - np.nanmean(base, axis=0)) / np.nanstd(base, axis=0)
+
+    signals = pd.DataFrame({
+        "price":    c[-1],
+        "change":   change,
+        "rv_5d":    rv_5d,
+        "atr_pct":  atr_pct,
+        "gap":      gap,
+        "volume_z": volume_z,
+    }, index=close_frame.columns)
+    signals = signals[np.isfinite(signals["price"]) & np.isfinite(signals["change"])]
+    signals["abs_change"] = signals["change"].abs()
+
+    # Magnitude matters, not direction — except volume, where only surges count
+    magnitudes = signals[list(weights)].abs()
+    if "volume_z" in magnitudes:
+        magnitudes["volume_z"] = signals["volume_z"].clip(lower=0)
+    if scales is None:
+        normalized = magnitudes.rank(pct=True)
+    else:
+        normalized = (magnitudes / pd.Series(scales)[magnitudes.columns]).clip(upper=SCALE_CAP)
+    normalized = normalized.fillna(0)
+    signals["score"] = normalized.to_numpy() @ np.array([weights[k] for k in normalized.columns])
+
+    return signals.sort_values("score", ascending=False)
@@ -0,0 +1,148 @@
+"""
+Shared SQLite-backed response cache for every yfinance call in the pipeline.
+
+Usage:
+    from yf_cache import download, cached
+    frame = download(tickers, period="5d")
+    info  = cached("fundamentals", ticker, lambda: yf.Ticker(ticker).info)
+
+yfinance >= 0.2.54 insists on its own curl_cffi session and rejects
+requests-cache sessions, so responses are cached one level up: the parsed
+yfinance result (DataFrame / dict) is pickled into .tmp/yf_cache.sqlite.
+Each endpoint class gets its own TTL so that reruns after a failure and
+back-to-back workflows read from disk instead of hitting Yahoo again:
+    - quotes / short price history : minutes
+    - fundamentals (.info)          : 1 day
+    - dividend / full history       : 1 week
+Cache misses pass through a shared token bucket before reaching Yahoo, so
+concurrent fetchers can share it without tripping 429s; hits cost nothing.
+Hit/miss counts are printed once at the end of the run.
+"""
+import os
+import time
+import pickle
+import atexit
+import sqlite3
+import datetime
+import threading
+from collections import Counter
+
+import yfinance as yf
+import cassette
+from rate_limit import TokenBucket
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CACHE_PATH = os.path.join(BASE_DIR, ".tmp", "yf_cache.sqlite")
+
+TTLS = {
+    "quotes":       datetime.timedelta(minutes=15),
+    "fundamentals": datetime.timedelta(days=1),
+    "dividends":    datetime.timedelta(days=7),
+}
+# Periods at or above this length are "history" and share the dividend TTL
+LONG_PERIODS = {"1y", "2y", "5y", "10y", "ytd", "max"}
+
+# Token bucket for requests that actually reach Yahoo
+RATE_PER_SECOND = 4
+BURST = 8
+
+_stats = {"hits": Counter(), "misses": Counter()}
+_lock = threading.Lock()
+_initialized = False
+
+
+limiter = TokenBucket(RATE_PER_SECOND, BURST)
+
+
+def _connect():
+    """Open a connection (one per call, so worker threads never share one)."""
+    global _initialized
+    with _lock:
+        if not _initialized:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            conn = sqlite3.connect(CACHE_PATH, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS responses ("
+                         "key TEXT PRIMARY KEY, endpoint TEXT, expires REAL, value BLOB)")
+            conn.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+            conn.commit()
+            conn.close()
+            _initialized = True
+    return sqlite3.connect(CACHE_PATH, timeout=30)
+
+
+def _is_empty(value):
+    if value is None:
+        return True
+    empty = getattr(value, "empty", None)
+    if isinstance(empty, bool):
+        return empty
+    return isinstance(value, (dict, list)) and not value
+
+
+def _limited(fetch):
+    limiter.acquire()
+    return fetch()
+
+
+def cached(endpoint, key, fetch, store=True):
+    """Return fetch() for (endpoint, key), served from disk while fresh.
+
+    Empty results (failed downloads, throttled .info) are never stored, and
+    store=False bypasses the disk entirely (still rate-limited and counted).
+    """
+    cache_key = f"{endpoint}:{key}"
+    if cassette.active() or not store:
+        # Under a cassette the run must be hermetic: record/replay every call
+        with _lock:
+            _stats["misses"][endpoint] += 1
+        return cassette.call("yfinance", cache_key, lambda: _limited(fetch))
+
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT value FROM responses WHERE key = ? AND expires >= ?",
+                           (cache_key, time.time())).fetchone()
+        if row is not None:
+            try:
+                value = pickle.loads(row[0])
+                with _lock:
+                    _stats["hits"][endpoint] += 1
+                return value
+            except Exception:
+                pass  # unreadable entry (e.g. library upgrade) — refetch
+
+        with _lock:
+            _stats["misses"][endpoint] += 1
+        value = _limited(fetch)
+        if not _is_empty(value):
+            expires = time.time() + TTLS[endpoint].total_seconds()
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                         (cache_key, endpoint, expires, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+            conn.commit()
+        return value
+    finally:
+        conn.close()
+
+
+def download(tickers, store=True, **kwargs):
+    """Cached yf.download(); the endpoint class follows the requested period."""
+    tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+    endpoint = "dividends" if kwargs.get("period") in LONG_PERIODS else "quotes"
+    key = repr((sorted(tickers), sorted(kwargs.items())))
+    return cached(endpoint, key, lambda: yf.download(tickers, **kwargs), store=store)
+
+
+def report_cache_stats():
+    """Print per-endpoint-class cache hits and misses for this run."""
+    with _lock:
+        hits, misses = dict(_stats["hits"]), dict(_stats["misses"])
+    total_hits, total_misses = sum(hits.values()), sum(misses.values())
+    if total_hits + total_misses == 0:
+        return
+    print(f"[cache] yfinance cache: {total_hits} hits / {total_misses} misses ({CACHE_PATH})")
+    for name in sorted(set(hits) | set(misses)):
+        print(f"  [cache] {name:<13} hits={hits.get(name, 0):<4} misses={misses.get(name, 0)}")
+
+
+# 캐시 연결 없이 끝나는 실행(cassette 재생, store=False)에서도 통계를 출력하도록 import 시점에 등록
+atexit.register(report_cache_stats)
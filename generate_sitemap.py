@@ -33,7 +33,8 @@ def get_last_mod(file_path):
 # Register namespaces to use proper prefixes
 ET.register_namespace('xhtml', 'http://www.w3.org/1999/xhtml')
 
-def generate_sitemap():
+def build_sitemap():
+    """sitemap.xml contents for the current tree (run from the repo root)."""
     urlset = ET.Element("urlset")
     urlset.set("xmlns", "http://www.sitemaps.org/schemas/sitemap/0.9")
 
@@ -176,9 +177,11 @@ def generate_sitemap():
     # Ensure standard XML declaration
     if pretty_xml.startswith('<?xml version="1.0" ?>'):
         pretty_xml = pretty_xml.replace('<?xml version="1.0" ?>', '<?xml version="1.0" encoding="UTF-8"?>', 1)
+    return pretty_xml
 
+def generate_sitemap():
     with open("sitemap.xml", "w", encoding='utf-8') as f:
-        f.write(pretty_xml)
+        f.write(build_sitemap())
     
     print("sitemap.xml has been updated.")
 
@@ -133,28 +133,66 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     };
 
-    // 4. 블로그 데이터 로드
+    // 4. 블로그 데이터 로드 (posts/page-N.json — 첫 페이지만 먼저, 나머지는 "더 보기" 시)
+    // 이 파일은 en/ko/pt 계산기 페이지가 함께 쓰므로 문구는 <html lang>으로 선택
+    const LABELS = {
+        en: { more: 'Load more', empty: 'No posts have been published yet.' },
+        ko: { more: '더 보기', empty: '아직 게시된 포스트가 없습니다.' },
+        pt: { more: 'Carregar mais', empty: 'Ainda não há publicações.' },
+    };
+    const labels = LABELS[document.documentElement.lang] || LABELS.en;
+
+    const renderPosts = (posts) => {
+        posts.forEach(post => {
+            const card = document.createElement('div');
+            card.className = 'blog-card';
+            card.innerHTML = `
+                <span class="blog-date">${post.date}</span>
+                <h3>${post.title}</h3>
+                <p>${post.summary}</p>
+            `;
+            card.onclick = () => window.location.href = post.link;
+            blogGrid.appendChild(card);
+        });
+    };
+
+    const fetchPage = async (page) => {
+        const response = await fetch(`posts/${page.file}?v=${page.hash}`);
+        if (!response.ok) throw new Error(`Missing ${page.file}`);
+        return response.json();
+    };
+
     const loadBlogPosts = async () => {
+        if (!blogGrid) return;
         try {
-            const response = await fetch('posts.json');
+            const response = await fetch('posts/manifest.json');
             if (!response.ok) throw new Error('No posts found');
-            const posts = await response.json();
+            const manifest = await response.json();
+            // manifest.pages는 최신순: page-1 다음에 가장 최근에 봉인된 페이지
+            const queue = manifest.pages.slice();
 
             blogGrid.innerHTML = '';
-            posts.forEach(post => {
-                const card = document.createElement('div');
-                card.className = 'blog-card';
-                card.innerHTML = `
-                    <span class="blog-date">${post.date}</span>
-                    <h3>${post.title}</h3>
-                    <p>${post.summary}</p>
-                `;
-                card.onclick = () => window.location.href = post.link;
-                blogGrid.appendChild(card);
-            });
+            renderPosts(await fetchPage(queue.shift()));
+
+            if (queue.length) {
+                const moreBtn = document.createElement('button');
+                moreBtn.className = 'btn-calculate';
+                moreBtn.textContent = labels.more;
+                moreBtn.onclick = async () => {
+                    moreBtn.disabled = true;
+                    try {
+                        renderPosts(await fetchPage(queue.shift()));
+                    } catch (error) {
+                        console.log('Blog page loading failed:', error);
+                    }
+                    moreBtn.disabled = false;
+                    if (!queue.length) moreBtn.remove();
+                };
+                blogGrid.after(moreBtn);
+            }
         } catch (error) {
             console.log('Blog loading failed:', error);
-            blogGrid.innerHTML = '<p style="color: var(--text-secondary)">아직 게시된 포스트가 없습니다.</p>';
+            blogGrid.innerHTML = `<p style="color: var(--text-secondary)">${labels.empty}</p>`;
         }
     };
 
@@ -0,0 +1,54 @@
+// dividend_insights.min.json 디코더 (컬럼형: 필드당 배열 하나, sector/grade는 사전 인코딩)
+// DividendInsights.load(url) → table
+//   table.n                  종목 수
+//   table.col('dividend_yield')  Float64Array / Int32Array / Uint8Array(사전 코드) / Array(문자열)
+//   table.code('grade', 'S등급')  사전 값 → 코드 (없으면 -1)
+//   table.filter(i => ...)   조건을 만족하는 행 번호 배열
+//   table.row(i), table.rows()  기존 dividend_insights.json과 같은 모양의 객체
+(() => {
+    const TYPED = { f64: Float64Array, i32: Int32Array, u8: Uint8Array };
+
+    const decode = (data) => {
+        const columns = {};
+        data.fields.forEach((field, k) => {
+            const values = data.cols[k];
+            columns[field.name] = TYPED[field.type] ? TYPED[field.type].from(values) : values;
+        });
+        const types = Object.fromEntries(data.fields.map(f => [f.name, f.type]));
+        const cache = new Array(data.n);
+
+        const table = {
+            n: data.n,
+            generatedAt: data.generated_at,
+            dict: data.dict,
+            col: (name) => columns[name],
+            code: (name, value) => data.dict[name].indexOf(value),
+            filter: (predicate) => {
+                const out = [];
+                for (let i = 0; i < data.n; i++) if (predicate(i)) out.push(i);
+                return out;
+            },
+            row: (i) => {
+                if (!cache[i]) {
+                    const stock = { last_updated: data.generated_at };
+                    for (const name in columns) {
+                        const v = columns[name][i];
+                        stock[name] = types[name] === 'u8' ? data.dict[name][v] : v;
+                    }
+                    cache[i] = stock;
+                }
+                return cache[i];
+            },
+            rows: () => Array.from({ length: data.n }, (_, i) => table.row(i)),
+        };
+        return table;
+    };
+
+    window.DividendInsights = {
+        decode,
+        load: (url) => fetch(url).then(r => {
+            if (!r.ok) throw new Error(`Failed to load ${url}`);
+            return r.json();
+        }).then(decode),
+    };
+})();
@@ -0,0 +1,44 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "execution"))
+
+import cassette
+import post_catalog
+import auto_poster
+
+
+class RecordReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.addCleanup(cassette.reset)
+        self.db_path = post_catalog.DB_PATH
+        post_catalog.DB_PATH = os.path.join(self.tmp, "posts.sqlite")
+        self.addCleanup(setattr, post_catalog, "DB_PATH", self.db_path)
+        self.cassette_path = os.path.join(self.tmp, "run.cas")
+
+    def test_replay_after_recording_in_the_same_tree(self):
+        cassette.configure(record=self.cassette_path)
+        recorded = auto_poster.get_recently_posted_tickers()
+        today = cassette.now().strftime("%Y-%m-%d")
+        # 녹화 실행이 글을 발행한 것처럼 카탈로그에 추가 — 재생 시에는 쿨다운 대상이 됨
+        ticker = next(t for t in auto_poster.TICKERS if t not in recorded)
+        with post_catalog.connect() as db:
+            post_catalog.add(db, "en", f"blog/{today}-{ticker}.html", ticker, today)
+        cassette.save()
+        cassette.reset()
+
+        with post_catalog.connect() as db:
+            self.assertIn(ticker, post_catalog.recent_tickers(db, today))
+
+        cassette.configure(replay=self.cassette_path)
+        self.assertEqual(cassette.now().strftime("%Y-%m-%d"), today)
+        self.assertEqual(auto_poster.get_recently_posted_tickers(), recorded)
+
+
+if __name__ == "__main__":
+    unittest.main()
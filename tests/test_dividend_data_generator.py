@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "execution"))
+
+import dividend_data_generator as ddg
+
+
+def stock(ticker, sector, grade="A등급", dividend_yield=3.5):
+    return {"ticker": ticker, "sector": sector, "dividend_yield": dividend_yield,
+            "grade": grade, "last_updated": "2026-10-18 00:00:00"}
+
+
+class ColumnarTest(unittest.TestCase):
+    def test_missing_sector_is_encoded_as_empty_string(self):
+        output = {"generated_at": "2026-10-18 00:00:00",
+                  "stocks": [stock("KO", "Consumer Defensive"), stock("BTC-USD", None, grade=None),
+                             stock("XOM", "Energy")]}
+        data = ddg.to_columnar(output)
+        names = [f["name"] for f in data["fields"]]
+        self.assertNotIn("last_updated", names)
+        self.assertEqual(data["dict"]["sector"], ["", "Consumer Defensive", "Energy"])
+        self.assertEqual(data["cols"][names.index("sector")], [1, 0, 2])
+        self.assertEqual(data["dict"]["grade"], ["", "A등급"])
+        self.assertEqual(data["cols"][names.index("grade")], [1, 0, 1])
+
+    def test_types(self):
+        data = ddg.to_columnar({"generated_at": "x", "stocks": [stock("KO", "Energy")]})
+        types = {f["name"]: f["type"] for f in data["fields"]}
+        self.assertEqual(types, {"ticker": "str", "sector": "u8", "dividend_yield": "f64", "grade": "u8"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "execution"))
+
+import html_transforms as ht
+
+
+def read(rel_path):
+    with open(os.path.join(ht.BASE_DIR, rel_path), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class DefaultPassTest(unittest.TestCase):
+    def test_default_transforms_leave_checked_in_pages_unchanged(self):
+        totals = ht.run(dry_run=True, workers=1)
+        self.assertTrue(totals)
+        changed = {name: t["changed"] for name, t in totals.items() if t["changed"] or t["errors"]}
+        self.assertEqual(changed, {})
+
+    def test_opt_in_transforms_are_not_defaults(self):
+        for name in ("adsense", "og-title", "og-description", "meta-lengths", "seo-tags"):
+            self.assertFalse(ht.TRANSFORMS[name].default, name)
+
+
+class TransformTest(unittest.TestCase):
+    def test_academy_card_recognises_existing_absolute_links(self):
+        for rel_path in ("index.html", "ko/index.html", "pt/index.html"):
+            html = read(rel_path)
+            self.assertEqual(ht.academy_card(html, ht.Page(rel_path)), html, rel_path)
+
+    def test_academy_card_added_once(self):
+        html = '<div class="nav-grid">\n</div>'
+        once = ht.academy_card(html, ht.Page("ko/index.html"))
+        self.assertEqual(once.count('class="nav-card"'), 1)
+        self.assertEqual(ht.academy_card(once, ht.Page("ko/index.html")), once)
+
+    def test_seo_tags_keep_correct_pages(self):
+        for rel_path in ("index.html", "ko/list.html", "pt/calendar.html"):
+            html = read(rel_path)
+            self.assertEqual(ht.inject_seo_tags(html, ht.Page(rel_path)), html, rel_path)
+
+    def test_seo_tags_use_extensionless_per_language_urls(self):
+        html = "<head>\n  <title>x</title>\n</head>"
+        out = ht.inject_seo_tags(html, ht.Page("ko/list.html"))
+        self.assertIn('<link rel="canonical" href="https://wiseaiwiseu.com/ko/list" />', out)
+        self.assertIn('hreflang="x-default" href="https://wiseaiwiseu.com/list" />', out)
+        self.assertNotIn(".html", out)
+        index = ht.inject_seo_tags(html, ht.Page("index.html"))
+        self.assertIn('<link rel="canonical" href="https://wiseaiwiseu.com/" />', index)
+        self.assertEqual(ht.inject_seo_tags(out, ht.Page("ko/list.html")), out)
+
+
+if __name__ == "__main__":
+    unittest.main()
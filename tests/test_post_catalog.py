@@ -0,0 +1,38 @@
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "execution"))
+
+import post_catalog
+
+
+class CatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, "posts.sqlite")
+
+    def test_connection_is_closed_after_the_block(self):
+        with post_catalog.connect(self.path) as db:
+            post_catalog.add(db, "ko", "blog/2099-01-01-AAPL.html", "t", "2099-01-01")
+        with self.assertRaises(sqlite3.ProgrammingError):
+            db.execute("SELECT 1")
+        with post_catalog.connect(self.path) as db:
+            self.assertEqual(post_catalog.recent_tickers(db, "2099-01-01"), {"AAPL"})
+
+    def test_rebuild_from_pages_matches_committed_posts_json(self):
+        with post_catalog.connect(self.path) as db:
+            for lang, paths in post_catalog.LANGS.items():
+                with open(os.path.join(post_catalog.BASE_DIR, paths["json"]), "r", encoding="utf-8") as f:
+                    committed = json.load(f)
+                self.assertEqual(post_catalog.latest(db, lang, len(committed)), committed, lang)
+            self.assertEqual(len(post_catalog.latest(db, "ko", 150)), 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
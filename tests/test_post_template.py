@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "execution"))
+
+import post_template
+
+
+class CompileTemplateTest(unittest.TestCase):
+    def test_substitutes_every_placeholder(self):
+        render = post_template.compile_template("<a href=\"{{ link }}\">{{title}}</a> {{ link }}")
+        self.assertEqual(render.names, ["link", "title"])
+        self.assertEqual(render({"link": "/x", "title": 7}), '<a href="/x">7</a> /x')
+
+    def test_literal_only_templates(self):
+        self.assertEqual(post_template.compile_template("body { color: red; }")({}), "body { color: red; }")
+        self.assertEqual(post_template.compile_template("")({}), "")
+
+    def test_missing_value_is_reported(self):
+        with self.assertRaises(KeyError):
+            post_template.render("post.html")
+
+
+class StylesheetTest(unittest.TestCase):
+    def test_committed_fingerprint_is_generated_from_post_css(self):
+        rel_path, data = post_template.fingerprinted_stylesheet()
+        self.assertEqual("/" + rel_path, post_template.stylesheet_href())
+        with open(os.path.join(post_template.BASE_DIR, rel_path), "rb") as f:
+            self.assertEqual(f.read(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
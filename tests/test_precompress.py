@@ -0,0 +1,58 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "execution"))
+
+import precompress
+
+
+class WithoutBrotliTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        for name, value in (("BASE_DIR", self.tmp), ("MANIFEST_PATH", os.path.join(self.tmp, ".tmp", "m.json")),
+                            ("brotli", None)):
+            patcher = mock.patch.object(precompress, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.page = os.path.join(self.tmp, "index.html")
+        self.write("<p>hello</p>" * 100)
+
+    def write(self, text):
+        with open(self.page, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def run_quietly(self):
+        with mock.patch("builtins.print") as printed:
+            totals = precompress.precompress()
+        return totals, [c.args[0] for c in printed.call_args_list]
+
+    def test_unchanged_sources_are_up_to_date(self):
+        self.run_quietly()
+        totals, lines = self.run_quietly()
+        self.assertIn("[*] 0/1 file(s) recompressed", lines)
+        self.assertEqual(set(totals[".html"]), {"files", "bytes", ".gz"})
+        self.assertFalse(os.path.exists(self.page + ".br"))
+
+    def test_changed_source_drops_stale_brotli_sibling(self):
+        self.run_quietly()
+        with open(self.page + ".br", "wb") as f:
+            f.write(b"stale")
+        self.run_quietly()
+        self.assertTrue(os.path.exists(self.page + ".br"))
+        self.write("<p>changed</p>" * 100)
+        self.run_quietly()
+        self.assertFalse(os.path.exists(self.page + ".br"))
+        self.assertTrue(os.path.exists(self.page + ".gz"))
+
+    def test_report_handles_empty_classes(self):
+        with mock.patch("builtins.print"):
+            precompress.report({".json": {"files": 1, "bytes": 0, ".gz": 0}})
+
+
+if __name__ == "__main__":
+    unittest.main()